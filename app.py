@@ -1,6 +1,8 @@
 import streamlit as st
 import re
 
+from compliance.metrics import METRICS
+
 # ==================================================
 # PAGE CONFIG (SAFE)
 # ==================================================
@@ -10,6 +12,9 @@ st.set_page_config(
     layout="wide"
 )
 
+# Stage timings for this rerun (no-op unless metrics are enabled)
+lap = METRICS.laps("render")
+
 # ==================================================
 # STYLING + ANIMATION (SAFE HTML ONLY)
 # ==================================================
@@ -43,36 +48,11 @@ body { background-color:#0b1220; }
 .ok {background:#14532d;padding:16px;border-radius:12px;color:white}
 .warn {background:#78350f;padding:16px;border-radius:12px;color:white}
 .bad {background:#7f1d1d;padding:16px;border-radius:12px;color:white}
+.listing {background:#111827;padding:14px;border-radius:12px;color:white;white-space:pre-wrap}
+.listing mark {background:#facc15;color:#111827;padding:0 2px;border-radius:4px}
 </style>
 """, unsafe_allow_html=True)
-
-# ==================================================
-# DATA
-# ==================================================
-APPROVED_BRANDS = {
-    "havells","philips","bajaj","usha","orient","crompton","godrej","lg","samsung",
-    "sony","panasonic","bosch","whirlpool","voltas","blue star","ifb","onida",
-    "haier","hitachi","mi","xiaomi","asus","hp","dell","lenovo","acer",
-    "boat","noise","jbl","realme","oppo","vivo","oneplus",
-    "kent","aquaguard","livpure","v-guard","luminous",
-    "prestige","pigeon","cello","milton","tata","wipro"
-}
-
-    # DEMO VERIFIED MODELS (FOR AWARENESS PURPOSES)
-APPROVED_MODELS = {
-    "samsung": {"ep-ta800", "ep-ta200","s24","m35"},
-    "philips": {"gc1905", "hl7756"},
-    "lg": {"43lm5600", "32lm560b"},
-    "havells": {"andria75w", "stealthair"},
-}
-
-DISAPPROVED_BRANDS = {"quickcharge pro","powermax","supervolt","cheapmax"}
-
-# ==================================================
-# SESSION STATE
-# ==================================================
-if "page" not in st.session_state:
-    st.session_state.page = "home"
+lap("css")
 
 # ==================================================
 # HERO
@@ -87,760 +67,28 @@ st.markdown("""
 # ==================================================
 # NAVIGATION
 # ==================================================
-c1,c2,c3,c4,c5,c6 = st.columns(6)
-if c1.button("🏠 Home"): st.session_state.page="home"
-if c2.button("🔍 Product Safety"): st.session_state.page="safety"
-if c3.button("🏷️ Brand Check"): st.session_state.page="brand"
-if c4.button("🤖 Ask Assistant"): st.session_state.page="assistant"
-if c5.button("📢 Complaint"): st.session_state.page="complaint"
-if c6.button("📝 Feedback"): st.session_state.page="feedback"
-
-st.divider()
-
-# ==================================================
-# HOME
-# ==================================================
-if st.session_state.page == "home":
-    st.markdown("""
-    <div class="card">
-    ✔ Understand product safety claims<br>
-    ✔ Avoid fake BIS certification<br>
-    ✔ Check popular Indian brands<br>
-    ✔ Get AI guidance<br>
-    ✔ Reach official complaint channels
-    </div>
-    """, unsafe_allow_html=True)
-
-# ==================================================
-# PRODUCT SAFETY CHECK (FIXED)
-# ==================================================
-elif st.session_state.page == "safety":
-    st.header("🔍 Product Safety Evaluation")
-
-    st.caption(
-        "This system evaluates product safety claims using BIS-aligned rules. "
-        "It does NOT guess. It provides consumer awareness guidance."
-    )
-
-    text = st.text_area(
-        "Enter product description (label / box / online listing)",
-        placeholder="Example: BIS certified eco friendly waterproof charger for kids"
-    )
-
-    if st.button("Evaluate Product Safety"):
-        if not text.strip():
-            st.warning("Please enter product information to continue.")
-            st.stop()
-
-        t = text.lower()
-
-        # ==================================================
-        # MASTER KEYWORD LIBRARY (200+ SIGNALS)
-        # ==================================================
-        ELECTRICAL = [
-            "charger","adapter","power bank","extension","socket","plug","heater",
-            "iron","kettle","geyser","electric","electrical","voltage","current",
-            "wire","cable","switch","inverter","stabilizer","motor","compressor",
-            "ac","air conditioner","fan","refrigerator","washing machine"
-        ]
-
-        CHILD = [
-            "toy","kids","child","baby","infant","toddler","crib","rattle","teether",
-            "school","play","plastic toy","soft toy","educational toy"
-        ]
-
-        WATER = [
-            "waterproof","water resistant","ip rating","ipx","rain proof","submersible",
-            "washable","bathroom","kitchen sink","outdoor","splash proof"
-        ]
-
-        MATERIAL_RISK = [
-            "plastic","chemical","toxic","lead","mercury","cadmium","bpa","phthalate",
-            "paint","coating","color","ink","adhesive","rubber","foam"
-        ]
-
-        MARKETING_TERMS = [
-            "eco","green","environment friendly","organic","natural","safe material",
-            "non toxic","chemical free","100% safe","best quality","premium"
-        ]
-
-        EXTREME_CLAIMS = [
-            "explosion proof","shock proof","fire proof","unbreakable","lifetime safe",
-            "guaranteed safe","zero risk","accident free"
-        ]
-
-        BIS_TERMS = [
-            "bis","bis certified","bis approved","cm/l","licence","license","isi mark"
-        ]
-
-        # ==================================================
-        # INITIAL STATE
-        # ==================================================
-        category = "General Consumer Product"
-        safety_status = "🟡 Verification Required"
-        confidence = "Medium"
-        recommendation = "Verify product details before use"
-        style = "warn"
-
-        reasons = []
-        bis_refs = []
-
-        # ==================================================
-        # CATEGORY DETECTION
-        # ==================================================
-        if any(k in t for k in ELECTRICAL):
-            category = "Electrical / Electronic Product"
-            reasons.append(
-                "Electrical products pose shock, fire, and overheating risks if uncertified."
-            )
-            bis_refs.append("IS 13252 – Electrical & electronic safety")
-
-        if any(k in t for k in CHILD):
-            category = "Child / Toy Product"
-            reasons.append(
-                "Products used by children require strict mechanical and material safety."
-            )
-            bis_refs.append("IS 9873 – Safety of toys")
-
-        if any(k in t for k in WATER):
-            reasons.append(
-                "Water exposure increases electrical and corrosion risks."
-            )
-            bis_refs.append("IS 60529 – IP protection standards")
-
-        if any(k in t for k in MATERIAL_RISK):
-            reasons.append(
-                "Material safety matters due to toxicity and long-term health exposure."
-            )
-
-        # ==================================================
-        # CLAIM ANALYSIS
-        # ==================================================
-        if any(k in t for k in MARKETING_TERMS):
-            reasons.append(
-                "Marketing terms (eco-friendly, non-toxic) are not BIS certifications."
-            )
-
-        if any(k in t for k in EXTREME_CLAIMS):
-            safety_status = "🔴 High Risk"
-            confidence = "Low"
-            recommendation = "Avoid product until independently verified"
-            style = "bad"
-            reasons.append(
-                "Unrealistic or absolute safety claims are misleading and unsafe."
-            )
-
-        # ==================================================
-        # BIS CLAIM CHECK
-        # ==================================================
-        if any(k in t for k in BIS_TERMS):
-            reasons.append(
-                "BIS reference detected. Certification must be verified using CM/L license number."
-            )
-        else:
-            reasons.append(
-                "No BIS mark or license reference detected in product description."
-            )
-
-        # ==================================================
-        # FINAL SAFETY DETERMINATION
-        # ==================================================
-        if style != "bad" and not any(k in t for k in EXTREME_CLAIMS):
-            safety_status = "🟡 Conditional Use"
-            confidence = "Medium"
-            recommendation = (
-                "Product may be used only after verifying BIS certification "
-                "and manufacturer details."
-            )
-            style = "warn"
-
-        # ==================================================
-        # OUTPUT (PROFESSIONAL FORMAT)
-        # ==================================================
-        st.markdown(
-            f"""
-            <div class="{style}">
-            <h3>Product Safety Assessment</h3>
-
-            <b>Detected Category:</b> {category}<br><br>
-
-            <b>Safety Status:</b> {safety_status}<br>
-            <b>Confidence Level:</b> {confidence}<br><br>
-
-            <b>Professional Recommendation:</b><br>
-            {recommendation}
-            </div>
-            """,
-            unsafe_allow_html=True
-        )
-
-        # ==================================================
-        # EXPLAINABILITY (JUDGES LOVE THIS)
-        # ==================================================
-        with st.expander("🔎 How was this decision made?"):
-            for r in reasons:
-                st.write("•", r)
-
-            st.write(
-                "This system uses rule-based safety logic aligned with "
-                "BIS consumer protection principles. It does not guess."
-            )
-
-        # ==================================================
-        # BIS REFERENCES
-        # ==================================================
-        if bis_refs:
-            st.markdown("### 📜 Applicable BIS Safety Standards (Awareness)")
-            for ref in sorted(set(bis_refs)):
-                st.write("•", ref)
-
-        # ==================================================
-        # FINAL GUIDANCE
-        # ==================================================
-        if confidence == "Low":
-            st.error(
-                "Consumer Advisory: Avoid this product. Consider reporting misleading claims to BIS."
-            )
-        else:
-            st.info(
-                "Consumer Advisory: Always verify BIS mark, CM/L license number, "
-                "manufacturer name, and address before purchase."
-            )
-# ==================================================
-# BRAND CHECK
-# ==================================================
-# ==================================================
-# BRAND CHECK (ADVANCED – COMPLIANCE BASED, ERROR FIXED)
-# ==================================================
-elif st.session_state.page == "brand":
-    st.header("🏷️ Brand & Model Compliance Check")
-
-    brand = st.text_input("Enter Brand Name (example: Samsung, Havells, Philips)")
-    model = st.text_input("Enter Model Number (optional)")
-
-    product_type = st.selectbox(
-        "Select Product Type (optional)",
-        [
-            "Not sure",
-            "Electrical appliance",
-            "Electronic accessory (charger, adapter)",
-            "Child product / Toy",
-            "Kitchen appliance",
-            "Other"
-        ]
-    )
-
-    if st.button("Check Compliance"):
-        if not brand.strip():
-            st.warning("Please enter a brand name.")
-        else:
-            b = brand.lower().strip()
-
-            # ================= BRAND RECOGNITION =================
-            if b in APPROVED_BRANDS:
-                brand_status = "🟢 Widely recognized Indian brand"
-                brand_note = (
-                    "This brand is widely recognized in the Indian market and is known to "
-                    "manufacture BIS-certified products in multiple categories."
-                )
-                style = "ok"
-
-            elif b in DISAPPROVED_BRANDS:
-                brand_status = "🔴 Brand associated with misleading or unsafe claims"
-                brand_note = (
-                    "This brand has been reported for unsafe or misleading practices. "
-                    "Consumers are strongly advised to avoid such products."
-                )
-                style = "bad"
-
-            else:
-                brand_status = "🟡 Brand not found in common consumer registry"
-                brand_note = (
-                    "This brand may be new, imported, or less documented. "
-                    "Careful BIS verification is required before purchase."
-                )
-                style = "warn"
-
-            # ================= PRODUCT TYPE → BIS STANDARD =================
-            if product_type == "Electrical appliance":
-                bis_rule = "IS 13252 – Electrical safety standard"
-                risk_note = "Risk of electric shock, fire, or overheating if uncertified."
-
-            elif product_type == "Electronic accessory (charger, adapter)":
-                bis_rule = "IS 13252 – Safety of chargers and adapters"
-                risk_note = "Overheating and electrical hazard risk if uncertified."
-
-            elif product_type == "Child product / Toy":
-                bis_rule = "IS 9873 – Safety requirements for toys"
-                risk_note = "High safety risk due to child usage."
-
-            elif product_type == "Kitchen appliance":
-                bis_rule = "IS 302 – Safety of household electrical appliances"
-                risk_note = "Fire and electrical hazard if standards are not met."
-
-            else:
-                bis_rule = "Applicable BIS standard depends on exact product category"
-                risk_note = "Exact safety rule must be confirmed."
-
-            # ================= MODEL-LEVEL INSIGHT =================
-            if model.strip():
-                model_note = (
-                    f"The model you entered (<b>{model}</b>) must have its "
-                    "<b>own BIS CM/L license</b>.<br><br>"
-                    "Important points:<br>"
-                    "• BIS certification is issued per product model<br>"
-                    "• Brand reputation alone does not guarantee safety<br>"
-                    "• Always verify the BIS mark and license number printed on the product"
-                )
-            else:
-                model_note = (
-                    "No model number provided.<br><br>"
-                    "Why this matters:<br>"
-                    "• BIS certification cannot be confirmed without a model number<br>"
-                    "• Unsafe products often hide or omit model information"
-                )
-
-            # ================= FINAL COMPLIANCE VERDICT =================
-            if b in DISAPPROVED_BRANDS:
-                compliance_verdict = "❌ NON-COMPLIANT – HIGH CONSUMER RISK"
-                final_guidance = "Avoid purchasing this product."
-
-            elif b in APPROVED_BRANDS and model.strip():
-                compliance_verdict = "⚠️ BRAND VERIFIED – MODEL NOT VERIFIED"
-                final_guidance = (
-                    "You may consider this brand, but verify the model’s BIS license "
-                    "before purchase."
-                )
-
-            elif b in APPROVED_BRANDS:
-                compliance_verdict = "⚠️ BRAND VERIFIED – MODEL INFORMATION MISSING"
-                final_guidance = "Check the exact model number printed on the product."
-
-            else:
-                compliance_verdict = "⚠️ COMPLIANCE STATUS UNKNOWN"
-                final_guidance = "Proceed only after careful BIS verification."
-
-            # ================= DISPLAY RESULT (FIXED HTML RENDERING) =================
-            st.markdown(
-                f"""
-                <div class="{style}">
-                <h3>Compliance Assessment</h3>
-
-                <b>Compliance Verdict:</b> {compliance_verdict}<br><br>
-
-                <b>Brand Recognition:</b> {brand_status}<br><br>
-
-                <b>Brand Insight:</b><br>
-                {brand_note}<br><br>
-
-                <b>Detected Product Type:</b> {product_type}<br>
-                <b>Applicable BIS Safety Rule:</b> {bis_rule}<br>
-                <b>Consumer Risk:</b> {risk_note}<br><br>
-
-                <b>Model-Level Assessment:</b><br>
-                {model_note}<br><br>
-
-                <b>Final Consumer Guidance:</b><br>
-                {final_guidance}
-                </div>
-                """,
-                unsafe_allow_html=True  # ✅ THIS FIXES THE ISSUE
-            )
-
-            st.info(
-                "This assessment provides consumer awareness guidance only. "
-                "Final confirmation must be done using the official BIS license database."
-            )
-# ==================================================
-# ASSISTANT
-elif st.session_state.page == "assistant":
-    st.header("🤖 BIS Consumer Safety AI Assistant")
-
-    st.caption(
-        "Ask in your own words. This assistant understands normal human questions "
-        "and answers using BIS safety rules and consumer law awareness."
-    )
-
-    # -------------------------------
-    # INPUT
-    # -------------------------------
-    question = st.text_input(
-        "Ask anything (example: Is this charger safe? | Can I trust this brand? | BIS mark missing)"
-    )
-
-    if st.button("Ask AI"):
-        if not question or len(question.strip()) < 4:
-            st.info(
-                "Please ask a clear question.\n\n"
-                "Example:\n"
-                "• Is this Samsung charger BIS certified?\n"
-                "• What happens if BIS mark is missing?"
-            )
-            st.stop()
-
-        q = question.lower().strip()
-
-        # -------------------------------
-        # INTENT & SIGNAL EXTRACTION
-        # -------------------------------
-        signals = {
-            "brand": any(b in q for b in APPROVED_BRANDS),
-            "buy": any(w in q for w in ["buy", "purchase", "use", "safe"]),
-            "bis": any(w in q for w in ["bis", "certified", "certification"]),
-            "fake": any(w in q for w in ["fake", "duplicate", "copy"]),
-            "child": any(w in q for w in ["child", "baby", "kids", "toy"]),
-            "electrical": any(w in q for w in ["charger", "adapter", "wire", "plug", "electric"]),
-            "complaint": any(w in q for w in ["complaint", "report", "illegal"]),
-            "eco": any(w in q for w in ["eco", "green", "environment"]),
-            "cheap": any(w in q for w in ["cheap", "low price", "very cheap"]),
-        }
-
-        # -------------------------------
-        # THINKING ANIMATION (PRO FEEL)
-        # -------------------------------
-        with st.spinner("🧠 Analyzing BIS rules and safety logic..."):
-            pass
-
-        # -------------------------------
-        # RESPONSE ENGINE
-        # -------------------------------
-
-        # 1️⃣ Fake BIS mark (highest priority)
-        if signals["fake"]:
-            answer_style = "bad"
-            answer = """
-            **❌ High Risk Detected**
-
-            A fake or duplicate BIS mark means the product is **untested and illegal**.
-
-            **Why this is dangerous:**
-            • No safety testing  
-            • High risk of electric shock or fire  
-            • Violation of Indian consumer law  
-
-            **What you should do now:**
-            ❌ Do not buy or use the product  
-            📢 Report it immediately on the official BIS portal  
-
-            **Official complaint link:**  
-            https://consumerapp.bis.gov.in
-            """
-
-        # 2️⃣ Buying electrical products
-        elif signals["buy"] and signals["electrical"]:
-            answer_style = "warn"
-            answer = """
-            **⚠️ Electrical Safety Check Required**
-
-            Electrical products like chargers, adapters, and appliances
-            can cause **shock, overheating, or fire** if not certified.
-
-            **BIS Requirement:**
-            • IS 13252 (Electrical & electronic safety)
-
-            **Before buying, always verify:**
-            ✔ BIS standard mark  
-            ✔ CM/L license number  
-            ✔ Manufacturer name & address  
-
-            **Professional advice:**  
-            Buy only after BIS verification.
-            """
-
-        # 3️⃣ Brand trust confusion
-        elif signals["brand"] and signals["bis"]:
-            answer_style = "warn"
-            answer = """
-            **Important Clarification**
-
-            BIS certification is **NOT for the brand**.
-            It is issued for **each individual product model**.
-
-            **Example:**
-            • One Samsung product may be BIS certified  
-            • Another Samsung product may NOT be BIS certified  
-
-            **Correct verification method:**
-            ✔ Check BIS mark  
-            ✔ Match CM/L number with the product model  
-
-            **Conclusion:**  
-            Never trust brand name alone.
-            """
-
-        # 4️⃣ Child safety
-        elif signals["child"]:
-            answer_style = "warn"
-            answer = """
-            **⚠️ Child Safety Alert**
-
-            Products used by children must meet **strict BIS safety standards**.
-
-            **Relevant BIS Standard:**
-            • IS 9873 – Safety of toys & child products
-
-            **Important note:**
-            Terms like *child safe* or *kids friendly* are **not certifications**.
-
-            **Advice:**  
-            Allow children to use products only after BIS verification.
-            """
-
-        # 5️⃣ Eco-friendly confusion
-        elif signals["eco"]:
-            answer_style = "warn"
-            answer = """
-            **ℹ️ Eco-Friendly Claim Explained**
-
-            Terms like *eco-friendly* or *green* are **marketing claims**,
-            not BIS safety certifications.
-
-            **What BIS actually checks:**
-            • Electrical safety  
-            • Material safety  
-            • Mechanical safety  
-
-            **Advice:**  
-            Focus on BIS mark, not eco labels.
-            """
-
-        # 6️⃣ Cheap product warning
-        elif signals["cheap"]:
-            answer_style = "warn"
-            answer = """
-            **⚠️ Price-Based Risk Warning**
-
-            Extremely low-priced products often:
-            • Skip safety testing  
-            • Use poor-quality materials  
-            • Fake BIS markings  
-
-            **Advice:**  
-            Low price should never replace safety verification.
-            """
-
-        # 7️⃣ Complaint guidance
-        elif signals["complaint"]:
-            answer_style = "ok"
-            answer = """
-            **📢 Filing a BIS Complaint**
-
-            You should file a complaint if:
-            • BIS mark is missing or fake  
-            • Product overheats or sparks  
-            • Safety claims are misleading  
-
-            **Official BIS Consumer Portal:**  
-            https://consumerapp.bis.gov.in
-
-            Your complaint helps protect other consumers.
-            """
-
-        # 8️⃣ General BIS explanation
-        elif signals["bis"]:
-            answer_style = "ok"
-            answer = """
-            **What is BIS?**
-
-            BIS (Bureau of Indian Standards) is a Government of India body
-            that ensures **minimum safety and quality standards**.
-
-            **Why BIS matters:**
-            • Prevents unsafe products  
-            • Protects consumers  
-            • Reduces accidents  
-
-            **Always prefer BIS-certified products.**
-            """
-
-        # 9️⃣ Intelligent fallback (REAL AI BEHAVIOR)
-        else:
-            answer_style = "warn"
-            answer = """
-            **I need a bit more information to guide you accurately.**
-
-            Please include:
-            • Product type (charger, toy, appliance)  
-            • Brand name  
-            • Whether BIS mark is present  
-
-            **Example:**  
-            *Is this Philips charger BIS certified?*
-            """
-
-        # -------------------------------
-        # DISPLAY ANSWER (ANIMATED CARD)
-        # -------------------------------
-        st.markdown(
-            f"""
-            <div class="{answer_style}">
-            <h3>AI Safety Guidance</h3>
-            {answer}
-            </div>
-            """,
-            unsafe_allow_html=True
-        )
-
-        # -------------------------------
-        # SMART FOLLOW-UP PROMPTS
-        # -------------------------------
-        with st.expander("💡 You can also ask"):
-            st.write("• Is this product safe for children?")
-            st.write("• How do I identify a fake BIS mark?")
-            st.write("• What happens if BIS mark is missing?")
-            st.write("• Can I report unsafe products?")
-# ==================================================
-# COMPLAINT
-# ==================================================
-# ==================================================
-# COMPLAINT CENTRE (FINAL – OFFICIAL, ADVANCED, ERROR-FREE)
-# ==================================================
-elif st.session_state.page == "complaint":
-    st.header("📢 BIS Consumer Complaint Centre")
-
-    st.markdown(
-        """
-        <div class="card">
-
-        <h3>📌 When should you file a complaint?</h3>
-        <ul>
-            <li>Product shows a <b>fake, unclear, or missing BIS mark</b></li>
-            <li>Electrical product <b>overheats, sparks, shocks, or smells</b></li>
-            <li>Product makes <b>misleading claims</b> like “100% safe” or “explosion proof”</li>
-            <li>No <b>manufacturer name, address, or BIS license number</b></li>
-            <li>Product quality appears unsafe, cheap, or suspicious</li>
-        </ul>
-
-        <h3>⚖️ Why is filing a complaint important?</h3>
-        <p>
-        Filing a complaint helps the <b>Bureau of Indian Standards (BIS)</b> to:
-        </p>
-        <ul>
-            <li>Identify unsafe or illegal products</li>
-            <li>Take enforcement and legal action</li>
-            <li>Protect other consumers across India</li>
-            <li>Improve national product safety standards</li>
-        </ul>
-
-        <h3>🔗 Official BIS Consumer Complaint Portal</h3>
-        <p>
-        Click the button below to submit your complaint directly on the
-        <b>official BIS website</b>.
-        </p>
-
-        <div style="margin-top:18px;">
-            <a href="https://www.bis.gov.in/consumer-overview/consumer-overviews/online-complaint-registration/?lang=en"
-               target="_blank"
-               style="text-decoration:none;">
-                <button style="
-                    background: linear-gradient(135deg, #1e40af, #2563eb);
-                    color: white;
-                    padding: 14px 26px;
-                    border: none;
-                    border-radius: 14px;
-                    font-size: 16px;
-                    font-weight: 600;
-                    cursor: pointer;
-                ">
-                    🚨 Go to Official BIS Complaint Portal
-                </button>
-            </a>
-        </div>
-
-        <p style="margin-top:16px; opacity:0.85;">
-        This portal is managed by the <b>Bureau of Indian Standards (Government of India)</b>.
-        </p>
+# Each page lives in views/ and is only executed while it is open.
+pages = [
+    st.Page("views/home.py", title="Home", icon="🏠", default=True),
+    st.Page("views/safety.py", title="Product Safety", icon="🔍"),
+    st.Page("views/brand.py", title="Brand Check", icon="🏷️"),
+    st.Page("views/assistant.py", title="Ask Assistant", icon="🤖"),
+    st.Page("views/complaint.py", title="Complaint", icon="📢"),
+    st.Page("views/feedback.py", title="Feedback", icon="📝"),
+]
+# Hidden admin page: reachable only at /metrics, never linked.
+admin = st.Page("views/metrics.py", title="Runtime Metrics", icon="📈", url_path="metrics")
 
-        </div>
-        """,
-        unsafe_allow_html=True
-    )
+current = st.navigation([*pages, admin], position="hidden")
 
-    st.info(
-        "ℹ️ This platform does NOT collect complaints or personal data. "
-        "All complaints must be submitted only through the official BIS portal."
-    )
-# ==================================================
-# FEEDBACK
-# ==================================================
-elif st.session_state.page == "feedback":
-    st.header("📝 Consumer Experience & Feedback")
-
-    st.markdown(
-        """
-        <div class="card">
-        <h3>Your voice helps improve consumer safety 🇮🇳</h3>
-        <p>
-        This platform is built to spread <b>BIS safety awareness</b>.
-        Your feedback helps us understand:
-        </p>
-        <ul>
-            <li>✔ Was the information easy to understand?</li>
-            <li>✔ Did it help you make a safer decision?</li>
-            <li>✔ What can be improved for real consumers?</li>
-        </ul>
-        </div>
-        """,
-        unsafe_allow_html=True
-    )
-
-    col1, col2 = st.columns(2)
-
-    with col1:
-        name = st.text_input("Your Name (optional)")
-        user_type = st.selectbox(
-            "You are a:",
-            ["Consumer", "Student", "Teacher", "Engineer", "Retailer", "Other"]
-        )
+for col, page in zip(st.columns(len(pages)), pages):
+    col.page_link(page, label=f"{page.icon} {page.title}")
 
-    with col2:
-        usefulness = st.radio(
-            "How useful was this platform?",
-            ["Very Useful ⭐⭐⭐⭐⭐", "Useful ⭐⭐⭐⭐", "Average ⭐⭐⭐", "Needs Improvement ⭐⭐"]
-        )
-        clarity = st.radio(
-            "Was the information easy to understand?",
-            ["Yes, very clear", "Mostly clear", "Somewhat confusing"]
-        )
-
-    feedback = st.text_area(
-        "Share your suggestion or experience (optional)",
-        placeholder="Example: The product safety explanation helped me understand BIS rules clearly..."
-    )
-
-    improve_area = st.multiselect(
-        "Which areas should be improved?",
-        [
-            "Product Safety Check",
-            "Brand & Model Verification",
-            "AI Assistant Answers",
-            "Complaint Guidance",
-            "Design & Animations",
-            "Language Simplicity"
-        ]
-    )
-
-    if st.button("Submit Feedback"):
-        st.success("🙏 Thank you for helping improve consumer safety awareness!")
+st.divider()
+lap("hero_navigation")
 
-        st.markdown(
-            """
-            <div class="card">
-            <h4>What happens to your feedback?</h4>
-            <ul>
-                <li>✔ Used only for improving this project</li>
-                <li>✔ No personal data is stored or shared</li>
-                <li>✔ Helps make safety information simpler for everyone</li>
-            </ul>
-            </div>
-            """,
-            unsafe_allow_html=True
-        )
+current.run()
 
-        st.caption(
-            "This is an educational project focused on consumer awareness. "
-            "Feedback is used only for academic improvement."
-        )
 # ==================================================
 # FOOTER
 # ==================================================
@@ -0,0 +1,50 @@
+import argparse
+
+from compliance import artifact, batch, bench, licences, loadtest, postings, server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m compliance",
+        description="BIS consumer safety rules, outside the Streamlit app.",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    screen = commands.add_parser("screen", help="screen a catalog of listings in bulk")
+    batch.add_arguments(screen)
+    screen.set_defaults(run=batch.run)
+
+    query = commands.add_parser("query", help="boolean search over a `screen --index` index")
+    postings.add_arguments(query)
+    query.set_defaults(run=postings.run)
+
+    import_licences = commands.add_parser(
+        "import-licences", help="rebuild the model/CM-L licence index from a dump"
+    )
+    licences.add_arguments(import_licences)
+    import_licences.set_defaults(run=licences.run)
+
+    build_artifact = commands.add_parser(
+        "build-artifact", help="precompile rule data for fast process start"
+    )
+    artifact.add_arguments(build_artifact)
+    build_artifact.set_defaults(run=artifact.run)
+
+    benchmark = commands.add_parser("bench", help="benchmark the evaluation hot paths")
+    bench.add_arguments(benchmark)
+    benchmark.set_defaults(run=bench.run)
+
+    serve = commands.add_parser("serve", help="HTTP evaluation API with micro-batching")
+    server.add_arguments(serve)
+    serve.set_defaults(run=server.run)
+
+    load = commands.add_parser("loadtest", help="load a running `serve` instance")
+    loadtest.add_arguments(load)
+    load.set_defaults(run=loadtest.run)
+
+    args = parser.parse_args(argv)
+    args.run(args)
+
+
+if __name__ == "__main__":
+    main()
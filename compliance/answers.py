@@ -0,0 +1,159 @@
+# ==================================================
+# ASSISTANT ANSWERS (INTENT -> STYLE, MARKDOWN)
+# ==================================================
+ANSWERS = {
+    "fake": (
+        "bad",
+        """
+            **❌ High Risk Detected**
+
+            A fake or duplicate BIS mark means the product is **untested and illegal**.
+
+            **Why this is dangerous:**
+            • No safety testing  
+            • High risk of electric shock or fire  
+            • Violation of Indian consumer law  
+
+            **What you should do now:**
+            ❌ Do not buy or use the product  
+            📢 Report it immediately on the official BIS portal  
+
+            **Official complaint link:**  
+            https://consumerapp.bis.gov.in
+            """,
+    ),
+    "buy_electrical": (
+        "warn",
+        """
+            **⚠️ Electrical Safety Check Required**
+
+            Electrical products like chargers, adapters, and appliances
+            can cause **shock, overheating, or fire** if not certified.
+
+            **BIS Requirement:**
+            • IS 13252 (Electrical & electronic safety)
+
+            **Before buying, always verify:**
+            ✔ BIS standard mark  
+            ✔ CM/L license number  
+            ✔ Manufacturer name & address  
+
+            **Professional advice:**  
+            Buy only after BIS verification.
+            """,
+    ),
+    "brand_bis": (
+        "warn",
+        """
+            **Important Clarification**
+
+            BIS certification is **NOT for the brand**.
+            It is issued for **each individual product model**.
+
+            **Example:**
+            • One Samsung product may be BIS certified  
+            • Another Samsung product may NOT be BIS certified  
+
+            **Correct verification method:**
+            ✔ Check BIS mark  
+            ✔ Match CM/L number with the product model  
+
+            **Conclusion:**  
+            Never trust brand name alone.
+            """,
+    ),
+    "child": (
+        "warn",
+        """
+            **⚠️ Child Safety Alert**
+
+            Products used by children must meet **strict BIS safety standards**.
+
+            **Relevant BIS Standard:**
+            • IS 9873 – Safety of toys & child products
+
+            **Important note:**
+            Terms like *child safe* or *kids friendly* are **not certifications**.
+
+            **Advice:**  
+            Allow children to use products only after BIS verification.
+            """,
+    ),
+    "eco": (
+        "warn",
+        """
+            **ℹ️ Eco-Friendly Claim Explained**
+
+            Terms like *eco-friendly* or *green* are **marketing claims**,
+            not BIS safety certifications.
+
+            **What BIS actually checks:**
+            • Electrical safety  
+            • Material safety  
+            • Mechanical safety  
+
+            **Advice:**  
+            Focus on BIS mark, not eco labels.
+            """,
+    ),
+    "cheap": (
+        "warn",
+        """
+            **⚠️ Price-Based Risk Warning**
+
+            Extremely low-priced products often:
+            • Skip safety testing  
+            • Use poor-quality materials  
+            • Fake BIS markings  
+
+            **Advice:**  
+            Low price should never replace safety verification.
+            """,
+    ),
+    "complaint": (
+        "ok",
+        """
+            **📢 Filing a BIS Complaint**
+
+            You should file a complaint if:
+            • BIS mark is missing or fake  
+            • Product overheats or sparks  
+            • Safety claims are misleading  
+
+            **Official BIS Consumer Portal:**  
+            https://consumerapp.bis.gov.in
+
+            Your complaint helps protect other consumers.
+            """,
+    ),
+    "bis": (
+        "ok",
+        """
+            **What is BIS?**
+
+            BIS (Bureau of Indian Standards) is a Government of India body
+            that ensures **minimum safety and quality standards**.
+
+            **Why BIS matters:**
+            • Prevents unsafe products  
+            • Protects consumers  
+            • Reduces accidents  
+
+            **Always prefer BIS-certified products.**
+            """,
+    ),
+    "fallback": (
+        "warn",
+        """
+            **I need a bit more information to guide you accurately.**
+
+            Please include:
+            • Product type (charger, toy, appliance)  
+            • Brand name  
+            • Whether BIS mark is present  
+
+            **Example:**  
+            *Is this Philips charger BIS certified?*
+            """,
+    ),
+}
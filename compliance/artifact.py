@@ -0,0 +1,196 @@
+import glob
+import hashlib
+import json
+import mmap
+import os
+import pickle
+import struct
+import sys
+import time
+
+from compliance import paths
+
+# ==================================================
+# PRECOMPILED RULE ARTIFACT
+# ==================================================
+# Layout: MAGIC, u32 header length, JSON header, then one pickle per
+# section. The header names each section's offset and length, so a
+# module unpickles only what it needs straight out of one mmap.
+MAGIC = b"BISRULE1"
+FORMAT = 1
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def _code(*names):
+    return [os.path.join(_HERE, name) for name in names]
+
+
+# Everything a section is compiled from. Each section records a hash of
+# its own sources, so editing bis_rules.csv only invalidates "rules".
+SECTION_SOURCES = {
+    "safety_matcher": lambda: _code("matcher.py", "keywords.py"),
+    "brands": lambda: _code("brands.py", "matcher.py") + [paths.BRANDS_CSV],
+    "knowledge": lambda: (
+        _code("knowledge.py", "answers.py", "matcher.py")
+        + sorted(glob.glob(os.path.join(paths.KNOWLEDGE_DIR, "*.md")))
+    ),
+    "rules": lambda: _code("rules.py") + [paths.RULES_CSV],
+}
+
+
+def fingerprint(section):
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{FORMAT}:{sys.version_info[:2]}".encode())
+    for path in SECTION_SOURCES[section]():
+        h.update(os.path.basename(path).encode() + b"\0")
+        try:
+            with open(path, "rb") as f:
+                h.update(f.read())
+        except OSError:
+            h.update(b"<missing>")
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+# ================= BUILD =================
+def compile_sections():
+    """Build every component from source, ignoring any existing artifact."""
+    from compliance.brands import BrandIndex
+    from compliance.keywords import SAFETY_FAMILIES
+    from compliance.knowledge import KnowledgeIndex, default_corpus
+    from compliance.matcher import KeywordMatcher
+    from compliance.rules import load_snapshot
+
+    brands = BrandIndex.from_csv(paths.BRANDS_CSV)
+    brands._mention_matcher  # cached_property - build it now so it is stored too
+    rules = load_snapshot(paths.RULES_CSV)
+    return {
+        "safety_matcher": KeywordMatcher(SAFETY_FAMILIES),
+        "brands": brands,
+        "knowledge": KnowledgeIndex(default_corpus(paths.KNOWLEDGE_DIR)),
+        "rules": (rules.rules, rules.version),
+    }
+
+
+def build(path=paths.ARTIFACT):
+    """Write a fresh artifact to path and return its header."""
+    blobs = {
+        name: pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+        for name, obj in compile_sections().items()
+    }
+    sections = {}
+    offset = 0
+    for name, blob in blobs.items():
+        sections[name] = {"offset": offset, "length": len(blob), "fingerprint": fingerprint(name)}
+        offset += len(blob)
+    header = {
+        "format": FORMAT,
+        "built": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "sections": sections,
+    }
+    raw = json.dumps(header).encode("utf-8")
+
+    tmp_path = f"{path}.building"
+    with open(tmp_path, "wb") as f:
+        f.write(MAGIC + struct.pack("<I", len(raw)) + raw)
+        for blob in blobs.values():
+            f.write(blob)
+    os.replace(tmp_path, path)
+    return header
+
+
+# ================= LOAD =================
+class Artifact:
+    """Read-only view of a built artifact.
+
+    status is "ok", "missing" or "unreadable" for the file as a whole;
+    section_status records "loaded", "stale" or "absent" per section.
+    """
+
+    def __init__(self, path=paths.ARTIFACT):
+        self.path = path
+        self.header = None
+        self.status = "missing"
+        self.section_status = {}
+        self._map = None
+        try:
+            with open(path, "rb") as f:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return
+
+        head = len(MAGIC) + 4
+        if len(self._map) < head or self._map[: len(MAGIC)] != MAGIC:
+            self.status = "unreadable"
+            return
+        (size,) = struct.unpack("<I", self._map[len(MAGIC):head])
+        try:
+            header = json.loads(self._map[head:head + size])
+        except ValueError:
+            self.status = "unreadable"
+            return
+        if header.get("format") != FORMAT:
+            self.status = "unreadable"
+            return
+        self.header = header
+        self._payload = head + size
+        self.status = "ok"
+
+    def section(self, name):
+        """The unpickled section, or None when it is missing or stale."""
+        if self.status != "ok":
+            return None
+        entry = self.header["sections"].get(name)
+        if entry is None:
+            self.section_status[name] = "absent"
+            return None
+        if entry["fingerprint"] != fingerprint(name):
+            self.section_status[name] = "stale"
+            return None
+        start = self._payload + entry["offset"]
+        try:
+            value = pickle.loads(self._map[start:start + entry["length"]])
+        except Exception:
+            # Any unpickling failure means "compile instead", never a crash.
+            self.section_status[name] = "unreadable"
+            return None
+        self.section_status[name] = "loaded"
+        return value
+
+
+_ARTIFACT = None
+
+
+def load_section(name, compile=None):
+    """Section from the default artifact (opened once per process). When it
+    is missing or stale, fall back to compile() - or None without one."""
+    global _ARTIFACT
+    if _ARTIFACT is None:
+        _ARTIFACT = Artifact()
+    value = _ARTIFACT.section(name)
+    if value is None and compile is not None:
+        value = compile()
+    return value
+
+
+def status():
+    if _ARTIFACT is None:
+        return {"artifact": "not loaded"}
+    return {"artifact": _ARTIFACT.status, **_ARTIFACT.section_status}
+
+
+# ================= COMMAND LINE =================
+def add_arguments(parser):
+    parser.add_argument("-o", "--output", default=paths.ARTIFACT, help="artifact file to write")
+
+
+def run(args):
+    start = time.perf_counter()
+    header = build(args.output)
+    size = os.path.getsize(args.output)
+    print(
+        f"built {args.output} ({size / 1024:.0f} KiB, {', '.join(header['sections'])}) "
+        f"in {time.perf_counter() - start:.1f}s",
+        file=sys.stderr,
+    )
@@ -0,0 +1,445 @@
+import csv
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+import weakref
+from collections import deque
+from itertools import chain, islice
+
+from compliance.engine import evaluate_product, explain_product
+from compliance.pool import worker_pool
+
+VERDICT_FIELDS = ["id", "category", "safety_status", "confidence", "matched_terms", "bis_refs"]
+
+# Marketplace descriptions can be far longer than csv's 128 KB default.
+csv.field_size_limit(min(sys.maxsize, 2**31 - 1))
+
+
+# ==================================================
+# INPUT (STREAMED, NEVER LOADED WHOLE)
+# ==================================================
+def _detect_format(path, fmt):
+    if fmt:
+        return fmt
+    return "jsonl" if path.endswith((".jsonl", ".ndjson", ".json")) else "csv"
+
+
+def read_listings(path, text_column="description", id_column=None, fmt=None):
+    """Iterator of (listing_id, text) pairs, read one at a time from a CSV or
+    JSONL file. Listings are numbered when id_column is None and the file
+    has no "id" column.
+
+    The header (for JSONL, the first record) is checked straight away:
+    ValueError names a text_column or id_column it does not have.
+    """
+    fmt = _detect_format(path, fmt)
+    # utf-8-sig: a BOM from Excel would otherwise stick to the first header.
+    f = open(path, newline="", encoding="utf-8-sig")
+    try:
+        if fmt == "jsonl":
+            rows = (json.loads(line) for line in f if line.strip())
+            first = next(rows, None)
+            columns = None
+            if first is not None:
+                columns = list(first) if isinstance(first, dict) else []
+                rows = chain([first], rows)
+        else:
+            rows = csv.DictReader(f)
+            columns = rows.fieldnames  # None for an empty file
+        if columns is not None:
+            missing = [c for c in (text_column, id_column) if c is not None and c not in columns]
+            if missing:
+                raise ValueError(
+                    f"{path}: no column {', '.join(map(repr, missing))} (found: {', '.join(columns)})"
+                )
+    except BaseException:
+        f.close()
+        raise
+    return _read_listings(f, rows, text_column, id_column)
+
+
+def _read_listings(f, rows, text_column, id_column):
+    with f:
+        yield from _listings(rows, text_column, id_column)
+
+
+def _listings(rows, text_column, id_column):
+    id_column = id_column or "id"
+    for n, row in enumerate(rows, 1):
+        listing_id = row.get(id_column)
+        yield (n if listing_id in (None, "") else listing_id), row.get(text_column) or ""
+
+
+def _xlsx_rows(f):
+    # openpyxl is only needed for spreadsheet uploads; read_only streams rows.
+    from openpyxl import load_workbook
+
+    book = load_workbook(f, read_only=True, data_only=True)
+    try:
+        rows = book.active.iter_rows(values_only=True)
+        header = ["" if cell is None else str(cell) for cell in next(rows, ())]
+        for values in rows:
+            yield {h: ("" if v is None else str(v)) for h, v in zip(header, values)}
+    finally:
+        book.close()
+
+
+def _csv_rows(f):
+    text = io.TextIOWrapper(f, encoding="utf-8-sig", newline="")
+    try:
+        yield from csv.DictReader(text)
+    finally:
+        text.detach()  # leave the caller's binary file open
+
+
+def _upload_rows(f, name):
+    f.seek(0)
+    return _xlsx_rows(f) if name.lower().endswith(".xlsx") else _csv_rows(f)
+
+
+def upload_columns(f, name):
+    """Column names of an uploaded CSV or XLSX, read from its first row only."""
+    f.seek(0)
+    if name.lower().endswith(".xlsx"):
+        from openpyxl import load_workbook
+
+        book = load_workbook(f, read_only=True)
+        try:
+            header = next(book.active.iter_rows(max_row=1, values_only=True), ())
+        finally:
+            book.close()
+        return [str(cell) for cell in header if cell is not None]
+    text = io.TextIOWrapper(f, encoding="utf-8-sig", newline="")
+    try:
+        return next(csv.reader(text), [])
+    finally:
+        text.detach()
+
+
+def read_upload(f, name, text_column="description", id_column="id"):
+    """Yield (listing_id, text) pairs from an uploaded CSV or XLSX file object."""
+    yield from _listings(_upload_rows(f, name), text_column, id_column)
+
+
+def chunked(iterable, size):
+    it = iter(iterable)
+    while True:
+        chunk = list(islice(it, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+# ==================================================
+# EVALUATION
+# ==================================================
+def screen_listing(listing_id, text):
+    return verdict_record(listing_id, evaluate_product(text))
+
+
+def verdict_record(listing_id, result, spans=None):
+    record = {
+        "id": listing_id,
+        "category": result.category,
+        "safety_status": result.safety_status,
+        "confidence": result.confidence,
+        "matched_terms": [
+            f"{family}:{keyword}"
+            for family, keywords in result.matched.items()
+            for keyword in keywords
+        ],
+        "bis_refs": sorted(set(result.bis_refs)),
+    }
+    if spans is not None:
+        record["spans"] = spans
+    return record
+
+
+def screen_chunk(chunk):
+    return [screen_listing(listing_id, text) for listing_id, text in chunk]
+
+
+def evaluate_chunk(chunk):
+    """(listing_id, SafetyResult) pairs, for the columnar .npz output."""
+    return [(listing_id, evaluate_product(text)) for listing_id, text in chunk]
+
+
+def explain_chunk(chunk):
+    """(listing_id, SafetyResult, spans) triples, for --spans."""
+    return [(listing_id, *explain_product(text)) for listing_id, text in chunk]
+
+
+def screen_catalog(listings, workers=None, chunk_size=1000, screen=screen_chunk):
+    """Yield verdicts in input order, keeping at most 2 chunks per worker in flight."""
+    for results in map_chunks(screen, chunked(listings, chunk_size), workers):
+        yield from results
+
+
+def map_chunks(screen, chunks, workers=None):
+    """Yield screen(chunk) for each chunk, in order, across worker processes."""
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        for chunk in chunks:
+            yield screen(chunk)
+        return
+
+    with worker_pool(workers) as pool:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(screen, chunk))
+            if len(pending) >= workers * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+# ==================================================
+# OUTPUT (WRITTEN AS RESULTS ARRIVE)
+# ==================================================
+class VerdictWriter:
+    def __init__(self, f, fmt, fields=VERDICT_FIELDS):
+        self.f = f
+        self.fmt = fmt
+        if fmt == "csv":
+            self._csv = csv.DictWriter(f, fieldnames=fields)
+            self._csv.writeheader()
+
+    def write(self, record):
+        if self.fmt == "csv":
+            row = dict(record)
+            row["matched_terms"] = "; ".join(record["matched_terms"])
+            row["bis_refs"] = "; ".join(record["bis_refs"])
+            if "spans" in record:
+                row["spans"] = "; ".join(
+                    f"{family}:{keyword}@{start}-{end}" for start, end, keyword, family in record["spans"]
+                )
+            self._csv.writerow(row)
+        else:
+            self.f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+# ================= RESULTS ON DISK (UPLOAD MODE) =================
+_RUN_PREFIX = "bis-verdicts-"
+# Runs are removed when discarded or garbage-collected; files left by a
+# crashed or killed process are swept once they are this old.
+STALE_RUN_SECONDS = 24 * 3600
+
+
+def _remove_run_file(f, path):
+    if not f.closed:
+        f.close()
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def sweep_stale_runs(max_age=STALE_RUN_SECONDS):
+    """Delete catalog run files in the temp directory not written to for max_age seconds."""
+    cutoff = time.time() - max_age
+    tmp = tempfile.gettempdir()
+    for name in os.listdir(tmp):
+        if name.startswith(_RUN_PREFIX) and name.endswith(".csv"):
+            path = os.path.join(tmp, name)
+            try:
+                if os.stat(path).st_mtime < cutoff:
+                    os.remove(path)
+            except OSError:
+                pass
+
+
+class CatalogRun:
+    """Verdicts of one uploaded catalog, written to a temporary CSV.
+
+    Only the page offsets and the per-category counts stay in memory, so a
+    session can hold on to a run of any size and read back one page at a
+    time.
+    """
+
+    # Every verdict of verdicts.decide() is one of these.
+    STATUSES = ("🔴 High Risk", "🟡 Conditional Use")
+
+    def __init__(self, page_size=50):
+        self.page_size = page_size
+        sweep_stale_runs()
+        fd, self.path = tempfile.mkstemp(prefix=_RUN_PREFIX, suffix=".csv")
+        self._f = os.fdopen(fd, "w", newline="", encoding="utf-8")
+        # An abandoned session drops its run; the file goes with it.
+        self._cleanup = weakref.finalize(self, _remove_run_file, self._f, self.path)
+        self._writer = VerdictWriter(self._f, "csv")
+        self._offsets = []
+        self.rows = 0
+        self.skipped = 0  # rows without a description, never screened
+        self.counts = {}
+
+    def screen(self, chunk):
+        """Screen (listing_id, text) pairs; empty descriptions are only counted,
+        as the single-description check refuses them too."""
+        described = [(listing_id, text) for listing_id, text in chunk if text.strip()]
+        self.skipped += len(chunk) - len(described)
+        self.add(screen_chunk(described))
+
+    def add(self, records):
+        for record in records:
+            if self.rows % self.page_size == 0:
+                self._f.flush()
+                self._offsets.append(self._f.tell())
+            self._writer.write(record)
+            self.rows += 1
+            key = (record["category"], record["safety_status"])
+            self.counts[key] = self.counts.get(key, 0) + 1
+        self._f.flush()
+
+    def finish(self):
+        self._f.close()
+
+    @property
+    def pages(self):
+        return len(self._offsets)
+
+    def page(self, number):
+        """Rows of 1-based page number, as dicts."""
+        if not 1 <= number <= self.pages:
+            return []
+        with open(self.path, newline="", encoding="utf-8") as f:
+            f.seek(self._offsets[number - 1])
+            return list(islice(csv.DictReader(f, fieldnames=VERDICT_FIELDS), self.page_size))
+
+    def summary(self):
+        """{category: {status: count}} with every status present."""
+        table = {}
+        for (category, status), n in sorted(self.counts.items()):
+            table.setdefault(category, dict.fromkeys(self.STATUSES, 0))[status] = n
+        return table
+
+    def read(self):
+        """The whole verdict CSV as bytes."""
+        with open(self.path, "rb") as f:
+            return f.read()
+
+    def discard(self):
+        self._cleanup()
+
+
+# ==================================================
+# COMMAND LINE
+# ==================================================
+def add_arguments(parser):
+    parser.add_argument("input", help="CSV or JSONL file of listings")
+    parser.add_argument(
+        "-o", "--output", default="-",
+        help="verdict file (.csv, .jsonl or columnar .npz), default stdout",
+    )
+    parser.add_argument("--format", choices=["csv", "jsonl"], help="input format (default: from extension)")
+    parser.add_argument("--text-column", default="description")
+    parser.add_argument("--id-column", help='listing ID column (default: "id" if present, else row numbers)')
+    parser.add_argument("--workers", type=int, default=None, help="processes (default: all cores)")
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument(
+        "--index", metavar="PATH",
+        help="also write an inverted index (.npz) for `python -m compliance query`",
+    )
+    parser.add_argument(
+        "--spans", action="store_true",
+        help="add the character offsets of every matched keyword to each verdict",
+    )
+    parser.add_argument(
+        "--state", metavar="PATH",
+        help="keep per-listing match state here and, on later runs, re-evaluate "
+        "only listings the keyword or rule changes can affect",
+    )
+    parser.add_argument(
+        "--dedupe", action="store_true",
+        help="evaluate one listing per group of near-duplicates (same safety "
+        "keywords, other words differing) and reuse its verdict for the rest",
+    )
+    parser.add_argument(
+        "--dedupe-capacity", type=int, default=65536,
+        help="most near-duplicate groups remembered at once (default 65536)",
+    )
+
+
+def run(args):
+    if args.state and args.dedupe:
+        raise SystemExit("--dedupe cannot be combined with --state")
+    if args.spans and (args.state or args.dedupe or args.output.endswith(".npz")):
+        # Carried-over and reused verdicts are never scanned, and the
+        # columnar records have no room for them.
+        raise SystemExit("--spans needs a full run written to .csv or .jsonl")
+    try:
+        listings = read_listings(args.input, args.text_column, args.id_column, args.format)
+    except ValueError as e:
+        raise SystemExit(str(e))
+    start = time.perf_counter()
+    dedupe = None
+    if args.state:
+        from compliance.incremental import screen_incremental
+
+        results = screen_incremental(listings, args.state, args.workers, args.chunk_size)
+    elif args.dedupe:
+        from compliance.dedupe import DedupeReport, screen_deduplicated
+
+        dedupe = DedupeReport(args.dedupe_capacity)
+        results = screen_deduplicated(listings, dedupe, args.workers, args.chunk_size)
+    elif args.spans:
+        results = screen_catalog(listings, args.workers, args.chunk_size, explain_chunk)
+    else:
+        results = screen_catalog(listings, args.workers, args.chunk_size, evaluate_chunk)
+
+    index = None
+    if args.index:
+        from compliance.postings import IndexBuilder
+
+        index = IndexBuilder()
+    if args.output.endswith(".npz"):
+        count = _write_columnar(results, args.output, index)
+    else:
+        count = _write_records(results, args.output, index, args.spans)
+    if index is not None:
+        index.build().save(args.index)
+
+    elapsed = time.perf_counter() - start
+    print(
+        f"Screened {count} listings in {elapsed:.2f}s "
+        f"({count / elapsed if elapsed else 0:.0f} listings/s)",
+        file=sys.stderr,
+    )
+    if dedupe is not None:
+        print(dedupe, file=sys.stderr)
+
+
+def _write_columnar(results, path, index=None):
+    from compliance.columnar import ResultColumns
+    from compliance.postings import result_terms
+
+    store, ids = ResultColumns(), []
+    for listing_id, result in results:
+        ids.append(listing_id)
+        store.append(result)
+        if index is not None:
+            index.add(listing_id, result_terms(result))
+    store.save(path, ids)
+    return len(store)
+
+
+def _write_records(results, path, index=None, spans=False):
+    from compliance.postings import result_terms
+
+    out_fmt = "csv" if path.endswith(".csv") else "jsonl"
+    out = sys.stdout if path == "-" else open(path, "w", newline="", encoding="utf-8")
+
+    count = 0
+    try:
+        writer = VerdictWriter(out, out_fmt, [*VERDICT_FIELDS, "spans"] if spans else VERDICT_FIELDS)
+        for listing_id, result, *matches in results:
+            writer.write(verdict_record(listing_id, result, *matches))
+            if index is not None:
+                index.add(listing_id, result_terms(result))
+            count += 1
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return count
@@ -0,0 +1,316 @@
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+from compliance import artifact, paths, pool
+from compliance.brands import BRANDS
+from compliance.data import PRODUCT_TYPES
+from compliance.engine import check_brand, classify_question, evaluate_product
+from compliance.keywords import QUESTION_SIGNALS, SAFETY_FAMILIES
+
+# ==================================================
+# SEEDED SYNTHETIC INPUTS
+# ==================================================
+_FILLER = (
+    "premium quality durable design compact lightweight portable modern stylish "
+    "home office travel daily use easy to clean long lasting warranty included "
+    "original product best price fast delivery colour black white grey blue pack "
+    "of 1 2 3 set for men women kids adults high performance smart new model"
+).split()
+
+_QUESTION_TEMPLATES = [
+    "Is this {brand} {thing} safe to {verb}?",
+    "How do I know if a {thing} is {signal}?",
+    "My {thing} from {brand} has no BIS mark, what should I do?",
+    "Can I trust {brand} for {thing}?",
+    "{signal} {thing} for my kids?",
+    "where do I {verb} about a {thing}",
+]
+_THINGS = ["charger", "toy", "mixer", "helmet", "power bank", "heater", "kettle", "pressure cooker"]
+_VERBS = ["buy", "use", "complain", "report"]
+
+
+def generate_listings(n, seed=0, density=0.15):
+    """n product descriptions of 5-400 words; about density of the words
+    are safety keywords drawn from the real keyword families."""
+    rng = random.Random(seed)
+    keywords = [w for words in SAFETY_FAMILIES.values() for w in words]
+    brands = [e.name for e in BRANDS.entries]
+    listings = []
+    for _ in range(n):
+        length = min(400, max(5, int(rng.lognormvariate(3.5, 0.8))))
+        words = [rng.choice(brands)]
+        for _ in range(length):
+            words.append(rng.choice(keywords) if rng.random() < density else rng.choice(_FILLER))
+        listings.append(" ".join(words))
+    return listings
+
+
+def _typo(rng, word):
+    if len(word) < 3:
+        return word
+    i = rng.randrange(len(word))
+    op = rng.random()
+    if op < 0.33:
+        return word[:i] + word[i + 1:]
+    if op < 0.66:
+        return word[:i] + rng.choice("abcdefghijklmnopqrstuvwxyz") + word[i:]
+    return word[:i] + rng.choice("abcdefghijklmnopqrstuvwxyz") + word[i + 1:]
+
+
+def generate_brand_queries(n, seed=0):
+    """(brand, model, product_type) triples: registered, misspelled and unknown brands."""
+    rng = random.Random(seed)
+    brands = [e.name for e in BRANDS.entries]
+    queries = []
+    for _ in range(n):
+        brand = rng.choice(brands)
+        kind = rng.random()
+        if kind < 0.3:
+            brand = _typo(rng, brand)
+        elif kind < 0.4:
+            brand = "".join(rng.choices("bcdfghklmnprstvz", k=rng.randint(4, 9)))
+        model = "" if rng.random() < 0.3 else f"{rng.choice('ABCX')}-{rng.randrange(10000)}"
+        queries.append((brand, model, rng.choice(PRODUCT_TYPES)))
+    return queries
+
+
+def generate_questions(n, seed=0):
+    rng = random.Random(seed)
+    brands = [e.name for e in BRANDS.entries]
+    signals = [w for words in QUESTION_SIGNALS.values() for w in words]
+    return [
+        rng.choice(_QUESTION_TEMPLATES).format(
+            brand=rng.choice(brands),
+            thing=rng.choice(_THINGS),
+            verb=rng.choice(_VERBS),
+            signal=rng.choice(signals),
+        )
+        for _ in range(n)
+    ]
+
+
+# ==================================================
+# SCENARIOS (UNCACHED - THE COST OF A REAL MISS)
+# ==================================================
+SCENARIOS = {
+    "safety": (generate_listings, evaluate_product),
+    "brand": (generate_brand_queries, lambda q: check_brand(*q)),
+    "question": (generate_questions, classify_question),
+}
+
+
+def measure(func, inputs, memory_sample=500):
+    for item in inputs[:50]:
+        func(item)
+
+    timings = np.empty(len(inputs), dtype=np.int64)
+    clock = time.perf_counter_ns
+    start = clock()
+    for i, item in enumerate(inputs):
+        t = clock()
+        func(item)
+        timings[i] = clock() - t
+    total = (clock() - start) / 1e9
+
+    # Separate pass: tracemalloc slows every allocation, so it never
+    # overlaps the timed run.
+    tracemalloc.start()
+    for item in inputs[:memory_sample]:
+        func(item)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    p50, p95, p99 = np.percentile(timings, [50, 95, 99]) / 1000
+    return {
+        "n": len(inputs),
+        "p50_us": round(float(p50), 2),
+        "p95_us": round(float(p95), 2),
+        "p99_us": round(float(p99), 2),
+        "mean_us": round(float(timings.mean()) / 1000, 2),
+        "throughput_per_s": round(len(inputs) / total, 1),
+        "peak_kib": round(peak / 1024, 1),
+    }
+
+
+# ================= COLD START =================
+_FIRST_EVAL = (
+    "import time\n"
+    "from compliance.engine import check_brand, classify_question, evaluate_product\n"
+    "evaluate_product('charger'); check_brand('Samsung'); classify_question('is it safe')\n"
+    "print(time.time())\n"
+)
+
+
+def time_to_first_eval(artifact_path, runs=3):
+    """Median wall time from spawning a fresh interpreter until it has
+    answered one request on each page, in ms."""
+    env = dict(os.environ, BIS_ARTIFACT=artifact_path)
+    times = []
+    for _ in range(runs):
+        start = time.time()
+        out = subprocess.run(
+            [sys.executable, "-c", _FIRST_EVAL],
+            env=env, cwd=paths.ROOT, capture_output=True, text=True, check=True,
+        )
+        times.append((float(out.stdout.strip().splitlines()[-1]) - start) * 1000)
+    return round(float(np.median(times)), 1)
+
+
+def measure_cold_start(runs=3):
+    with tempfile.TemporaryDirectory() as tmp:
+        compiled = time_to_first_eval(os.path.join(tmp, "none.artifact"), runs)
+    loaded = artifact.Artifact(paths.ARTIFACT)
+    state = loaded.status
+    if state == "ok":
+        stale = [name for name in artifact.SECTION_SOURCES if loaded.section(name) is None]
+        state = f"stale: {', '.join(stale)}" if stale else "ok"
+    return {
+        "ttfe_ms": time_to_first_eval(paths.ARTIFACT, runs),
+        "ttfe_compiled_ms": compiled,
+        "artifact": state,
+    }
+
+
+# ================= WORKER POOL =================
+def measure_worker_pool(workers=4):
+    """Spin-up time and per-worker memory of a bulk-screening pool, with
+    workers forked from the warmed-up parent and, for reference, spawned."""
+    results = {"start_method": "fork" if pool.SHARED else "spawn"}
+    configurations = [("", pool.SHARED)]
+    if pool.SHARED:
+        configurations.append(("spawn_", False))
+    for prefix, shared in configurations:
+        spin_up, memory = pool.measure_pool(workers, shared)
+        results[f"{prefix}spin_up_ms"] = spin_up
+        results[f"{prefix}worker_private_kib"] = memory["private"]
+        results[f"{prefix}worker_pss_kib"] = memory["pss"]
+    return results
+
+
+# Scenarios that measure the process rather than one code path.
+EXTRA = {"cold_start": measure_cold_start, "pool": measure_worker_pool}
+
+
+def run_suite(scenarios=(*SCENARIOS, *EXTRA), n=5000, seed=0):
+    results = {}
+    for name in scenarios:
+        if name in EXTRA:
+            results[name] = EXTRA[name]()
+            continue
+        generate, func = SCENARIOS[name]
+        results[name] = measure(func, generate(n, seed))
+    return {
+        "meta": {
+            "seed": seed,
+            "n": n,
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+
+
+# ==================================================
+# BASELINE COMPARISON
+# ==================================================
+# Metric -> +1 when bigger is worse, -1 when smaller is worse.
+_DIRECTION = {
+    "p50_us": 1,
+    "p95_us": 1,
+    "p99_us": 1,
+    "mean_us": 1,
+    "peak_kib": 1,
+    "throughput_per_s": -1,
+    "ttfe_ms": 1,
+    "spin_up_ms": 1,
+    "worker_private_kib": 1,
+}
+
+
+def compare(current, baseline, threshold=0.10):
+    """Return (scenario, metric, baseline, current, change) rows; change is
+    the relative change in the "worse" direction, flagged past threshold."""
+    rows = []
+    for name, metrics in current["results"].items():
+        base = baseline.get("results", {}).get(name)
+        if not base:
+            continue
+        for metric, direction in _DIRECTION.items():
+            old, new = base.get(metric), metrics.get(metric)
+            if not old or new is None:
+                continue
+            change = direction * (new - old) / old
+            rows.append((name, metric, old, new, change, change > threshold))
+    return rows
+
+
+# ==================================================
+# COMMAND LINE
+# ==================================================
+def add_arguments(parser):
+    parser.add_argument("-n", type=int, default=5000, help="inputs per scenario")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--scenario", dest="scenarios", action="append", choices=[*sorted(SCENARIOS), *EXTRA],
+        help="run only this scenario (repeatable)",
+    )
+    parser.add_argument("-o", "--output", help="write results JSON here")
+    parser.add_argument("--compare", metavar="BASELINE", help="baseline JSON to compare against")
+    parser.add_argument(
+        "--threshold", type=float, default=0.10,
+        help="relative slowdown that counts as a regression (default 0.10)",
+    )
+
+
+def run(args):
+    report = run_suite(args.scenarios or (*SCENARIOS, *EXTRA), args.n, args.seed)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+    for name, m in report["results"].items():
+        if name == "cold_start":
+            print(
+                f"{name:<10} first evaluation {m['ttfe_ms']:.0f} ms after process start "
+                f"(artifact: {m['artifact']}; compiling from source: {m['ttfe_compiled_ms']:.0f} ms)"
+            )
+            continue
+        if name == "pool":
+            line = (
+                f"{name:<10} {m['start_method']} workers up in {m['spin_up_ms']:.0f} ms, "
+                f"{m['worker_private_kib']} KiB private / {m['worker_pss_kib']} KiB PSS each"
+            )
+            if "spawn_spin_up_ms" in m:
+                line += (
+                    f" (spawned: {m['spawn_spin_up_ms']:.0f} ms, "
+                    f"{m['spawn_worker_private_kib']} KiB / {m['spawn_worker_pss_kib']} KiB)"
+                )
+            print(line)
+            continue
+        print(
+            f"{name:<10} p50 {m['p50_us']:>9.1f}us  p95 {m['p95_us']:>9.1f}us  "
+            f"p99 {m['p99_us']:>9.1f}us  {m['throughput_per_s']:>10.0f}/s  "
+            f"peak {m['peak_kib']:>8.1f} KiB"
+        )
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        rows = compare(report, baseline, args.threshold)
+        regressions = [r for r in rows if r[5]]
+        for name, metric, old, new, change, flagged in rows:
+            mark = "REGRESSION" if flagged else ""
+            print(f"{name:<10} {metric:<17} {old:>12} -> {new:>12} {change:+8.1%} {mark}")
+        if regressions:
+            print(f"{len(regressions)} regression(s) over {args.threshold:.0%}", file=sys.stderr)
+            sys.exit(1)
@@ -0,0 +1,251 @@
+import csv
+import re
+import zlib
+from array import array
+from bisect import bisect_left
+from dataclasses import dataclass
+from functools import cached_property
+
+import numpy as np
+
+from compliance import paths
+from compliance.artifact import load_section
+from compliance.matcher import KeywordMatcher
+
+DEFAULT_BRANDS_PATH = paths.BRANDS_CSV
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+
+def normalize_brand(name):
+    # "Blue-Star", "blue star" and "BLUESTAR" are the same registry entry.
+    return _NON_ALNUM.sub("", name.lower())
+
+
+@dataclass(frozen=True)
+class BrandEntry:
+    name: str
+    status: str
+    key: str
+
+
+@dataclass(frozen=True)
+class BrandMention:
+    entry: BrandEntry
+    start: int
+    end: int
+
+
+# ==================================================
+# EDIT DISTANCE (OPTIMAL STRING ALIGNMENT, BOUNDED)
+# ==================================================
+def edit_distance(a, b, limit):
+    """Damerau-Levenshtein (adjacent swaps count as one edit), or limit + 1
+    as soon as the distance is known to exceed limit."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+
+    # Typos leave most of the word intact - only the middle needs the table.
+    start = 0
+    while start < len(a) and start < len(b) and a[start] == b[start]:
+        start += 1
+    end_a, end_b = len(a), len(b)
+    while end_a > start and end_b > start and a[end_a - 1] == b[end_b - 1]:
+        end_a -= 1
+        end_b -= 1
+    a, b = a[start:end_a], b[start:end_b]
+    if not a or not b:
+        return min(max(len(a), len(b)), limit + 1)
+
+    big = limit + 1
+    prev2 = None
+    prev = [j if j <= limit else big for j in range(len(b) + 1)]
+    for i in range(1, len(a) + 1):
+        cur = [big] * (len(b) + 1)
+        cur[0] = i if i <= limit else big
+        best = cur[0]
+        ca = a[i - 1]
+        # Cells further than limit from the diagonal can never come back under it.
+        for j in range(max(1, i - limit), min(len(b), i + limit) + 1):
+            v = prev[j - 1] + (ca != b[j - 1])
+            if prev[j] + 1 < v:
+                v = prev[j] + 1
+            if cur[j - 1] + 1 < v:
+                v = cur[j - 1] + 1
+            if prev2 is not None and j > 1 and ca == b[j - 2] and a[i - 2] == b[j - 1]:
+                if prev2[j - 2] + 1 < v:
+                    v = prev2[j - 2] + 1
+            cur[j] = v
+            if v < best:
+                best = v
+        if best > limit:
+            return big
+        prev2, prev = prev, cur
+    return min(prev[-1], big)
+
+
+# ==================================================
+# SYMSPELL-STYLE DELETION INDEX
+# ==================================================
+def _deletes(word, distance):
+    out = {word}
+    frontier = {word}
+    for _ in range(distance):
+        frontier = {w[:i] + w[i + 1:] for w in frontier for i in range(len(w))}
+        out |= frontier
+    return out
+
+
+def _hash(s):
+    return zlib.crc32(s.encode("utf-8"))
+
+
+class _DeleteIndex:
+    # Sorted 32-bit hashes of every delete, with the brand id beside each.
+    def __init__(self, words, distance):
+        hashes = array("I")
+        ids = array("i")
+        for i, word in enumerate(words):
+            for d in _deletes(word, distance):
+                hashes.append(_hash(d))
+                ids.append(i)
+        hashes = np.frombuffer(hashes, dtype=np.uint32)
+        order = np.argsort(hashes, kind="stable")
+        self.hashes = hashes[order]
+        self.ids = np.frombuffer(ids, dtype=np.int32)[order]
+
+    def candidates(self, word, distance, size):
+        """Boolean mask over brand ids that share a delete with word."""
+        probes = np.fromiter((_hash(d) for d in _deletes(word, distance)), dtype=np.uint32)
+        lo = np.searchsorted(self.hashes, probes, side="left")
+        hi = np.searchsorted(self.hashes, probes, side="right")
+        # Expand every [lo, hi) run into positions without a Python loop.
+        lengths = hi - lo
+        starts = np.repeat(lo - np.cumsum(lengths) + lengths, lengths)
+        mask = np.zeros(size, dtype=bool)
+        mask[self.ids[starts + np.arange(lengths.sum())]] = True
+        return mask
+
+
+_ALPHABET = "abcdefghijklmnopqrstuvwxyz0123456789"
+_SLOT = {c: i for i, c in enumerate(_ALPHABET)}
+
+
+def _histogram(key):
+    counts = np.zeros(len(_ALPHABET), dtype=np.int16)
+    for c in key:
+        counts[_SLOT[c]] += 1
+    return counts
+
+
+class BrandIndex:
+    """Normalized exact lookup plus ranked typo suggestions.
+
+    SymSpell-style: each brand key contributes every string reachable by
+    deleting up to max_distance characters from its first prefix_length
+    characters. Deletes are kept only as 32-bit hashes in a sorted NumPy
+    array, so 100k brands stay in the tens of MB. A query collects brands
+    sharing a prefix delete, drops those whose length or letter counts are
+    too far off, then checks the real edit distance on that short list.
+    """
+
+    def __init__(self, entries, max_distance=2, prefix_length=7):
+        self.max_distance = max_distance
+        self.prefix_length = prefix_length
+        self.entries = []
+        self.by_key = {}
+        for name, status in entries:
+            key = normalize_brand(name)
+            if key and key not in self.by_key:
+                self.by_key[key] = len(self.entries)
+                self.entries.append(BrandEntry(name.strip(), status.strip().lower(), key))
+
+        keys = [e.key for e in self.entries]
+        # Prefix completion: every key starting with p sits in one run of this list.
+        self._sorted = sorted(zip(keys, range(len(keys))))
+        self._lengths = np.fromiter((len(k) for k in keys), dtype=np.int16, count=len(keys))
+        self._histograms = np.zeros((len(keys), len(_ALPHABET)), dtype=np.uint8)
+        for i, key in enumerate(keys):
+            for c in key:
+                self._histograms[i, _SLOT[c]] += 1
+        self._prefixes = _DeleteIndex((k[:prefix_length] for k in keys), max_distance)
+
+    @classmethod
+    def from_csv(cls, path=DEFAULT_BRANDS_PATH, **kwargs):
+        with open(path, newline="", encoding="utf-8") as f:
+            rows = [(row["brand"], row.get("status") or "approved") for row in csv.DictReader(f)]
+        return cls(rows, **kwargs)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def lookup(self, name):
+        i = self.by_key.get(normalize_brand(name))
+        return None if i is None else self.entries[i]
+
+    def complete(self, prefix, limit=8):
+        """Registered brands whose normalized name starts with prefix."""
+        key = normalize_brand(prefix)
+        if not key:
+            return []
+        out = []
+        i = bisect_left(self._sorted, (key,))
+        while i < len(self._sorted) and len(out) < limit and self._sorted[i][0].startswith(key):
+            out.append(self.entries[self._sorted[i][1]])
+            i += 1
+        return out
+
+    @cached_property
+    def _mention_matcher(self):
+        # One "family" per brand, so every spelling reports the entry it
+        # belongs to: "Blue Star" also matches "bluestar" and "blue-star".
+        return KeywordMatcher(
+            {i: [e.name, e.key] for i, e in enumerate(self.entries)}, plurals=False
+        )
+
+    def mentions(self, text):
+        """Brands named in text as whole words, with their token spans.
+
+        Built on first use; one pass over the text whatever the registry size.
+        """
+        found = []
+        last_end = -1
+        # Longest match wins where two brands overlap ("blue star" over "star").
+        for start, end, _, i in sorted(
+            self._mention_matcher.find(text), key=lambda m: (m[0], -m[1])
+        ):
+            if start >= last_end:
+                found.append(BrandMention(self.entries[i], start, end))
+                last_end = end
+        return found
+
+    def suggest(self, name, limit=5):
+        """Return up to limit (entry, distance) pairs, closest first."""
+        key = normalize_brand(name)
+        if not key:
+            return []
+        # Two edits on a three-letter name could turn it into anything.
+        limit_d = min(self.max_distance, max(1, len(key) // 3))
+        prefix = key[: self.prefix_length]
+
+        candidates = np.flatnonzero(
+            self._prefixes.candidates(prefix, limit_d, len(self.entries))
+        )
+        # Cheap lower bounds before the exact distance: an edit changes the
+        # length by at most one and the letter counts by at most two.
+        candidates = candidates[np.abs(self._lengths[candidates] - len(key)) <= limit_d]
+        diff = np.abs(self._histograms[candidates].astype(np.int16) - _histogram(key))
+        candidates = candidates[diff.sum(axis=1) <= 2 * limit_d]
+
+        found = []
+        for i in candidates.tolist():
+            entry = self.entries[i]
+            d = edit_distance(key, entry.key, limit_d)
+            if d <= limit_d:
+                found.append((d, abs(len(entry.key) - len(key)), entry.key, entry))
+        found.sort(key=lambda f: f[:3])
+        return [(f[3], f[0]) for f in found[:limit]]
+
+
+# One index per process, loaded from the registry file, not Python literals.
+BRANDS = load_section("brands", BrandIndex.from_csv)
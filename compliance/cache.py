@@ -0,0 +1,80 @@
+import threading
+import time
+from collections import OrderedDict
+
+from compliance.matcher import tokenize
+
+MISSING = object()
+
+
+def normalize_text(text):
+    # The matcher only ever sees these tokens, so two descriptions that
+    # normalize the same way always get the same verdict.
+    return b" ".join(tokenize(text))
+
+
+# ==================================================
+# SIZE-CAPPED LRU WITH TTL (SHARED ACROSS SESSIONS)
+# ==================================================
+class LRUCache:
+    """Thread-safe LRU cache with per-entry expiry and hit/miss counters.
+
+    Entries are tagged with a version; switching to a new version (e.g. a
+    new rule snapshot) drops everything cached under the old one.
+    """
+
+    def __init__(self, maxsize=4096, ttl=600.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.version = None
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, version=None):
+        now = time.monotonic()
+        with self._lock:
+            if version != self.version:
+                self._reset(version)
+            entry = self._data.get(key)
+            if entry is None or entry[0] < now:
+                if entry is not None:
+                    del self._data[key]
+                self.misses += 1
+                return MISSING
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key, value, version=None):
+        with self._lock:
+            if version != self.version:
+                self._reset(version)
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def _reset(self, version):
+        self._data.clear()
+        self.version = version
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self):
+        return len(self._data)
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
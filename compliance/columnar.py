@@ -0,0 +1,209 @@
+import json
+
+import numpy as np
+
+from compliance.data import FAMILY_RULES
+from compliance.engine import SafetyResult
+from compliance.keywords import SAFETY_FAMILIES
+
+# ==================================================
+# FIXED-WIDTH SAFETY RESULTS
+# ==================================================
+# Every SafetyResult field is one of a handful of strings, so a result is
+# stored as small integer codes into per-column string tables:
+#   families   bit i set when SAFETY_FAMILIES[i] matched
+#   keywords   bit j set when KEYWORDS[j] matched (claims included)
+#   category / safety_status / confidence / recommendation / style
+#              one code each
+#   reasons / bis_refs
+#              ordered codes, NONE-padded
+FAMILIES = list(SAFETY_FAMILIES)
+KEYWORDS = [(family, word) for family, words in SAFETY_FAMILIES.items() for word in words]
+_KEYWORD_BIT = {pair: i for i, pair in enumerate(KEYWORDS)}
+_KEYWORD_WORDS = (len(KEYWORDS) + 63) // 64
+_WORD_MASK = (1 << 64) - 1
+_FAMILY_BIT = {family: 1 << i for i, family in enumerate(FAMILIES)}
+
+NONE = 255
+MAX_REASONS = len(FAMILIES)
+MAX_REFS = len(FAMILY_RULES)
+
+TEXT_FIELDS = ("category", "safety_status", "confidence", "recommendation", "style")
+LIST_FIELDS = ("reasons", "bis_refs")
+
+RESULT_DTYPE = np.dtype([
+    ("families", np.uint8),
+    ("keywords", np.uint64, (_KEYWORD_WORDS,)),
+    ("category", np.uint8),
+    ("safety_status", np.uint8),
+    ("confidence", np.uint8),
+    ("recommendation", np.uint8),
+    ("style", np.uint8),
+    ("reasons", np.uint8, (MAX_REASONS,)),
+    ("bis_refs", np.uint8, (MAX_REFS,)),
+])
+
+
+class Codebook:
+    """Interned strings for one column; a string's code is its position."""
+
+    def __init__(self, values=()):
+        self.values = list(values)
+        self._codes = {v: i for i, v in enumerate(self.values)}
+
+    def code(self, value):
+        code = self._codes.get(value)
+        if code is None:
+            code = len(self.values)
+            if code >= NONE:
+                raise ValueError(f"more than {NONE} distinct values in one column")
+            self.values.append(value)
+            self._codes[value] = code
+        return code
+
+    def find(self, value):
+        """Code of value, or None when it has never been stored."""
+        return self._codes.get(value)
+
+
+# ==================================================
+# COLUMNAR STORE
+# ==================================================
+class ResultColumns:
+    """Growable NumPy structured array of encoded SafetyResults.
+
+    Results are expanded back into SafetyResult objects only by decode();
+    counts and filters run over the integer columns. Matched keywords come
+    back in SAFETY_FAMILIES order, as the matcher reports them.
+    """
+
+    def __init__(self, capacity=1024):
+        self.records = np.zeros(capacity, dtype=RESULT_DTYPE)
+        self.size = 0
+        self.ids = None
+        self.codebooks = {name: Codebook() for name in (*TEXT_FIELDS, *LIST_FIELDS)}
+        self._text_memo = {}
+
+    def __len__(self):
+        return self.size
+
+    @property
+    def columns(self):
+        return self.records[:self.size]
+
+    # ================= ENCODE =================
+    def _encode(self, result):
+        families = keywords = 0
+        for family, words in result.matched.items():
+            families |= _FAMILY_BIT[family]
+            for word in words:
+                keywords |= 1 << _KEYWORD_BIT[family, word]
+
+        # Results repeat a few dozen text combinations - code each once.
+        text = (
+            result.category, result.safety_status, result.confidence,
+            result.recommendation, result.style, result.reasons, result.bis_refs,
+        )
+        codes = self._text_memo.get(text)
+        if codes is None:
+            books = self.codebooks
+            codes = [books[name].code(value) for name, value in zip(TEXT_FIELDS, text)]
+            for name, values, width in (
+                ("reasons", result.reasons, MAX_REASONS),
+                ("bis_refs", result.bis_refs, MAX_REFS),
+            ):
+                listed = [books[name].code(v) for v in values]
+                codes.append(listed + [NONE] * (width - len(listed)))
+            codes = self._text_memo[text] = tuple(codes)
+
+        words = [keywords >> (64 * i) & _WORD_MASK for i in range(_KEYWORD_WORDS)]
+        return (families, words, *codes)
+
+    def _reserve(self, n):
+        if self.size + n > len(self.records):
+            self.records = np.resize(self.records, max(1024, 2 * len(self.records), self.size + n))
+
+    def append(self, result):
+        self._reserve(1)
+        self.records[self.size] = self._encode(result)
+        self.size += 1
+
+    def extend(self, results):
+        # One array build per batch is far cheaper than row-by-row writes.
+        rows = np.array([self._encode(r) for r in results], dtype=RESULT_DTYPE)
+        self._reserve(len(rows))
+        self.records[self.size:self.size + len(rows)] = rows
+        self.size += len(rows)
+
+    # ================= DECODE =================
+    def decode(self, i):
+        row = self.columns[i]
+        bits = [int(word) for word in row["keywords"]]
+        matched = {}
+        for bit, (family, word) in enumerate(KEYWORDS):
+            if bits[bit // 64] >> (bit % 64) & 1:
+                matched.setdefault(family, []).append(word)
+
+        fields = {name: self.codebooks[name].values[row[name]] for name in TEXT_FIELDS}
+        for name in LIST_FIELDS:
+            values = self.codebooks[name].values
+            fields[name] = tuple(values[c] for c in row[name] if c != NONE)
+        return SafetyResult(matched={f: tuple(w) for f, w in matched.items()}, **fields)
+
+    # ================= VECTORIZED QUERIES =================
+    def mask(self, family=None, **equals):
+        """Boolean row mask, e.g. mask(category=..., safety_status="🔴 High Risk")
+        or mask(family="EXTREME_CLAIMS")."""
+        cols = self.columns
+        keep = np.ones(self.size, dtype=bool)
+        if family is not None:
+            keep &= (cols["families"] & (1 << FAMILIES.index(family))) != 0
+        for name, value in equals.items():
+            code = self.codebooks[name].find(value)
+            if code is None:
+                return np.zeros(self.size, dtype=bool)
+            keep &= cols[name] == code
+        return keep
+
+    def count(self, family=None, **equals):
+        return int(np.count_nonzero(self.mask(family, **equals)))
+
+    def crosstab(self, rows="category", cols="safety_status"):
+        """{row value: {column value: count}} from one bincount."""
+        row_values = self.codebooks[rows].values
+        col_values = self.codebooks[cols].values
+        width = max(len(col_values), 1)
+        pairs = self.columns[rows].astype(np.int64) * width + self.columns[cols]
+        counts = np.bincount(pairs, minlength=len(row_values) * width).reshape(-1, width)
+        return {
+            r: {c: int(counts[i, j]) for j, c in enumerate(col_values)}
+            for i, r in enumerate(row_values)
+        }
+
+    # ================= FILE FORMAT =================
+    def save(self, path, ids=None):
+        """Write the records, string tables and optional row ids to a .npz
+        file (no pickles)."""
+        books = {name: book.values for name, book in self.codebooks.items()}
+        extra = {} if ids is None else {"ids": np.asarray([str(i) for i in ids])}
+        np.savez_compressed(
+            path,
+            records=self.columns,
+            codebooks=np.array(json.dumps({"keywords": KEYWORDS, **books})),
+            **extra,
+        )
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path, allow_pickle=False) as data:
+            books = json.loads(str(data["codebooks"]))
+            records = data["records"]
+            ids = data["ids"] if "ids" in data else None
+        if [tuple(pair) for pair in books.pop("keywords")] != KEYWORDS:
+            raise ValueError(f"{path} was written with a different keyword library")
+        store = cls(capacity=0)
+        store.records = records
+        store.size = len(records)
+        store.codebooks = {name: Codebook(values) for name, values in books.items()}
+        store.ids = ids
+        return store
@@ -0,0 +1,27 @@
+# ==================================================
+# BRAND CHECK PRODUCT TYPES
+# ==================================================
+PRODUCT_TYPES = [
+    "Not sure",
+    "Electrical appliance",
+    "Electronic accessory (charger, adapter)",
+    "Child product / Toy",
+    "Kitchen appliance",
+    "Other"
+]
+
+# ==================================================
+# WHICH bis_rules.csv ROW SUPPLIES EACH STANDARD
+# ==================================================
+FAMILY_RULES = {
+    "ELECTRICAL": "electrical",
+    "CHILD": "toy",
+    "WATER": "ip rating",
+}
+
+PRODUCT_TYPE_RULES = {
+    "Electrical appliance": "electrical",
+    "Electronic accessory (charger, adapter)": "charger",
+    "Child product / Toy": "toy",
+    "Kitchen appliance": "household appliance",
+}
@@ -0,0 +1,149 @@
+import os
+import time
+import uuid
+from collections import OrderedDict
+from functools import partial
+
+from compliance.batch import chunked, map_chunks
+from compliance.engine import SafetyResult
+from compliance.matcher import SAFETY_MATCHER
+from compliance.rules import REGISTRY
+from compliance.verdicts import family_mask, verdict_table
+
+# ==================================================
+# NEAR-DUPLICATE KEY (WHAT THE MATCHER CAN SEE)
+# ==================================================
+# Variants of one product ("charger, black, pack of 2" / "charger, white,
+# pack of 3") differ only in words that are not part of any keyword. The
+# matcher never looks at those words, only at the keyword tokens in order
+# and at whether neighbours are adjacent, so the key is exactly that. It
+# groups such variants together and, because the scan depends on nothing
+# else, also proves that a group's verdict is right for every member.
+def near_duplicate_key(candidates):
+    """Key of a listing from SAFETY_MATCHER.candidates(text): its keyword
+    tokens one space apart, two where other words sat between."""
+    parts = []
+    prev = -2
+    for i, tok in candidates:
+        if i != prev + 1:
+            parts.append(b"")
+        parts.append(tok)
+        prev = i
+    return b" ".join(parts)
+
+
+# ==================================================
+# GROUPS (BOUNDED, LEAST RECENTLY USED DROPPED FIRST)
+# ==================================================
+class NearDuplicates:
+    """Near-duplicate groups seen by one process during one run.
+
+    The first listing of a group is evaluated; later ones reuse its
+    SafetyResult. At most capacity groups are remembered, so memory stays
+    flat however long the catalog is. A new rules version starts over.
+    """
+
+    def __init__(self, capacity=65536, run=None):
+        self.capacity = capacity
+        self.run = run
+        self.version = None
+        self._groups = OrderedDict()  # key -> SafetyResult
+        self.listings = 0
+        self.reused = 0
+        self.dropped = 0
+        self.evaluated_seconds = 0.0
+        self.reused_seconds = 0.0
+
+    def __len__(self):
+        return len(self._groups)
+
+    def evaluate(self, chunk):
+        """(listing_id, SafetyResult) pairs, like batch.evaluate_chunk()."""
+        rules = REGISTRY.snapshot()
+        if rules.version != self.version:
+            self._groups.clear()
+            self.version = rules.version
+        table = verdict_table(rules)
+        groups = self._groups
+        candidates = SAFETY_MATCHER.candidates
+        scan = SAFETY_MATCHER.scan_candidates
+        clock = time.perf_counter
+
+        results = []
+        for listing_id, text in chunk:
+            start = clock()
+            found = candidates(text)
+            key = near_duplicate_key(found)
+            result = groups.get(key)
+            if result is not None:
+                groups.move_to_end(key)
+                self.reused += 1
+                self.reused_seconds += clock() - start
+            else:
+                hits = scan(found)
+                result = groups[key] = SafetyResult(
+                    *table[family_mask(hits)],
+                    matched={family: tuple(words) for family, words in hits.items()},
+                )
+                if len(groups) > self.capacity:
+                    groups.popitem(last=False)
+                    self.dropped += 1
+                self.evaluated_seconds += clock() - start
+            results.append((listing_id, result))
+        self.listings += len(results)
+        return results
+
+    def counters(self):
+        return (self.listings, self.reused, self.dropped, self.evaluated_seconds, self.reused_seconds)
+
+
+class DedupeReport:
+    """Counters of every process of one run."""
+
+    def __init__(self, capacity=65536):
+        self.capacity = capacity
+        self.processes = {}  # pid -> its latest NearDuplicates.counters()
+
+    def update(self, pid, counters):
+        self.processes[pid] = counters
+
+    def __str__(self):
+        listings, reused, dropped, evaluated_seconds, reused_seconds = (
+            sum(column) for column in zip((0, 0, 0, 0.0, 0.0), *self.processes.values())
+        )
+        evaluated = listings - reused
+        per_evaluated = evaluated_seconds / evaluated if evaluated else 0.0
+        per_reused = reused_seconds / reused if reused else 0.0
+        return (
+            f"Near-duplicates: {reused} of {listings} listings reused a group's verdict "
+            f"({reused / listings if listings else 0:.1%}) in {len(self.processes)} "
+            f"process(es), {dropped} groups dropped at capacity {self.capacity}; "
+            f"{per_evaluated * 1e6:.1f} us per evaluated listing, "
+            f"{per_reused * 1e6:.1f} us per reused one, "
+            f"~{reused * (per_evaluated - per_reused):.2f}s saved"
+        )
+
+
+_GROUPS = NearDuplicates()
+
+
+def screen_chunk_deduplicated(run, capacity, chunk):
+    """evaluate_chunk() for one worker, keeping its groups across the
+    chunks of a run. Returns (pairs, (pid, counters))."""
+    global _GROUPS
+    if _GROUPS.run != run:
+        _GROUPS = NearDuplicates(capacity, run)
+    return _GROUPS.evaluate(chunk), (os.getpid(), _GROUPS.counters())
+
+
+def screen_deduplicated(listings, report, workers=None, chunk_size=1000):
+    """Yield (listing_id, SafetyResult) in input order. Each worker process
+    evaluates one listing per near-duplicate group it sees."""
+    global _GROUPS
+    screen = partial(screen_chunk_deduplicated, uuid.uuid4().hex, report.capacity)
+    try:
+        for results, (pid, counters) in map_chunks(screen, chunked(listings, chunk_size), workers):
+            report.update(pid, counters)
+            yield from results
+    finally:
+        _GROUPS = NearDuplicates()  # don't hold on to this run's results in-process
@@ -0,0 +1,424 @@
+import html
+from dataclasses import asdict, dataclass, field
+
+from compliance import artifact
+from compliance.answers import ANSWERS
+from compliance.brands import BRANDS
+from compliance.cache import MISSING, LRUCache, normalize_text
+from compliance.data import PRODUCT_TYPE_RULES
+from compliance.keywords import QUESTION_SIGNALS
+from compliance.knowledge import KNOWLEDGE
+from compliance.licences import Licence, open_default_index
+from compliance.matcher import SAFETY_MATCHER, char_spans
+from compliance.metrics import METRICS
+from compliance.rules import REGISTRY
+from compliance.store import content_key, open_default_store
+from compliance.verdicts import family_mask, verdict_table
+
+# ==================================================
+# RESULT OBJECTS (RENDERED BY app.py, NEVER BUILT THERE)
+# ==================================================
+@dataclass(frozen=True)
+class SafetyResult:
+    category: str
+    safety_status: str
+    confidence: str
+    recommendation: str
+    style: str
+    reasons: tuple
+    bis_refs: tuple
+    matched: dict = field(default_factory=dict)
+
+    def to_dict(self):
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data):
+        data = dict(data)
+        data["reasons"] = tuple(data["reasons"])
+        data["bis_refs"] = tuple(data["bis_refs"])
+        data["matched"] = {f: tuple(words) for f, words in data["matched"].items()}
+        return cls(**data)
+
+
+@dataclass(frozen=True)
+class BrandResult:
+    brand: str
+    model: str
+    product_type: str
+    brand_status: str
+    brand_note: str
+    style: str
+    bis_rule: str
+    risk_note: str
+    model_note: str
+    compliance_verdict: str
+    final_guidance: str
+    suggestions: tuple = ()
+    licences: tuple = ()
+
+    def to_dict(self):
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data):
+        data = dict(data)
+        data["suggestions"] = tuple(data.get("suggestions", ()))
+        data["licences"] = tuple(Licence(**l) for l in data.get("licences", ()))
+        return cls(**data)
+
+
+@dataclass(frozen=True)
+class QuestionResult:
+    intent: str
+    signals: dict
+    style: str
+    answer: str
+    brands: tuple = ()
+    related: tuple = ()
+
+    def to_dict(self):
+        return asdict(self)
+
+
+# ==================================================
+# PRODUCT SAFETY EVALUATION
+# ==================================================
+def evaluate_product(text, rules=None, spans=None):
+    lap = METRICS.laps("safety")
+    rules = rules or REGISTRY.snapshot()
+    hits = SAFETY_MATCHER.scan(text, spans)
+    lap("keyword_scan")
+
+    # Every rule branch is precomputed per family combination (verdicts.py).
+    verdict = verdict_table(rules)[family_mask(hits)]
+    result = SafetyResult(
+        *verdict,
+        matched={family: tuple(words) for family, words in hits.items()},
+    )
+    lap("verdict_lookup")
+    return result
+
+
+def explain_product(text, rules=None):
+    """(SafetyResult, spans) from one keyword scan. spans are (start, end,
+    keyword, family) with text[start:end] the phrase that matched."""
+    tokens = []
+    result = evaluate_product(text, rules, tokens)
+    return result, char_spans(text, tokens)
+
+
+# Identical listings get pasted over and over - share verdicts across
+# sessions, keyed by normalized text and dropped when the rules change.
+# With BIS_RESULT_DB set, misses fall through to an on-disk store shared
+# by every replica on the host.
+SAFETY_CACHE = LRUCache(maxsize=4096, ttl=600.0)
+# The Product Safety page also shows where each keyword matched; offsets
+# differ between texts that normalize alike, so these key on exact text.
+EXPLAIN_CACHE = LRUCache(maxsize=4096, ttl=600.0)
+BRAND_CACHE = LRUCache(maxsize=4096, ttl=600.0)
+STORE = open_default_store()
+LICENCES = open_default_index()
+
+METRICS.register("safety_cache", SAFETY_CACHE.stats)
+METRICS.register("explain_cache", EXPLAIN_CACHE.stats)
+METRICS.register("brand_cache", BRAND_CACHE.stats)
+METRICS.register("artifact", artifact.status)
+if STORE is not None:
+    METRICS.register("result_store", STORE.stats)
+
+
+def _cached(cache, kind, key, version, compute, result_type):
+    result = cache.get(key, version)
+    if result is MISSING:
+        if STORE is None:
+            result = compute()
+        else:
+            result = STORE.get_or_compute(
+                content_key(kind, version, key),
+                kind,
+                compute,
+                result_type.to_dict,
+                result_type.from_dict,
+            )
+        cache.put(key, result, version)
+    return result
+
+
+def evaluate_product_cached(text):
+    rules = REGISTRY.snapshot()
+    return _cached(
+        SAFETY_CACHE,
+        "safety",
+        normalize_text(text),
+        rules.version,
+        lambda: evaluate_product(text, rules),
+        SafetyResult,
+    )
+
+
+class _Explained:
+    """(SafetyResult, spans) as stored in the shared result store."""
+
+    @staticmethod
+    def to_dict(explained):
+        result, spans = explained
+        return {"result": result.to_dict(), "spans": [list(span) for span in spans]}
+
+    @staticmethod
+    def from_dict(data):
+        return SafetyResult.from_dict(data["result"]), [tuple(span) for span in data["spans"]]
+
+
+def explain_product_cached(text):
+    rules = REGISTRY.snapshot()
+    return _cached(
+        EXPLAIN_CACHE,
+        "explain",
+        text,
+        rules.version,
+        lambda: explain_product(text, rules),
+        _Explained,
+    )
+
+
+# ==================================================
+# BRAND & MODEL COMPLIANCE CHECK
+# ==================================================
+def check_brand(brand, model="", product_type="Not sure", rules=None):
+    lap = METRICS.laps("brand")
+    rules = rules or REGISTRY.snapshot()
+    entry = BRANDS.lookup(brand)
+    status = entry.status if entry else None
+    suggestions = ()
+
+    # ================= BRAND RECOGNITION =================
+    if status == "approved":
+        brand_status = "🟢 Widely recognized Indian brand"
+        brand_note = (
+            "This brand is widely recognized in the Indian market and is known to "
+            "manufacture BIS-certified products in multiple categories."
+        )
+        style = "ok"
+
+    elif status == "disapproved":
+        brand_status = "🔴 Brand associated with misleading or unsafe claims"
+        brand_note = (
+            "This brand has been reported for unsafe or misleading practices. "
+            "Consumers are strongly advised to avoid such products."
+        )
+        style = "bad"
+
+    else:
+        brand_status = "🟡 Brand not found in common consumer registry"
+        brand_note = (
+            "This brand may be new, imported, or less documented. "
+            "Careful BIS verification is required before purchase."
+        )
+        style = "warn"
+        # Most misses are typos of a registered brand - offer the closest ones.
+        suggestions = tuple(e.name for e, _ in BRANDS.suggest(brand, limit=3))
+    lap("brand_recognition")
+
+    # ================= PRODUCT TYPE → BIS STANDARD =================
+    bis_rule = rules.reference(PRODUCT_TYPE_RULES.get(product_type, ""))
+
+    if product_type == "Electrical appliance":
+        risk_note = "Risk of electric shock, fire, or overheating if uncertified."
+
+    elif product_type == "Electronic accessory (charger, adapter)":
+        risk_note = "Overheating and electrical hazard risk if uncertified."
+
+    elif product_type == "Child product / Toy":
+        risk_note = "High safety risk due to child usage."
+
+    elif product_type == "Kitchen appliance":
+        risk_note = "Fire and electrical hazard if standards are not met."
+
+    else:
+        risk_note = "Exact safety rule must be confirmed."
+
+    if not bis_rule:
+        bis_rule = "Applicable BIS standard depends on exact product category"
+    lap("bis_rule")
+
+    # ================= MODEL-LEVEL INSIGHT =================
+    licences = demo = ()
+    if LICENCES is not None and model.strip():
+        found = LICENCES.find(brand, model)
+        # Sample rows are examples: never a verified model.
+        licences = tuple(l for l in found if not l.demo)
+        demo = tuple(l for l in found if l.demo)
+    lap("licence_lookup")
+
+    # model_note is HTML; the model number is whatever the user typed.
+    shown = html.escape(model)
+    if licences:
+        model_note = (
+            f"The model you entered (<b>{shown}</b>) appears in the BIS licence index:<br><br>"
+            + "<br>".join(
+                f"• <b>{l.cml}</b> – {l.brand} {l.model} ({l.standard})" for l in licences
+            )
+            + "<br><br>Make sure the same CM/L number is printed next to the BIS mark."
+        )
+    elif demo:
+        model_note = (
+            f"The model you entered (<b>{shown}</b>) is only in the demo sample "
+            "(FOR AWARENESS PURPOSES). Its DEMO-CML number is <b>not a real BIS "
+            "licence</b>.<br><br>"
+            "Important points:<br>"
+            "• BIS certification is issued per product model<br>"
+            "• Always verify the BIS mark and license number printed on the product"
+        )
+    elif model.strip():
+        model_note = (
+            f"The model you entered (<b>{shown}</b>) must have its "
+            "<b>own BIS CM/L license</b>.<br><br>"
+            "Important points:<br>"
+            "• BIS certification is issued per product model<br>"
+            "• Brand reputation alone does not guarantee safety<br>"
+            "• Always verify the BIS mark and license number printed on the product"
+        )
+    else:
+        model_note = (
+            "No model number provided.<br><br>"
+            "Why this matters:<br>"
+            "• BIS certification cannot be confirmed without a model number<br>"
+            "• Unsafe products often hide or omit model information"
+        )
+
+    # ================= FINAL COMPLIANCE VERDICT =================
+    if status == "disapproved":
+        compliance_verdict = "❌ NON-COMPLIANT – HIGH CONSUMER RISK"
+        final_guidance = "Avoid purchasing this product."
+
+    elif licences:
+        compliance_verdict = "✅ MODEL LICENCE FOUND"
+        final_guidance = (
+            f"Buy only if the product shows licence {licences[0].cml} "
+            "with the BIS Standard Mark."
+        )
+        style = "ok"
+
+    elif status == "approved" and model.strip():
+        compliance_verdict = "⚠️ BRAND VERIFIED – MODEL NOT VERIFIED"
+        final_guidance = (
+            "You may consider this brand, but verify the model’s BIS license "
+            "before purchase."
+        )
+
+    elif status == "approved":
+        compliance_verdict = "⚠️ BRAND VERIFIED – MODEL INFORMATION MISSING"
+        final_guidance = "Check the exact model number printed on the product."
+
+    else:
+        compliance_verdict = "⚠️ COMPLIANCE STATUS UNKNOWN"
+        final_guidance = "Proceed only after careful BIS verification."
+    lap("final_determination")
+
+    return BrandResult(
+        brand=brand,
+        model=model,
+        product_type=product_type,
+        brand_status=brand_status,
+        brand_note=brand_note,
+        style=style,
+        bis_rule=bis_rule,
+        risk_note=risk_note,
+        model_note=model_note,
+        compliance_verdict=compliance_verdict,
+        final_guidance=final_guidance,
+        suggestions=suggestions,
+        licences=licences,
+    )
+
+
+def check_brand_cached(brand, model="", product_type="Not sure"):
+    rules = REGISTRY.snapshot()
+    # A re-imported licence index changes model verdicts just like new rules.
+    version = rules.version if LICENCES is None else f"{rules.version}:{LICENCES.version}"
+    return _cached(
+        BRAND_CACHE,
+        "brand",
+        (brand, model, product_type),
+        version,
+        lambda: check_brand(brand, model, product_type, rules),
+        BrandResult,
+    )
+
+
+# ================= AUTOCOMPLETE =================
+def complete_brand(prefix, limit=8):
+    return [entry.name for entry in BRANDS.complete(prefix, limit)]
+
+
+def complete_model(brand, prefix, limit=8):
+    if LICENCES is None or not brand.strip():
+        return []
+    return LICENCES.complete(brand, prefix, limit)
+
+
+# ==================================================
+# ASSISTANT QUESTION CLASSIFICATION
+# ==================================================
+def question_signals(q, mentions=None):
+    if mentions is None:
+        mentions = BRANDS.mentions(q)
+    q = q.lower().strip()
+    # Whole-word brand mentions - "mi" in "premium" or "lg" in "bulge" no longer count.
+    signals = {"brand": any(m.entry.status == "approved" for m in mentions)}
+    for name, words in QUESTION_SIGNALS.items():
+        signals[name] = any(w in q for w in words)
+    return signals
+
+
+# Below this BM25 score a retrieved answer is a guess, not a match.
+MIN_ANSWER_SCORE = 1.0
+
+
+def classify_question(question):
+    lap = METRICS.laps("question")
+    mentions = BRANDS.mentions(question)
+    signals = question_signals(question, mentions)
+    lap("signals")
+
+    # Priority order matters: a fake BIS mark outranks everything else.
+    if signals["fake"]:
+        intent = "fake"
+    elif signals["buy"] and signals["electrical"]:
+        intent = "buy_electrical"
+    elif signals["brand"] and signals["bis"]:
+        intent = "brand_bis"
+    elif signals["child"]:
+        intent = "child"
+    elif signals["eco"]:
+        intent = "eco"
+    elif signals["cheap"]:
+        intent = "cheap"
+    elif signals["complaint"]:
+        intent = "complaint"
+    elif signals["bis"]:
+        intent = "bis"
+    else:
+        intent = "fallback"
+
+    style, answer = ANSWERS[intent]
+
+    # ================= KNOWLEDGE BASE RETRIEVAL =================
+    # The signal chain keeps priority; retrieval answers what it cannot
+    # place and offers related reading either way.
+    hits = KNOWLEDGE.search(question, k=4)
+    if intent == "fallback" and hits and hits[0].score >= MIN_ANSWER_SCORE:
+        intent = hits[0].document.doc_id
+        style, answer = hits[0].document.style, hits[0].document.body
+    related = tuple(h for h in hits if h.document.doc_id != intent)[:3]
+    lap("retrieval")
+
+    return QuestionResult(
+        intent=intent,
+        signals=signals,
+        style=style,
+        answer=answer,
+        brands=tuple(dict.fromkeys(m.entry.name for m in mentions)),
+        related=related,
+    )
@@ -0,0 +1,307 @@
+import hashlib
+import json
+import os
+import sys
+from collections import deque
+from functools import cached_property
+
+import numpy as np
+
+from compliance.batch import chunked, evaluate_chunk, map_chunks, screen_catalog
+from compliance.engine import SafetyResult
+from compliance.keywords import SAFETY_FAMILIES
+from compliance.matcher import _fold, plural_forms, tokenize
+from compliance.postings import IndexBuilder, ListingIndex, intersect, merge, union
+from compliance.rules import REGISTRY
+from compliance.verdicts import family_mask, verdict_table
+
+# ==================================================
+# SCREENING STATE (WHAT A RE-RUN NEEDS TO SKIP WORK)
+# ==================================================
+# Per listing: its id, a hash of its text and the keywords it matched,
+# as bits over the keyword library of that run. Plus an index from text
+# token to listings, so listings that could match a newly added keyword
+# are found without reading any text. A change to bis_rules.csv alone
+# needs no rescan: verdicts are rebuilt from the stored matches.
+STATE_FORMAT = 1
+
+_MATCHER_SOURCE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "matcher.py")
+
+
+def matcher_fingerprint():
+    """Hash of the tokenizer / matching code; any change means a full re-run."""
+    with open(_MATCHER_SOURCE, "rb") as f:
+        return hashlib.blake2b(f.read(), digest_size=8).hexdigest()
+
+
+def library():
+    return [(family, word) for family, words in SAFETY_FAMILIES.items() for word in words]
+
+
+def text_hash(text):
+    return int.from_bytes(hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def _index_token(tok):
+    # The matcher lets a word run into a number ("IPX7"), so index the
+    # word part; a pure number stays as it is.
+    return tok.rstrip("0123456789") or tok if tok[-1].isdigit() else tok
+
+
+def listing_tokens(text):
+    # Same folding as matcher.tokenize, split once as str and deduplicated
+    # before the per-token work.
+    tokens = set(_fold(text.encode("utf-8")).decode("ascii").split())
+    numbered = [tok for tok in tokens if tok[-1].isdigit()]
+    if numbered:
+        tokens.difference_update(numbered)
+        tokens.update(_index_token(tok) for tok in numbered)
+    return tokens
+
+
+class ScreeningState:
+    def __init__(self, ids, hashes, bits, keywords, tokens, matcher):
+        self.ids = ids
+        self.hashes = hashes
+        self.bits = bits  # (listings, words) uint64 over keywords
+        self.keywords = keywords
+        self.tokens = tokens  # ListingIndex of text tokens
+        self.matcher = matcher
+
+    def __len__(self):
+        return len(self.ids)
+
+    @cached_property
+    def rows(self):
+        return self.bits.tolist()
+
+    def matched(self, number):
+        """{family: (keywords,)} for one listing, in library order."""
+        matched = {}
+        for w, word in enumerate(self.rows[number]):
+            while word:
+                low = word & -word
+                family, keyword = self.keywords[64 * w + low.bit_length() - 1]
+                matched.setdefault(family, []).append(keyword)
+                word ^= low
+        return {family: tuple(words) for family, words in matched.items()}
+
+    def with_keyword(self, pair):
+        """Listings whose stored matches include this (family, keyword)."""
+        try:
+            bit = self.keywords.index(pair)
+        except ValueError:
+            return np.empty(0, dtype=np.uint32)
+        column = self.bits[:, bit // 64]
+        return np.flatnonzero((column >> np.uint64(bit % 64)) & np.uint64(1)).astype(np.uint32)
+
+    def could_match(self, keyword):
+        """Listings containing every token of keyword (the last one in any
+        plural form) - a superset of the listings it matches."""
+        tokens = tokenize(keyword)
+        if not tokens:
+            return np.empty(0, dtype=np.uint32)
+        universe = len(self)
+        last = np.empty(0, dtype=np.uint32)
+        for form in plural_forms(tokens[-1]):
+            last = union(last, self.tokens.postings(_index_token(form.decode())), universe)
+        found = last
+        for tok in tokens[:-1]:
+            found = intersect(found, self.tokens.postings(_index_token(tok.decode())), universe)
+        return found
+
+    # ================= FILE FORMAT =================
+    def save(self, path):
+        # Through a file object: np.savez would add ".npz" to a bare path.
+        with open(path, "wb") as f:
+            np.savez(
+                f,
+                meta=np.array(json.dumps({
+                    "format": STATE_FORMAT,
+                    "matcher": self.matcher,
+                    "keywords": self.keywords,
+                    "tokens": list(self.tokens.terms),
+                })),
+                ids=self.ids,
+                hashes=self.hashes,
+                bits=self.bits,
+                token_directory=self.tokens.directory,
+                token_blob=np.frombuffer(self.tokens.blob, dtype=np.uint8),
+            )
+
+    @classmethod
+    def load(cls, path):
+        """The saved state, or None when it is missing or was written by
+        other matching code."""
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                meta = json.loads(str(data["meta"]))
+                if meta.get("format") != STATE_FORMAT or meta.get("matcher") != matcher_fingerprint():
+                    return None
+                ids = data["ids"]
+                tokens = ListingIndex(meta["tokens"], data["token_directory"], data["token_blob"].tobytes(), ids)
+                return cls(
+                    ids, data["hashes"], data["bits"],
+                    [tuple(pair) for pair in meta["keywords"]], tokens, meta["matcher"],
+                )
+        except (OSError, ValueError, KeyError):
+            return None
+
+
+class _StateBuilder:
+    """The next state, listing by listing. Listings whose text is unchanged
+    keep their token postings from the previous state instead of being
+    tokenized again."""
+
+    def __init__(self, previous=None):
+        self.previous = previous
+        self.keywords = library()
+        self._bit = {pair: i for i, pair in enumerate(self.keywords)}
+        self._width = (len(self.keywords) + 63) // 64
+        self.ids = []
+        self.hashes = []
+        self.bits = []
+        self._tokens = IndexBuilder()  # listings tokenized in this run
+        self._tokenized = []  # their listing numbers
+        self._kept = []  # (listing number, number in previous state)
+
+    def add(self, listing_id, hashed):
+        self.ids.append(str(listing_id))
+        self.hashes.append(hashed)
+
+    def add_tokens(self, text):
+        self._tokenized.append(len(self.ids) - 1)
+        self._tokens.add(self.ids[-1], listing_tokens(text))
+
+    def keep_tokens(self, old_number):
+        self._kept.append((len(self.ids) - 1, old_number))
+
+    def add_bits(self, row):
+        self.bits.append(row)
+
+    def add_result(self, result):
+        bits = 0
+        for family, words in result.matched.items():
+            for word in words:
+                bits |= 1 << self._bit[family, word]
+        self.bits.append([bits >> (64 * w) & 0xFFFFFFFFFFFFFFFF for w in range(self._width)])
+
+    def build(self):
+        ids = np.asarray(self.ids)
+        tokenized = np.asarray(self._tokenized, dtype=np.int64)
+        if not self._kept:
+            tokens = self._tokens.build()
+            tokens.ids = ids
+        else:
+            kept = np.full(len(self.previous), -1, dtype=np.int64)
+            for number, old_number in self._kept:
+                kept[old_number] = number
+            tokens = merge([(self._tokens.build(), tokenized), (self.previous.tokens, kept)], ids)
+        return ScreeningState(
+            ids,
+            np.asarray(self.hashes, dtype=np.uint64),
+            np.asarray(self.bits, dtype=np.uint64).reshape(-1, self._width),
+            self.keywords,
+            tokens,
+            matcher_fingerprint(),
+        )
+
+
+# ==================================================
+# INCREMENTAL SCREENING
+# ==================================================
+def affected(state):
+    """(listing numbers to re-evaluate, added keywords, removed keywords)
+    for the current keyword library against the one state was built with."""
+    old, new = set(state.keywords), set(library())
+    added, removed = sorted(new - old), sorted(old - new)
+    universe = len(state)
+    numbers = np.empty(0, dtype=np.uint32)
+    for pair in removed:
+        numbers = union(numbers, state.with_keyword(pair), universe)
+    for _, keyword in added:
+        numbers = union(numbers, state.could_match(keyword), universe)
+    return numbers, added, removed
+
+
+def screen_incremental(listings, state_path, workers=None, chunk_size=1000, report=sys.stderr):
+    """Yield (listing_id, SafetyResult) in input order, re-evaluating only
+    listings that are new, edited, or could be affected by keyword-library
+    changes since the last run; then save the new state to state_path."""
+    state = ScreeningState.load(state_path)
+    builder = _StateBuilder(state)
+
+    if state is None:
+        def recorded(items):
+            for listing_id, text in items:
+                builder.add(listing_id, text_hash(text))
+                builder.add_tokens(text)
+                yield listing_id, text
+
+        for listing_id, result in screen_catalog(recorded(listings), workers, chunk_size, evaluate_chunk):
+            builder.add_result(result)
+            yield listing_id, result
+        builder.build().save(state_path)
+        print(f"Full run: evaluated {len(builder.ids)} listings, state saved to {state_path}", file=report)
+        return
+
+    numbers, added, removed = affected(state)
+    stale = set(numbers.tolist())
+    previous = {listing_id: n for n, listing_id in enumerate(state.ids.tolist())}
+    hashes = state.hashes.tolist()
+    same_library = state.keywords == builder.keywords
+    rules = REGISTRY.snapshot()
+    table = verdict_table(rules)
+
+    evaluated = carried = 0
+    plans = deque()  # per chunk: (listing_id, carried-over result or None)
+
+    def planned(chunks):
+        # Decide per listing in the parent; only what must be evaluated
+        # goes to the workers.
+        for chunk in chunks:
+            plan, stale_listings = [], []
+            for listing_id, text in chunk:
+                hashed = text_hash(text)
+                builder.add(listing_id, hashed)
+                n = previous.get(str(listing_id))
+                unchanged = n is not None and hashes[n] == hashed
+                if unchanged:
+                    builder.keep_tokens(n)
+                else:
+                    builder.add_tokens(text)
+                if not unchanged or n in stale:
+                    plan.append((listing_id, None))
+                    stale_listings.append((listing_id, text))
+                else:
+                    plan.append((listing_id, n))
+            plans.append(plan)
+            yield stale_listings
+
+    for results in map_chunks(evaluate_chunk, planned(chunked(listings, chunk_size)), workers):
+        results = iter(results)
+        for listing_id, n in plans.popleft():
+            if n is None:
+                _, result = next(results)
+                builder.add_result(result)
+                evaluated += 1
+            else:
+                # Same text, no keyword change that can touch it: reuse the
+                # stored matches and take the verdict from the current rules.
+                matched = state.matched(n)
+                result = SafetyResult(*table[family_mask(matched)], matched=matched)
+                if same_library:
+                    builder.add_bits(state.rows[n])
+                else:
+                    builder.add_result(result)
+                carried += 1
+            yield listing_id, result
+
+    builder.build().save(state_path)
+    total = evaluated + carried
+    print(
+        f"Incremental run: {len(added)} keyword(s) added, {len(removed)} removed; "
+        f"re-evaluated {evaluated} of {total} listings, carried over {carried} "
+        f"({carried / total if total else 0:.1%} skipped)",
+        file=report,
+    )
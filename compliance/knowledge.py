@@ -0,0 +1,148 @@
+import glob
+import os
+from dataclasses import dataclass
+
+import numpy as np
+
+from compliance import paths
+from compliance.answers import ANSWERS
+from compliance.artifact import load_section
+from compliance.matcher import tokenize
+
+DEFAULT_KNOWLEDGE_DIR = paths.KNOWLEDGE_DIR
+
+_STOPWORDS = frozenset(
+    b"a an and are as at be but by can do does for from has have how i if in is it "
+    b"its me my of on or should so that the this to was what when where which who "
+    b"why will with you your".split()
+)
+
+
+def terms(text):
+    """Index terms: word tokens minus stopwords, with plural endings folded."""
+    out = []
+    for tok in tokenize(text):
+        if tok in _STOPWORDS:
+            continue
+        if len(tok) > 4 and tok.endswith(b"ies"):
+            tok = tok[:-3] + b"y"
+        elif len(tok) > 3 and tok.endswith(b"s") and not tok.endswith(b"ss"):
+            tok = tok[:-1]
+        out.append(tok)
+    return out
+
+
+@dataclass(frozen=True)
+class Document:
+    doc_id: str
+    title: str
+    style: str
+    body: str
+
+
+@dataclass(frozen=True)
+class Hit:
+    document: Document
+    score: float
+
+
+# ==================================================
+# CORPUS (BUILT-IN ANSWERS + knowledge/*.md)
+# ==================================================
+def load_markdown(directory=DEFAULT_KNOWLEDGE_DIR):
+    """One Document per .md file; the first "# " line is its title."""
+    docs = []
+    for path in sorted(glob.glob(os.path.join(directory, "*.md"))):
+        with open(path, encoding="utf-8") as f:
+            text = f.read()
+        title, _, body = text.partition("\n")
+        if title.startswith("# "):
+            title = title[2:].strip()
+        else:
+            title, body = os.path.splitext(os.path.basename(path))[0], text
+        docs.append(Document(os.path.basename(path), title, "card", body.strip()))
+    return docs
+
+
+ANSWER_TITLES = {
+    "fake": "Fake or duplicate BIS mark",
+    "buy_electrical": "Buying electrical products safely",
+    "brand_bis": "Is a known brand automatically BIS certified?",
+    "child": "Child and toy safety",
+    "eco": "Eco-friendly and green claims",
+    "cheap": "Very cheap products",
+    "complaint": "Reporting an unsafe product",
+    "bis": "What BIS certification means",
+}
+
+
+def default_corpus(directory=DEFAULT_KNOWLEDGE_DIR):
+    docs = [
+        Document(intent, ANSWER_TITLES.get(intent, intent), style, answer)
+        for intent, (style, answer) in ANSWERS.items()
+        if intent != "fallback"
+    ]
+    return docs + load_markdown(directory)
+
+
+# ==================================================
+# BM25 INDEX (CSR POSTINGS, QUERY-INDEPENDENT WEIGHTS PRECOMPUTED)
+# ==================================================
+class KnowledgeIndex:
+    """Okapi BM25 over a fixed corpus.
+
+    Each posting stores its final BM25 weight, so a query is one
+    vectorized scatter-add per query term plus a partial sort.
+    """
+
+    def __init__(self, documents, k1=1.2, b=0.75):
+        self.documents = list(documents)
+        vocab = {}
+        rows = []
+        lengths = []
+        for doc_number, doc in enumerate(self.documents):
+            counts = {}
+            doc_terms = terms(f"{doc.title} {doc.body}")
+            for term in doc_terms:
+                counts[term] = counts.get(term, 0) + 1
+            lengths.append(len(doc_terms))
+            for term, tf in counts.items():
+                rows.append((vocab.setdefault(term, len(vocab)), doc_number, tf))
+
+        n_docs = len(self.documents)
+        postings = np.array(rows, dtype=np.int64).reshape(-1, 3)
+        postings = postings[np.lexsort((postings[:, 1], postings[:, 0]))]
+        term_ids, doc_ids, tf = postings[:, 0], postings[:, 1], postings[:, 2].astype(np.float64)
+
+        df = np.bincount(term_ids, minlength=len(vocab))
+        idf = np.log1p((n_docs - df + 0.5) / (df + 0.5))
+        lengths = np.asarray(lengths, dtype=np.float64)
+        norm = k1 * (1 - b + b * lengths / max(lengths.mean(), 1.0)) if n_docs else lengths
+
+        self.vocab = vocab
+        self.indptr = np.concatenate(([0], np.cumsum(df))).astype(np.int64)
+        self.doc_ids = doc_ids.astype(np.int32)
+        self.weights = (idf[term_ids] * tf * (k1 + 1) / (tf + norm[doc_ids])).astype(np.float32)
+
+    def __len__(self):
+        return len(self.documents)
+
+    def search(self, query, k=3):
+        """Top-k Hits for query, best first; documents scoring 0 are left out."""
+        term_ids = {self.vocab[t] for t in terms(query) if t in self.vocab}
+        if not term_ids:
+            return []
+        scores = np.zeros(len(self.documents), dtype=np.float32)
+        for t in term_ids:
+            lo, hi = self.indptr[t], self.indptr[t + 1]
+            # A document appears once per posting list, so plain += is safe.
+            scores[self.doc_ids[lo:hi]] += self.weights[lo:hi]
+
+        k = min(k, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [Hit(self.documents[i], float(scores[i])) for i in top.tolist() if scores[i] > 0]
+
+
+# Built once per process (or loaded prebuilt) and shared by every session.
+KNOWLEDGE = load_section("knowledge", lambda: KnowledgeIndex(default_corpus()))
@@ -0,0 +1,238 @@
+import csv
+import gzip
+import os
+import sqlite3
+import sys
+import threading
+import time
+import weakref
+from dataclasses import dataclass
+
+from compliance import paths
+from compliance.brands import normalize_brand
+
+DEFAULT_LICENCE_DB = paths.LICENCE_DB
+
+LICENCE_COLUMNS = ("brand", "model", "cml", "standard")
+
+# data/licences_sample.csv uses made-up "DEMO-CML-…" numbers.
+DEMO_CML_PREFIX = "DEMO-"
+
+# Model numbers are printed as "EP-TA800", "ep ta800" or "EPTA800" - one key.
+normalize_model = normalize_brand
+
+
+@dataclass(frozen=True)
+class Licence:
+    brand: str
+    model: str
+    cml: str
+    standard: str
+
+    @property
+    def demo(self):
+        """True for sample rows: examples only, never proof of a licence."""
+        return self.cml.upper().startswith(DEMO_CML_PREFIX)
+
+
+# ==================================================
+# BULK IMPORT (REBUILDS THE WHOLE INDEX)
+# ==================================================
+_SCHEMA = """
+CREATE TABLE licences (
+    brand_key TEXT NOT NULL,
+    model_key TEXT NOT NULL,
+    brand     TEXT NOT NULL,
+    model     TEXT NOT NULL,
+    cml       TEXT NOT NULL,
+    standard  TEXT NOT NULL
+);
+"""
+
+# Built after the load - one sort is far cheaper than millions of B-tree inserts.
+_INDEX = "CREATE INDEX licences_model ON licences (brand_key, model_key)"
+
+
+def _open_dump(path):
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt", newline="", encoding="utf-8-sig")
+    return open(path, newline="", encoding="utf-8-sig")
+
+
+def read_licences(path):
+    """Yield index rows from a CSV dump with brand, model, cml and standard columns."""
+    with _open_dump(path) as f:
+        rows = csv.reader(f)
+        header = [h.strip().lower() for h in next(rows, [])]
+        missing = set(LICENCE_COLUMNS) - set(header)
+        if missing:
+            raise ValueError(f"licence dump is missing columns: {', '.join(sorted(missing))}")
+        b, m, c, s = (header.index(col) for col in LICENCE_COLUMNS)
+        width = max(b, m, c, s)
+        # A dump has millions of rows but only thousands of brands.
+        brand_keys = {}
+        for row in rows:
+            if len(row) <= width:
+                continue
+            brand, model = row[b].strip(), row[m].strip()
+            brand_key = brand_keys.get(brand)
+            if brand_key is None:
+                brand_key = brand_keys[brand] = normalize_brand(brand)
+            model_key = normalize_model(model)
+            if brand_key and model_key:
+                yield brand_key, model_key, brand, model, row[c].strip(), row[s].strip()
+
+
+def build_index(source, db_path=DEFAULT_LICENCE_DB):
+    """Rebuild db_path from a licence dump and return the number of rows.
+
+    The new index is written next to the old one and swapped in with a
+    rename, so running app processes never see a half-built file.
+    """
+    tmp_path = f"{db_path}.building-{os.getpid()}"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+
+    db = sqlite3.connect(tmp_path)
+    try:
+        # Nothing to recover if the import dies - the old index is untouched.
+        db.execute("PRAGMA journal_mode=OFF")
+        db.execute("PRAGMA synchronous=OFF")
+        db.execute("PRAGMA cache_size=-262144")
+        db.executescript(_SCHEMA)
+        with db:
+            db.executemany("INSERT INTO licences VALUES (?, ?, ?, ?, ?, ?)", read_licences(source))
+        db.execute(_INDEX)
+        db.execute("ANALYZE")
+        count = db.execute("SELECT COUNT(*) FROM licences").fetchone()[0]
+    finally:
+        db.close()
+
+    os.replace(tmp_path, db_path)
+    return count
+
+
+# ==================================================
+# READ-ONLY LOOKUPS (SHARED FILE, NEVER LOADED INTO MEMORY)
+# ==================================================
+class LicenceIndex:
+    """Exact and normalized model lookups against the on-disk licence index.
+
+    Every thread gets its own read-only connection; SQLite pages the parts
+    it needs, so processes share the OS page cache instead of each holding
+    a copy. A rebuilt file is picked up on the next check.
+    """
+
+    def __init__(self, path=DEFAULT_LICENCE_DB, check_interval=1.0):
+        self.path = path
+        self.check_interval = check_interval
+        self._local = threading.local()
+        self._identity = self._stat()
+        self._checked_at = time.monotonic()
+        _OPEN_INDEXES.add(self)
+
+    def _stat(self):
+        st = os.stat(self.path)
+        return st.st_ino, st.st_mtime_ns
+
+    def _refresh(self):
+        if time.monotonic() - self._checked_at >= self.check_interval:
+            self._checked_at = time.monotonic()
+            try:
+                self._identity = self._stat()
+            except OSError:
+                pass
+
+    @property
+    def version(self):
+        # Changes whenever import-licences swaps in a new file.
+        self._refresh()
+        return "%x-%x" % self._identity
+
+    def _connect(self):
+        self._refresh()
+        db = getattr(self._local, "db", None)
+        if db is None or self._local.identity != self._identity:
+            if db is not None:
+                db.close()
+            db = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True, check_same_thread=False)
+            self._local.db = db
+            self._local.identity = self._identity
+        return db
+
+    def find(self, brand, model):
+        """Licences for this brand and model, exact spelling first."""
+        brand_key, model_key = normalize_brand(brand), normalize_model(model)
+        if not brand_key or not model_key:
+            return []
+        rows = self._connect().execute(
+            "SELECT brand, model, cml, standard FROM licences "
+            "WHERE brand_key = ? AND model_key = ?",
+            (brand_key, model_key),
+        ).fetchall()
+        wanted = model.strip().lower()
+        rows.sort(key=lambda r: (r[1].lower() != wanted, r[2]))
+        return [Licence(*row) for row in rows]
+
+    def complete(self, brand, prefix, limit=8):
+        """Licensed model numbers of this brand that start with prefix."""
+        brand_key, model_key = normalize_brand(brand), normalize_model(prefix)
+        if not brand_key:
+            return []
+        # Keys are [a-z0-9] only, so "{" sorts after every key with this prefix.
+        rows = self._connect().execute(
+            "SELECT model_key, MIN(model) FROM licences "
+            "WHERE brand_key = ? AND model_key >= ? AND model_key < ? "
+            "GROUP BY model_key ORDER BY model_key LIMIT ?",
+            (brand_key, model_key, model_key + "{", limit),
+        ).fetchall()
+        return [model for _, model in rows]
+
+    def __len__(self):
+        return self._connect().execute("SELECT COUNT(*) FROM licences").fetchone()[0]
+
+
+_OPEN_INDEXES = weakref.WeakSet()
+
+
+def _after_fork_in_child():
+    # SQLite connections must not cross a fork; workers open their own.
+    for index in list(_OPEN_INDEXES):
+        index._local = threading.local()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
+
+
+def open_default_index():
+    # Model lookups are skipped until import-licences has been run.
+    return LicenceIndex() if os.path.exists(DEFAULT_LICENCE_DB) else None
+
+
+# ==================================================
+# COMMAND LINE
+# ==================================================
+def add_arguments(parser):
+    parser.add_argument(
+        "source", nargs="?", help="licence dump (.csv or .csv.gz) with brand,model,cml,standard"
+    )
+    parser.add_argument(
+        "--demo", action="store_true",
+        help="index the demo sample in data/ instead (DEMO-CML numbers, never shown as verified)",
+    )
+    parser.add_argument("--db", default=DEFAULT_LICENCE_DB, help="index file to (re)build")
+
+
+def run(args):
+    if args.demo == bool(args.source):
+        raise SystemExit("give either a licence dump or --demo")
+    source = paths.LICENCE_SAMPLE if args.demo else args.source
+    start = time.perf_counter()
+    count = build_index(source, args.db)
+    elapsed = time.perf_counter() - start
+    print(
+        f"indexed {count} licences into {args.db} in {elapsed:.1f}s "
+        f"({count / elapsed if elapsed else 0:.0f} rows/s)",
+        file=sys.stderr,
+    )
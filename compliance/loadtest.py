@@ -0,0 +1,105 @@
+import asyncio
+import json
+import sys
+import time
+from urllib.parse import urlsplit
+
+import numpy as np
+
+from compliance.bench import generate_brand_queries, generate_listings, generate_questions
+
+# ==================================================
+# REQUEST BODIES (SAME SEEDED INPUTS AS THE BENCHMARKS)
+# ==================================================
+BODIES = {
+    "safety": lambda n, seed: [{"text": t} for t in generate_listings(n, seed)],
+    "brand": lambda n, seed: [
+        {"brand": b, "model": m, "product_type": p} for b, m, p in generate_brand_queries(n, seed)
+    ],
+    "question": lambda n, seed: [{"question": q} for q in generate_questions(n, seed)],
+}
+
+
+async def _client(host, port, path, bodies, latencies, statuses):
+    """One keep-alive connection sending requests back to back."""
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while bodies:
+            raw = json.dumps(bodies.pop()).encode("utf-8")
+            request = (
+                f"POST {path} HTTP/1.1\r\nHost: {host}\r\n"
+                f"Content-Type: application/json\r\nContent-Length: {len(raw)}\r\n\r\n"
+            ).encode("latin-1") + raw
+            start = time.perf_counter()
+            writer.write(request)
+            await writer.drain()
+
+            status = int((await reader.readline()).split()[1])
+            length = 0
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                if name.lower() == "content-length":
+                    length = int(value)
+            await reader.readexactly(length)
+            latencies.append(time.perf_counter() - start)
+            statuses[status] = statuses.get(status, 0) + 1
+    finally:
+        writer.close()
+
+
+async def load(url, endpoint, n=5000, concurrency=64, seed=0):
+    parts = urlsplit(url)
+    bodies = BODIES[endpoint](n, seed)
+    bodies.reverse()  # pop() from the end keeps the seeded order
+    latencies, statuses = [], {}
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        _client(parts.hostname, parts.port or 80, f"/v1/{endpoint}", bodies, latencies, statuses)
+        for _ in range(concurrency)
+    ))
+    elapsed = time.perf_counter() - start
+
+    p50, p95, p99 = np.percentile(np.array(latencies) * 1000, [50, 95, 99]) if latencies else (0, 0, 0)
+    return {
+        "endpoint": endpoint,
+        "requests": len(latencies),
+        "concurrency": concurrency,
+        "p50_ms": round(float(p50), 2),
+        "p95_ms": round(float(p95), 2),
+        "p99_ms": round(float(p99), 2),
+        "throughput_per_s": round(len(latencies) / elapsed, 1),
+        "ok": statuses.get(200, 0),
+        "rejected": statuses.get(503, 0),
+        "other": sum(v for k, v in statuses.items() if k not in (200, 503)),
+    }
+
+
+# ==================================================
+# COMMAND LINE
+# ==================================================
+def add_arguments(parser):
+    parser.add_argument("--url", default="http://127.0.0.1:8080", help="running `serve` instance")
+    parser.add_argument(
+        "--endpoint", dest="endpoints", action="append", choices=sorted(BODIES),
+        help="endpoint to load (repeatable, default all)",
+    )
+    parser.add_argument("-n", type=int, default=5000, help="requests per endpoint")
+    parser.add_argument("-c", "--concurrency", type=int, default=64, help="open connections")
+    parser.add_argument("--seed", type=int, default=0)
+
+
+def run(args):
+    for endpoint in args.endpoints or sorted(BODIES):
+        try:
+            m = asyncio.run(load(args.url, endpoint, args.n, args.concurrency, args.seed))
+        except OSError as exc:
+            print(f"cannot reach {args.url}: {exc}", file=sys.stderr)
+            sys.exit(1)
+        print(
+            f"{endpoint:<10} p50 {m['p50_ms']:>7.2f}ms  p95 {m['p95_ms']:>7.2f}ms  "
+            f"p99 {m['p99_ms']:>7.2f}ms  {m['throughput_per_s']:>8.0f}/s  "
+            f"ok {m['ok']}  rejected {m['rejected']}  other {m['other']}"
+        )
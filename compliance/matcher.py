@@ -0,0 +1,198 @@
+import re
+from collections import deque
+from itertools import accumulate, compress
+
+from compliance.artifact import load_section
+from compliance.keywords import SAFETY_FAMILIES
+
+# ==================================================
+# TOKENIZER
+# ==================================================
+# One C-level pass: lowercase ASCII letters, keep digits, turn everything
+# else into a separator. Keywords therefore only match whole words
+# ("ac" never matches "pack", "mi" never matches "premium").
+_TABLE = bytes(
+    c + 32 if 65 <= c <= 90 else c if 97 <= c <= 122 or 48 <= c <= 57 else 32
+    for c in range(256)
+)
+_DIGITS = b"0123456789"
+
+# A keyword written with a slash ("cm/l") keeps it: "CM/L-4100012345" is
+# a licence number, "30 cm L x 20 cm W" is not. A number may follow, as
+# after any keyword word.
+_SLASHED = re.compile(
+    rb"(?<![a-z0-9])(?:"
+    + b"|".join(
+        re.escape(word.encode()) for words in SAFETY_FAMILIES.values() for word in words if "/" in word
+    )
+    + rb")(?![a-z])"
+)
+
+
+def _fold(raw):
+    folded = raw.translate(_TABLE)
+    if b"/" not in raw:
+        return folded
+    folded = bytearray(folded)
+    for m in _SLASHED.finditer(raw.lower()):
+        for i in range(m.start(), m.end()):
+            if raw[i] == 47:  # "/"
+                folded[i] = 47
+    return bytes(folded)
+
+
+def tokenize(text):
+    return _fold(text.encode("utf-8")).split()
+
+
+def char_spans(text, token_spans):
+    """(start, end, keyword, family) token ranges from find() as character
+    offsets into text, so text[start:end] is the matched phrase."""
+    if not token_spans:
+        return []
+    # This only locates tokens; the keyword scan has already run. Split on
+    # single spaces, so empty pieces stand for extra separators, and
+    # piece j ends at ends[j] + j.
+    raw = text.encode("utf-8")
+    pieces = _fold(raw).split(b" ")
+    ends = list(accumulate(map(len, pieces)))
+    where = list(compress(range(len(pieces)), pieces))  # token -> piece
+    spans = []
+    for start, end, keyword, family in token_spans:
+        first, last = where[start], where[end - 1]
+        spans.append((ends[first] - len(pieces[first]) + first, ends[last] + last, keyword, family))
+    if not text.isascii():
+        # Tokens are ASCII, so their byte offsets fall on character boundaries.
+        spans = [
+            (len(raw[:start].decode("utf-8")), len(raw[:end].decode("utf-8")), keyword, family)
+            for start, end, keyword, family in spans
+        ]
+    return spans
+
+
+def plural_forms(token):
+    # Listings say "chargers", "toys", "babies", "switches" - let the last
+    # word of a keyword take its English plural ending without loosening
+    # the word boundary. Only real plurals: "ac" + "es" would match "aces".
+    if not token.isalpha() or len(token) < 2 or token.endswith(b"s"):
+        return [token]
+    if token.endswith((b"x", b"z", b"ch", b"sh")):
+        return [token, token + b"es"]
+    if token.endswith(b"y") and token[-2:-1] not in (b"a", b"e", b"i", b"o", b"u"):
+        return [token, token[:-1] + b"ies"]
+    return [token, token + b"s"]
+
+
+# ==================================================
+# AHO-CORASICK AUTOMATON (OVER WORD TOKENS)
+# ==================================================
+class KeywordMatcher:
+    """Finds every keyword of every family in a single pass over the text."""
+
+    def __init__(self, families, plurals=True):
+        self.families = {name: list(words) for name, words in families.items()}
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [()]
+        self._length = {}
+        self._rank = {}
+
+        for family, words in self.families.items():
+            for keyword in words:
+                tokens = tokenize(keyword)
+                if not tokens:
+                    continue
+                self._length[keyword] = len(tokens)
+                self._rank.setdefault((keyword, family), len(self._rank))
+                endings = plural_forms(tokens[-1]) if plurals else [tokens[-1]]
+                for last in endings:
+                    self._insert(tokens[:-1] + [last], (keyword, family))
+
+        self._link()
+        self._vocab = frozenset(tok for edges in self._goto for tok in edges)
+
+    def _insert(self, tokens, output):
+        node = 0
+        for tok in tokens:
+            nxt = self._goto[node].get(tok)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+                self._goto[node][tok] = nxt
+            node = nxt
+        if output not in self._out[node]:
+            self._out[node] = self._out[node] + (output,)
+
+    def _link(self):
+        goto, fail, out = self._goto, self._fail, self._out
+        queue = deque(goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for tok, child in goto[node].items():
+                queue.append(child)
+                f = fail[node]
+                while f and tok not in goto[f]:
+                    f = fail[f]
+                fail[child] = goto[f].get(tok, 0)
+                out[child] = out[child] + tuple(
+                    o for o in out[fail[child]] if o not in out[child]
+                )
+
+    def candidates(self, text):
+        """(position, token) for the tokens of text that can be part of a match."""
+        # Only tokens the automaton knows can move it off the root, so drop
+        # the rest up front and remember positions to keep phrases contiguous.
+        # A keyword may run straight into a number ("IPX7", "AC1").
+        vocab = self._vocab
+        return [
+            (i, tok if tok in vocab else tok.rstrip(_DIGITS))
+            for i, tok in enumerate(tokenize(text))
+            if tok in vocab or (tok[-1] < 58 and tok.rstrip(_DIGITS) in vocab)
+        ]
+
+    def scan(self, text, spans=None):
+        """Return {family: [matched keywords]} for every family found in text,
+        in library order (so the same matches always read the same).
+
+        When spans is a list, the matches are also appended to it as find()
+        returns them, from the same pass.
+        """
+        return self.scan_candidates(self.candidates(text), spans)
+
+    def scan_candidates(self, candidates, spans=None):
+        """scan() for the output of candidates(), when a caller already has it."""
+        goto, fail, out, length = self._goto, self._fail, self._out, self._length
+        matched = []
+        node = 0
+        prev = -2
+        for i, tok in candidates:
+            if i != prev + 1:
+                node = 0
+            prev = i
+            while node and tok not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(tok, 0)
+            if out[node]:
+                matched.append(node)
+                if spans is not None:
+                    for keyword, family in out[node]:
+                        spans.append((i + 1 - length[keyword], i + 1, keyword, family))
+
+        found = {}
+        hits = {output for node in matched for output in out[node]}
+        for keyword, family in sorted(hits, key=self._rank.__getitem__):
+            found.setdefault(family, []).append(keyword)
+        return found
+
+    def find(self, text):
+        """Return (start, end, keyword, family) for every match, where
+        start:end is the token range of the match in tokenize(text)."""
+        found = []
+        self.scan(text, found)
+        return found
+
+
+# Built once per process (or loaded prebuilt) and shared by every session / worker.
+SAFETY_MATCHER = load_section("safety_matcher", lambda: KeywordMatcher(SAFETY_FAMILIES))
@@ -0,0 +1,109 @@
+import json
+import os
+import threading
+import time
+
+# ==================================================
+# IN-PROCESS STAGE TIMINGS
+# ==================================================
+_clock = time.perf_counter_ns
+
+
+def _noop(stage):
+    pass
+
+
+class Metrics:
+    """Per-stage timings plus pluggable counters, kept in this process.
+
+    Pipelines ask for a lap recorder and call it at the end of each named
+    stage; it records the time since the previous lap. While disabled the
+    recorder is a shared no-op function, so instrumented code pays one
+    function call per stage and nothing else.
+    """
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self._timings = {}
+        self._collectors = {}
+        self._lock = threading.Lock()
+
+    def laps(self, pipeline):
+        if not self.enabled:
+            return _noop
+        last = [_clock()]
+
+        def lap(stage):
+            now = _clock()
+            self._record(pipeline, stage, now - last[0])
+            last[0] = now
+
+        return lap
+
+    def _record(self, pipeline, stage, elapsed_ns):
+        with self._lock:
+            entry = self._timings.get((pipeline, stage))
+            if entry is None:
+                self._timings[(pipeline, stage)] = [1, elapsed_ns, elapsed_ns]
+            else:
+                entry[0] += 1
+                entry[1] += elapsed_ns
+                if elapsed_ns > entry[2]:
+                    entry[2] = elapsed_ns
+
+    def register(self, name, collect):
+        """collect() -> {counter: number}, read at export time (e.g. LRUCache.stats)."""
+        self._collectors[name] = collect
+
+    def reset(self):
+        with self._lock:
+            self._timings.clear()
+
+    # ================= EXPORT =================
+    def snapshot(self):
+        with self._lock:
+            timings = {k: list(v) for k, v in self._timings.items()}
+        stages = {}
+        for (pipeline, stage), (count, total, worst) in sorted(timings.items()):
+            stages.setdefault(pipeline, {})[stage] = {
+                "count": count,
+                "total_ms": total / 1e6,
+                "mean_us": total / count / 1e3,
+                "max_us": worst / 1e3,
+            }
+        counters = {}
+        for name, collect in self._collectors.items():
+            values = collect()
+            if values:
+                counters[name] = values
+        return {"enabled": self.enabled, "stages": stages, "counters": counters}
+
+    def to_json(self):
+        return json.dumps(self.snapshot(), indent=2)
+
+    def to_prometheus(self):
+        snap = self.snapshot()
+        lines = [
+            "# HELP bis_stage_seconds Time spent in each pipeline stage.",
+            "# TYPE bis_stage_seconds summary",
+        ]
+        for pipeline, stages in snap["stages"].items():
+            for stage, m in stages.items():
+                labels = f'pipeline="{pipeline}",stage="{stage}"'
+                lines.append(f"bis_stage_seconds_count{{{labels}}} {m['count']}")
+                lines.append(f"bis_stage_seconds_sum{{{labels}}} {m['total_ms'] / 1e3:.9f}")
+        lines.append("# TYPE bis_stage_max_seconds gauge")
+        for pipeline, stages in snap["stages"].items():
+            for stage, m in stages.items():
+                labels = f'pipeline="{pipeline}",stage="{stage}"'
+                lines.append(f"bis_stage_max_seconds{{{labels}}} {m['max_us'] / 1e6:.9f}")
+        for name, values in snap["counters"].items():
+            for key, value in values.items():
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    lines.append(f"bis_{name}_{key} {value}")
+        return "\n".join(lines) + "\n"
+
+
+# Opt-in: BIS_METRICS=1 turns timing on from startup; the admin page can
+# also switch it on for a running process.
+METRICS = Metrics(enabled=os.environ.get("BIS_METRICS", "") not in ("", "0"))
@@ -0,0 +1,14 @@
+import os
+
+# ==================================================
+# DATA FILE LOCATIONS (OVERRIDABLE PER DEPLOYMENT)
+# ==================================================
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+RULES_CSV = os.path.join(ROOT, "bis_rules.csv")
+BRANDS_CSV = os.environ.get("BIS_BRANDS_CSV", os.path.join(ROOT, "data", "brands.csv"))
+KNOWLEDGE_DIR = os.environ.get("BIS_KNOWLEDGE_DIR", os.path.join(ROOT, "knowledge"))
+LICENCE_DB = os.environ.get("BIS_LICENCE_DB", os.path.join(ROOT, "data", "licences.db"))
+# Demo licences (the models the app always listed), indexed until a real dump is imported.
+LICENCE_SAMPLE = os.path.join(ROOT, "data", "licences_sample.csv")
+ARTIFACT = os.environ.get("BIS_ARTIFACT", os.path.join(ROOT, "data", "rules.artifact"))
@@ -0,0 +1,105 @@
+import gc
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+# ==================================================
+# WORKER POOL (COMPILED STRUCTURES BUILT ONCE, IN THE PARENT)
+# ==================================================
+# Workers forked from a warmed-up parent start with the keyword automata,
+# brand index, knowledge index, rule snapshot and verdict table already
+# in memory and share those pages with the parent copy-on-write. Two
+# things would otherwise copy them page by page: the children's garbage
+# collector writing to object headers (gc.freeze() before the fork puts
+# everything built so far out of its reach) and lazily built parts such
+# as the brand mention matcher (warm() builds them up front). Where fork
+# is not available, workers are spawned and load the artifact themselves.
+SHARED = "fork" in multiprocessing.get_all_start_methods()
+
+
+def warm():
+    """Build every compiled structure a worker may use, in this process."""
+    from compliance.engine import BRANDS, REGISTRY
+    from compliance.verdicts import verdict_table
+
+    BRANDS._mention_matcher  # cached_property
+    verdict_table(REGISTRY.snapshot())
+
+
+def _ready(delay=0.0):
+    time.sleep(delay)
+    return os.getpid()
+
+
+def worker_pool(workers, shared=SHARED):
+    """A started ProcessPoolExecutor whose workers share the parent's
+    compiled structures (shared=True) or build their own (shared=False)."""
+    if not shared:
+        return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+
+    warm()
+    gc.collect()
+    gc.freeze()
+    try:
+        pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("fork"))
+        pool.submit(_ready).result()  # forks every worker now, while frozen
+    finally:
+        gc.unfreeze()
+    return pool
+
+
+# ================= MEASUREMENT =================
+def memory_kib():
+    """Resident, proportional and private (unshared) memory of this
+    process in KiB, from /proc; None where that is unavailable."""
+    kib = {}
+    try:
+        with open("/proc/self/smaps_rollup", encoding="ascii") as f:
+            for line in f:
+                name, _, value = line.partition(":")
+                if value.strip().endswith("kB"):
+                    kib[name] = int(value.split()[0])
+    except OSError:
+        return None
+    return {
+        "rss": kib.get("Rss", 0),
+        "pss": kib.get("Pss", 0),
+        "private": kib.get("Private_Clean", 0) + kib.get("Private_Dirty", 0),
+    }
+
+
+def _worker_memory(texts):
+    from compliance.engine import check_brand, classify_question, evaluate_product
+
+    for text in texts:
+        evaluate_product(text)
+        check_brand(text.split()[0])
+        classify_question(text)
+    return os.getpid(), memory_kib()
+
+
+def measure_pool(workers=4, shared=SHARED, rounds=3):
+    """(spin-up ms, mean worker memory) for one pool configuration: the
+    time until every worker has answered, then each worker's memory after
+    it has run all three evaluators."""
+    from compliance.bench import generate_listings
+
+    texts = generate_listings(200, seed=1)
+    start = time.perf_counter()
+    with worker_pool(workers, shared) as pool:
+        # Short sleeps spread the calls, so every worker answers one.
+        pids = set()
+        while len(pids) < workers:
+            pids.update(pool.map(_ready, [0.005] * workers))
+        spin_up = time.perf_counter() - start
+        per_worker = {}
+        for _ in range(rounds):
+            for pid, memory in pool.map(_worker_memory, [texts] * (workers * 2)):
+                per_worker[pid] = memory
+    readings = [m for m in per_worker.values() if m]
+    mean = {
+        key: round(sum(m[key] for m in readings) / len(readings)) if readings else None
+        for key in ("rss", "pss", "private")
+    }
+    return round(spin_up * 1000, 1), mean
@@ -0,0 +1,381 @@
+import json
+import re
+import sys
+import time
+from array import array
+
+import numpy as np
+
+from compliance.keywords import SAFETY_FAMILIES
+
+# ==================================================
+# INDEX TERMS FOR ONE SCREENED LISTING
+# ==================================================
+# kw:<keyword>         a matched keyword ("kw:explosion proof")
+# family:<FAMILY>      a matched keyword family ("family:BIS_TERMS")
+# std:<standard>       a BIS standard in the verdict ("std:IS 13252")
+# status:<status>      "status:high risk", "status:conditional use"
+# category:<word>      first word of the category ("category:electrical")
+_LEADING_SYMBOLS = re.compile(r"^\W+")
+
+
+def _status(value):
+    return _LEADING_SYMBOLS.sub("", value).strip().lower()
+
+
+def result_terms(result):
+    """Terms for a SafetyResult."""
+    terms = {f"category:{result.category.split()[0].lower()}", f"status:{_status(result.safety_status)}"}
+    for family, words in result.matched.items():
+        terms.add(f"family:{family}")
+        terms.update(f"kw:{word}" for word in words)
+    terms.update(f"std:{ref.split(' – ')[0]}" for ref in result.bis_refs)
+    return terms
+
+
+# ==================================================
+# POSTING LIST COMPRESSION
+# ==================================================
+# Each sorted list is stored either as gaps in the narrowest unsigned
+# type that holds its largest gap, or - when that is smaller - as a
+# bitmap over all listings. Both decode with one vectorized call.
+GAPS, BITMAP = 0, 1
+_WIDTHS = ((0xFF, np.uint8), (0xFFFF, np.uint16), (0xFFFFFFFF, np.uint32))
+
+
+def encode(ids, universe):
+    """(kind, width, first, blob) for a sorted array of listing numbers;
+    width indexes _WIDTHS for gap lists."""
+    ids = np.asarray(ids, dtype=np.uint32)
+    gaps = np.diff(ids)
+    biggest = int(gaps.max()) if len(gaps) else 0
+    width = next(w for w, (limit, _) in enumerate(_WIDTHS) if biggest <= limit)
+    dtype = _WIDTHS[width][1]
+    if (universe + 7) // 8 < len(gaps) * np.dtype(dtype).itemsize:
+        present = np.zeros(universe, dtype=bool)
+        present[ids] = True
+        return BITMAP, 0, 0, np.packbits(present).tobytes()
+    return GAPS, width, int(ids[0]) if len(ids) else 0, gaps.astype(dtype).tobytes()
+
+
+def decode(kind, first, count, blob, width, universe):
+    if kind == BITMAP:
+        bits = np.unpackbits(np.frombuffer(blob, dtype=np.uint8), count=universe)
+        # nonzero() is several times faster on a bool view than on uint8.
+        return np.flatnonzero(bits.view(bool)).astype(np.uint32)
+    if count == 0:
+        return np.empty(0, dtype=np.uint32)
+    gaps = np.frombuffer(blob, dtype=_WIDTHS[width][1])
+    out = np.empty(count, dtype=np.uint32)
+    out[0] = first
+    np.cumsum(gaps, dtype=np.uint32, out=out[1:])
+    out[1:] += first
+    return out
+
+
+# ================= SORTED-SET OPERATIONS =================
+# Sparse lists are merged by binary search; once a list covers more than
+# 1/64 of the listings, a boolean mask over all of them is cheaper.
+def _dense(n, universe):
+    return n > universe >> 6
+
+
+def _contains(large, small, universe):
+    """Boolean mask: which of small (sorted) appear in large (sorted)."""
+    if len(large) == 0:
+        return np.zeros(len(small), dtype=bool)
+    if _dense(len(large), universe):
+        present = np.zeros(universe, dtype=bool)
+        present[large] = True
+        return present[small]
+    at = np.searchsorted(large, small)
+    at[at == len(large)] = 0
+    return large[at] == small
+
+
+def intersect(a, b, universe):
+    small, large = (a, b) if len(a) <= len(b) else (b, a)
+    return small[_contains(large, small, universe)]
+
+
+def difference(a, b, universe):
+    return a[~_contains(b, a, universe)]
+
+
+def union(a, b, universe):
+    if _dense(len(a) + len(b), universe):
+        present = np.zeros(universe, dtype=bool)
+        present[a] = True
+        present[b] = True
+        return np.flatnonzero(present).astype(np.uint32)
+    merged = np.concatenate((a, difference(b, a, universe)))
+    merged.sort()
+    return merged
+
+
+def complement(ids, universe):
+    present = np.ones(universe, dtype=bool)
+    present[ids] = False
+    return np.flatnonzero(present).astype(np.uint32)
+
+
+# ==================================================
+# THE INDEX
+# ==================================================
+class ListingIndex:
+    """term -> compressed posting list of listing numbers (0-based, in input
+    order), plus the listing ids to report."""
+
+    def __init__(self, terms, directory, blob, ids):
+        self.terms = {term: i for i, term in enumerate(terms)}
+        self.directory = directory  # (kind, width, first, count, offset, nbytes) per term
+        self.blob = blob
+        self.ids = ids
+
+    def __len__(self):
+        return len(self.ids)
+
+    def postings(self, term):
+        i = self.terms.get(term)
+        if i is None:
+            return np.empty(0, dtype=np.uint32)
+        kind, width, first, count, offset, nbytes = (int(v) for v in self.directory[i])
+        return decode(kind, first, count, self.blob[offset:offset + nbytes], width, len(self.ids))
+
+    def resolve(self, word):
+        """Index term for a query word: explicit "prefix:value", then an
+        upper-case family name ("CHILD"), a keyword ("child"), a family name
+        in any case, or a standard."""
+        if ":" in word and word.split(":", 1)[0] in ("kw", "family", "std", "status", "category"):
+            prefix, value = word.split(":", 1)
+            return f"{prefix}:{value.upper() if prefix == 'family' else value}"
+        if word in SAFETY_FAMILIES:
+            return f"family:{word}"
+        keyword = word.lower()
+        # Keywords are indexed in their library form: "chargers" -> "charger".
+        if f"kw:{keyword}" not in self.terms and keyword.endswith("s") and f"kw:{keyword[:-1]}" in self.terms:
+            keyword = keyword[:-1]
+        if f"kw:{keyword}" in self.terms:
+            return f"kw:{keyword}"
+        if word.upper() in SAFETY_FAMILIES:
+            return f"family:{word.upper()}"
+        if f"std:{word}" in self.terms:
+            return f"std:{word}"
+        return f"kw:{keyword}"
+
+    def query(self, expression):
+        """Sorted listing numbers matching a boolean query, e.g.
+        '"explosion proof" AND charger AND NOT BIS_TERMS'."""
+        negated, ids = _Parser(expression, self).parse()
+        return complement(ids, len(self.ids)) if negated else ids
+
+    # ================= FILE FORMAT =================
+    def save(self, path):
+        # Through a file object: np.savez would add ".npz" to a bare path.
+        with open(path, "wb") as f:
+            np.savez(
+                f,
+                terms=np.array(json.dumps(list(self.terms))),
+                directory=self.directory,
+                blob=np.frombuffer(self.blob, dtype=np.uint8),
+                ids=self.ids,
+            )
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path, allow_pickle=False) as data:
+            return cls(
+                json.loads(str(data["terms"])),
+                data["directory"],
+                data["blob"].tobytes(),
+                data["ids"],
+            )
+
+
+class IndexBuilder:
+    """Collects terms listing by listing; build() groups and compresses
+    every posting list at once."""
+
+    def __init__(self):
+        self._vocab = {}
+        self._term_ids = array("I")
+        self._counts = array("I")
+        self._ids = []
+
+    def add(self, listing_id, terms):
+        self._ids.append(str(listing_id))
+        vocab = self._vocab
+        term_ids = list(map(vocab.get, terms))
+        if None in term_ids:
+            term_ids = [vocab.setdefault(term, len(vocab)) for term in terms]
+        self._term_ids.extend(term_ids)
+        self._counts.append(len(term_ids))
+
+    def build(self):
+        universe = len(self._ids)
+        term_ids = np.frombuffer(self._term_ids, dtype=np.uint32)
+        numbers = np.repeat(
+            np.arange(universe, dtype=np.uint32), np.frombuffer(self._counts, dtype=np.uint32)
+        )
+        # A stable sort keeps each term's listings in ascending order.
+        order = np.argsort(term_ids, kind="stable")
+        numbers = numbers[order]
+        bounds = np.searchsorted(term_ids[order], np.arange(len(self._vocab) + 1))
+
+        terms = sorted(self._vocab)
+        directory = np.zeros((len(terms), 6), dtype=np.int64)
+        parts = []
+        offset = 0
+        for i, term in enumerate(terms):
+            t = self._vocab[term]
+            ids = numbers[bounds[t]:bounds[t + 1]]
+            kind, width, first, blob = encode(ids, universe)
+            directory[i] = (kind, width, first, len(ids), offset, len(blob))
+            parts.append(blob)
+            offset += len(blob)
+        return ListingIndex(terms, directory, b"".join(parts), np.asarray(self._ids))
+
+
+def merge(parts, ids):
+    """One index over ids from (ListingIndex, numbers) parts, where
+    numbers[i] is the merged listing number of the part's listing i
+    (-1 drops it)."""
+    universe = len(ids)
+    terms = sorted(set().union(*(index.terms for index, _ in parts)))
+    directory = np.zeros((len(terms), 6), dtype=np.int64)
+    blobs = []
+    offset = 0
+    for i, term in enumerate(terms):
+        lists = []
+        for index, numbers in parts:
+            mapped = numbers[index.postings(term)]
+            lists.append(mapped[mapped >= 0])
+        postings = np.sort(np.concatenate(lists)).astype(np.uint32)
+        kind, width, first, blob = encode(postings, universe)
+        directory[i] = (kind, width, first, len(postings), offset, len(blob))
+        blobs.append(blob)
+        offset += len(blob)
+    return ListingIndex(terms, directory, b"".join(blobs), np.asarray(ids))
+
+
+# ==================================================
+# BOOLEAN QUERIES (AND / OR / NOT, PARENTHESES)
+# ==================================================
+_TOKEN = re.compile(r'\(|\)|[a-z]+:"[^"]*"|"[^"]*"|[^\s()]+')
+
+
+class _Parser:
+    """Recursive descent over AND / OR / NOT with implicit AND.
+
+    Every node evaluates to (negated, sorted ids) so that "a AND NOT b"
+    is a set difference rather than a complement of every listing.
+    """
+
+    def __init__(self, expression, index):
+        self.tokens = _TOKEN.findall(expression)
+        self.pos = 0
+        self.index = index
+
+    def parse(self):
+        if not self.tokens:
+            raise ValueError("empty query")
+        node = self._or()
+        if self.pos != len(self.tokens):
+            raise ValueError(f"unexpected {self.tokens[self.pos]!r} in query")
+        return node
+
+    def _peek(self):
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else None
+
+    def _take(self):
+        token = self._peek()
+        self.pos += 1
+        return token
+
+    def _or(self):
+        node = self._and()
+        while self._peek() is not None and self._peek().upper() == "OR":
+            self._take()
+            node = _or(node, self._and(), len(self.index))
+        return node
+
+    def _and(self):
+        node = self._not()
+        while self._peek() not in (None, ")") and self._peek().upper() != "OR":
+            if self._peek().upper() == "AND":
+                self._take()
+            node = _and(node, self._not(), len(self.index))
+        return node
+
+    def _not(self):
+        if self._peek() is not None and self._peek().upper() == "NOT":
+            self._take()
+            negated, ids = self._not()
+            return not negated, ids
+        return self._atom()
+
+    def _atom(self):
+        token = self._take()
+        if token is None:
+            raise ValueError("query ends too early")
+        if token == "(":
+            node = self._or()
+            if self._take() != ")":
+                raise ValueError("missing )")
+            return node
+        if token == ")":
+            raise ValueError("unexpected )")
+        if token.upper() in ("AND", "OR", "NOT"):
+            # Quote it ('"and"') to search for the word itself.
+            raise ValueError(f"{token} is missing an operand")
+        return False, self.index.postings(self.index.resolve(token.replace('"', "")))
+
+
+def _and(a, b, universe):
+    (neg_a, a_ids), (neg_b, b_ids) = a, b
+    if not neg_a and not neg_b:
+        return False, intersect(a_ids, b_ids, universe)
+    if neg_a and neg_b:
+        return True, union(a_ids, b_ids, universe)
+    keep, drop = (b_ids, a_ids) if neg_a else (a_ids, b_ids)
+    return False, difference(keep, drop, universe)
+
+
+def _or(a, b, universe):
+    (neg_a, a_ids), (neg_b, b_ids) = a, b
+    if not neg_a and not neg_b:
+        return False, union(a_ids, b_ids, universe)
+    if neg_a and neg_b:
+        return True, intersect(a_ids, b_ids, universe)
+    keep, drop = (b_ids, a_ids) if neg_a else (a_ids, b_ids)
+    return True, difference(drop, keep, universe)
+
+
+# ==================================================
+# COMMAND LINE
+# ==================================================
+def add_arguments(parser):
+    parser.add_argument("index", help="index written by `screen --index`")
+    parser.add_argument("expression", help='e.g. \'"explosion proof" AND charger AND NOT BIS_TERMS\'')
+    parser.add_argument("--limit", type=int, default=20, help="listing ids to print (default 20)")
+
+
+def run(args):
+    try:
+        index = ListingIndex.load(args.index)
+    except (OSError, ValueError, KeyError) as exc:
+        print(f"cannot read index {args.index}: {exc}", file=sys.stderr)
+        sys.exit(2)
+    start = time.perf_counter()
+    try:
+        hits = index.query(args.expression)
+    except ValueError as exc:
+        print(f"bad query: {exc}", file=sys.stderr)
+        sys.exit(2)
+    elapsed = time.perf_counter() - start
+    for number in hits[:args.limit].tolist():
+        print(index.ids[number])
+    print(
+        f"{len(hits)} of {len(index)} listings match ({elapsed * 1000:.1f} ms)",
+        file=sys.stderr,
+    )
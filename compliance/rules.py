@@ -0,0 +1,135 @@
+import csv
+import hashlib
+import io
+import os
+import threading
+import time
+from dataclasses import dataclass
+from types import MappingProxyType
+
+from compliance import paths
+from compliance.artifact import load_section
+
+DEFAULT_RULES_PATH = paths.RULES_CSV
+
+
+# ==================================================
+# IMMUTABLE RULE SNAPSHOT
+# ==================================================
+# bis_rules.csv holds two kinds of rows, both looked up by their "claim"
+# key. Claim rows ("shockproof", "waterproof", ...) describe what a
+# marketing claim needs; they are reference data and no evaluation reads
+# them yet. Category rows ("electrical", "charger", "toy", "ip rating",
+# "household appliance") supply the standard cited for a matched keyword
+# family (data.FAMILY_RULES) or a Brand Check product type
+# (data.PRODUCT_TYPE_RULES).
+@dataclass(frozen=True)
+class Rule:
+    claim: str
+    bis_standard: str
+    status: str
+    explanation: str
+
+    @property
+    def reference(self):
+        return f"{self.bis_standard} – {self.explanation}"
+
+
+class RuleSnapshot:
+    """One parsed copy of bis_rules.csv. Never mutated once built."""
+
+    __slots__ = ("rules", "by_claim", "version", "mtime_ns")
+
+    def __init__(self, rules, version, mtime_ns=0):
+        self.rules = tuple(rules)
+        self.by_claim = MappingProxyType({rule.claim: rule for rule in rules})
+        self.version = version
+        self.mtime_ns = mtime_ns
+
+    def reference(self, claim):
+        rule = self.by_claim.get(claim)
+        return rule.reference if rule else None
+
+
+RULE_COLUMNS = ("claim", "bis_standard", "status", "explanation")
+
+
+def parse_rules(data):
+    rows = csv.DictReader(io.StringIO(data.decode("utf-8-sig")))
+    missing = set(RULE_COLUMNS) - set(rows.fieldnames or ())
+    if missing:
+        raise ValueError(f"bis_rules.csv is missing columns: {', '.join(sorted(missing))}")
+    return [
+        Rule(
+            claim=(row["claim"] or "").strip().lower(),
+            bis_standard=(row["bis_standard"] or "").strip(),
+            status=(row["status"] or "").strip(),
+            explanation=(row["explanation"] or "").strip(),
+        )
+        for row in rows
+        if (row["claim"] or "").strip()
+    ]
+
+
+def load_snapshot(path):
+    with open(path, "rb") as f:
+        stat = os.fstat(f.fileno())
+        data = f.read()
+    return RuleSnapshot(
+        parse_rules(data),
+        version=hashlib.sha1(data).hexdigest()[:12],
+        mtime_ns=stat.st_mtime_ns,
+    )
+
+
+# ==================================================
+# HOT-RELOADING REGISTRY
+# ==================================================
+class RuleRegistry:
+    """Serves the current RuleSnapshot and swaps in a new one when the CSV changes.
+
+    Readers never lock: they get whichever snapshot is current, and a reload
+    replaces it with a single reference assignment.
+    """
+
+    def __init__(self, path=DEFAULT_RULES_PATH, check_interval=1.0, snapshot=None):
+        self.path = path
+        self.check_interval = check_interval
+        self.last_error = None
+        self._reload_lock = threading.Lock()
+        self._snapshot = snapshot or load_snapshot(path)
+        self._checked_at = time.monotonic()
+
+    def snapshot(self):
+        if time.monotonic() - self._checked_at >= self.check_interval:
+            self._maybe_reload()
+        return self._snapshot
+
+    def _maybe_reload(self):
+        # Another thread is already reloading - keep serving the current rules.
+        if not self._reload_lock.acquire(blocking=False):
+            return
+        try:
+            self._checked_at = time.monotonic()
+            try:
+                mtime_ns = os.stat(self.path).st_mtime_ns
+                if mtime_ns != self._snapshot.mtime_ns:
+                    self._snapshot = load_snapshot(self.path)
+                    self.last_error = None
+            except (OSError, ValueError, csv.Error) as exc:
+                # A half-written or broken file never replaces good rules.
+                self.last_error = exc
+        finally:
+            self._reload_lock.release()
+
+
+def _precompiled_snapshot():
+    cached = load_section("rules")
+    if cached is None:
+        return None
+    rules, version = cached
+    return RuleSnapshot(rules, version, mtime_ns=os.stat(DEFAULT_RULES_PATH).st_mtime_ns)
+
+
+# One registry per process, shared by every Streamlit session and worker.
+REGISTRY = RuleRegistry(snapshot=_precompiled_snapshot())
@@ -0,0 +1,302 @@
+import asyncio
+import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+from compliance.data import PRODUCT_TYPES
+from compliance.engine import check_brand_cached, classify_question, evaluate_product_cached
+from compliance.metrics import METRICS
+
+MAX_BODY = 1 << 20
+
+_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    500: "Internal Server Error",
+    503: "Service Unavailable",
+}
+
+
+class Overloaded(Exception):
+    pass
+
+
+class BadRequest(Exception):
+    pass
+
+
+# ==================================================
+# MICRO-BATCHING WITH A BOUNDED QUEUE
+# ==================================================
+class MicroBatcher:
+    """Collects concurrent requests for up to max_wait seconds (or
+    max_batch items) and evaluates them as one batch off the event loop.
+
+    The queue is bounded: once queue_size requests are waiting, submit()
+    raises Overloaded straight away instead of letting latency grow.
+    Identical inputs inside a batch are evaluated once.
+    """
+
+    def __init__(self, name, evaluate, executor, max_batch=64, max_wait=0.003, queue_size=1024):
+        self.name = name
+        self.evaluate = evaluate
+        self.executor = executor
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.queue = asyncio.Queue(maxsize=queue_size)
+        self.rejected = 0
+        self.batches = 0
+        self.items = 0
+        self._task = None
+
+    def start(self):
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def submit(self, key):
+        future = asyncio.get_running_loop().create_future()
+        try:
+            self.queue.put_nowait((key, future))
+        except asyncio.QueueFull:
+            self.rejected += 1
+            raise Overloaded(self.name) from None
+        return await future
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            unique = list(dict.fromkeys(key for key, _ in batch))
+            try:
+                results = await loop.run_in_executor(self.executor, self._evaluate_all, unique)
+            except Exception as exc:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(exc)
+                continue
+
+            self.batches += 1
+            self.items += len(batch)
+            for key, future in batch:
+                if not future.done():
+                    future.set_result(results[key])
+
+    def _evaluate_all(self, keys):
+        return {key: self.evaluate(key) for key in keys}
+
+    def stats(self):
+        return {
+            "queued": self.queue.qsize(),
+            "rejected": self.rejected,
+            "batches": self.batches,
+            "mean_batch": self.items / self.batches if self.batches else 0.0,
+        }
+
+
+# ==================================================
+# ENDPOINTS
+# ==================================================
+def _text(body, field):
+    value = body.get(field)
+    if not isinstance(value, str) or not value.strip():
+        raise BadRequest(f'"{field}" must be a non-empty string')
+    return value
+
+
+def _optional_text(body, field, default):
+    value = body.get(field)
+    if value is None or value == "":
+        return default
+    if not isinstance(value, str):
+        raise BadRequest(f'"{field}" must be a string')
+    return value
+
+
+def _brand_key(body):
+    product_type = _optional_text(body, "product_type", "Not sure")
+    if product_type not in PRODUCT_TYPES:
+        raise BadRequest(f'"product_type" must be one of: {", ".join(PRODUCT_TYPES)}')
+    return _text(body, "brand"), _optional_text(body, "model", ""), product_type
+
+
+@dataclass(frozen=True)
+class Endpoint:
+    parse: object  # request JSON -> hashable key
+    evaluate: object  # key -> result with to_dict()
+
+
+ENDPOINTS = {
+    "/v1/safety": Endpoint(
+        parse=lambda body: _text(body, "text"),
+        evaluate=evaluate_product_cached,
+    ),
+    "/v1/brand": Endpoint(
+        parse=_brand_key,
+        evaluate=lambda key: check_brand_cached(*key),
+    ),
+    "/v1/question": Endpoint(
+        parse=lambda body: _text(body, "question"),
+        evaluate=classify_question,
+    ),
+}
+
+
+# ==================================================
+# HTTP/1.1 (STDLIB ONLY, KEEP-ALIVE)
+# ==================================================
+class EvaluationServer:
+    def __init__(self, max_batch=64, max_wait=0.003, queue_size=1024, workers=1):
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.queue_size = queue_size
+        # One thread keeps evaluation off the event loop; more only add GIL churn.
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="evaluate")
+        self.batchers = {}
+
+    async def start(self, host="127.0.0.1", port=8080):
+        for path, endpoint in ENDPOINTS.items():
+            batcher = MicroBatcher(
+                path, endpoint.evaluate, self.executor,
+                self.max_batch, self.max_wait, self.queue_size,
+            )
+            batcher.start()
+            self.batchers[path] = batcher
+            METRICS.register(f"batcher{path.replace('/', '_')}", batcher.stats)
+        return await asyncio.start_server(self._handle, host, port, backlog=1024)
+
+    async def _handle(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                try:
+                    method, target, version = request_line.decode("latin-1").split()
+                except ValueError:
+                    await self._send(writer, 400, {"error": "malformed request line"}, close=True)
+                    break
+                keep_alive = (
+                    headers.get("connection", "").lower() != "close"
+                    if version == "HTTP/1.1"
+                    else headers.get("connection", "").lower() == "keep-alive"
+                )
+
+                try:
+                    length = int(headers.get("content-length") or 0)
+                except ValueError:
+                    length = -1
+                if length < 0:
+                    # The body cannot be framed, so the connection cannot be reused.
+                    await self._send(writer, 400, {"error": "invalid Content-Length"}, close=True)
+                    break
+                if length > MAX_BODY:
+                    await self._send(writer, 413, {"error": "body too large"}, close=True)
+                    break
+                body = await reader.readexactly(length) if length else b""
+
+                status, payload, extra = await self._dispatch(method, target, body)
+                await self._send(writer, status, payload, close=not keep_alive, extra=extra)
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def _dispatch(self, method, target, body):
+        path = target.split("?", 1)[0]
+        if path == "/healthz":
+            return 200, {"status": "ok"}, None
+        if path == "/metrics":
+            return 200, METRICS.to_prometheus(), None
+
+        endpoint = ENDPOINTS.get(path)
+        if endpoint is None:
+            return 404, {"error": f"unknown endpoint {path}"}, None
+        if method != "POST":
+            return 405, {"error": "use POST with a JSON body"}, None
+
+        try:
+            data = json.loads(body or b"{}")
+            if not isinstance(data, dict):
+                raise BadRequest("body must be a JSON object")
+            key = endpoint.parse(data)
+        except (ValueError, BadRequest) as exc:
+            return 400, {"error": str(exc)}, None
+
+        try:
+            result = await self.batchers[path].submit(key)
+        except Overloaded:
+            return 503, {"error": "overloaded, retry later"}, {"Retry-After": "1"}
+        except Exception as exc:
+            print(f"{path}: evaluation failed: {exc!r}", file=sys.stderr)
+            return 500, {"error": "evaluation failed"}, None
+        return 200, result.to_dict(), None
+
+    async def _send(self, writer, status, payload, close=False, extra=None):
+        if isinstance(payload, str):
+            body, content_type = payload.encode("utf-8"), "text/plain; version=0.0.4"
+        else:
+            body, content_type = json.dumps(payload, ensure_ascii=False).encode("utf-8"), "application/json"
+        head = [
+            f"HTTP/1.1 {status} {_REASONS.get(status, '')}",
+            f"Content-Type: {content_type}",
+            f"Content-Length: {len(body)}",
+            "Connection: close" if close else "Connection: keep-alive",
+        ]
+        head += [f"{name}: {value}" for name, value in (extra or {}).items()]
+        writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + body)
+        await writer.drain()
+
+
+# ==================================================
+# COMMAND LINE
+# ==================================================
+def add_arguments(parser):
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--max-batch", type=int, default=64, help="most requests evaluated together")
+    parser.add_argument(
+        "--max-wait-ms", type=float, default=3.0,
+        help="how long a batch waits to fill up (default 3 ms)",
+    )
+    parser.add_argument(
+        "--queue-size", type=int, default=1024,
+        help="waiting requests per endpoint before answering 503 (default 1024)",
+    )
+
+
+async def serve(args):
+    server = EvaluationServer(args.max_batch, args.max_wait_ms / 1000, args.queue_size)
+    listener = await server.start(args.host, args.port)
+    print(f"serving on http://{args.host}:{args.port} ({', '.join(ENDPOINTS)})", file=sys.stderr)
+    async with listener:
+        await listener.serve_forever()
+
+
+def run(args):
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,213 @@
+import atexit
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import weakref
+
+# ==================================================
+# PERSISTENT RESULT STORE (SQLITE, SHARED BY PROCESSES)
+# ==================================================
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key       BLOB PRIMARY KEY,
+    kind      TEXT NOT NULL,
+    payload   TEXT NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used);
+"""
+
+
+def content_key(kind, version, content):
+    h = hashlib.blake2b(digest_size=16)
+    for part in (kind, version, content):
+        h.update(part if isinstance(part, bytes) else str(part).encode("utf-8"))
+        h.update(b"\0")
+    return h.digest()
+
+
+class ResultStore:
+    """Content-hash keyed results that survive restarts and are shared by
+    every process pointing at the same file.
+
+    Writes and last-used bumps are buffered and committed in batches;
+    the oldest entries are evicted once the table passes max_entries.
+    """
+
+    def __init__(self, path, max_entries=200_000, batch_size=64, flush_interval=2.0):
+        self.path = path
+        self.max_entries = max_entries
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self.hits = 0
+        self.misses = 0
+        self.warm_seconds = 0.0
+        self.cold_seconds = 0.0
+
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._pending = {}
+        self._touched = {}
+        self._flushed_at = time.monotonic()
+        self._flusher = None
+
+        with self._connect() as db:
+            db.executescript(_SCHEMA)
+        atexit.register(self.flush)
+        _OPEN_STORES.add(self)
+
+    def _after_fork(self):
+        # A forked worker opens its own connection, and leaves writes
+        # buffered before the fork to the parent.
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._pending = {}
+        self._touched = {}
+        self._flusher = None
+
+    def _connect(self):
+        db = getattr(self._local, "db", None)
+        if db is None:
+            db = sqlite3.connect(self.path, timeout=10)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            self._local.db = db
+        return db
+
+    # ================= READ / WRITE =================
+    def get(self, key):
+        with self._lock:
+            pending = self._pending.get(key)
+        if pending is not None:
+            payload = pending[1]  # (kind, payload) until flushed
+        else:
+            row = self._connect().execute(
+                "SELECT payload FROM results WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            payload = row[0]
+            with self._lock:
+                self._touched[key] = time.time()
+        return json.loads(payload)
+
+    def put(self, key, kind, value):
+        with self._lock:
+            self._pending[key] = (kind, json.dumps(value, ensure_ascii=False))
+            due = (
+                len(self._pending) >= self.batch_size
+                or time.monotonic() - self._flushed_at >= self.flush_interval
+            )
+        if due:
+            self.flush()
+        self._start_flusher()
+
+    def _start_flusher(self):
+        # put() only flushes on the next write; this covers a quiet spell.
+        if self._flusher is None:
+            self._flusher = threading.Thread(
+                target=_flush_periodically, args=(weakref.ref(self), self.flush_interval),
+                name="result-store-flush", daemon=True,
+            )
+            self._flusher.start()
+
+    def get_or_compute(self, key, kind, compute, encode, decode):
+        start = time.perf_counter()
+        payload = self.get(key)
+        if payload is not None:
+            self.hits += 1
+            self.warm_seconds += time.perf_counter() - start
+            return decode(payload)
+
+        value = compute()
+        self.put(key, kind, encode(value))
+        self.misses += 1
+        self.cold_seconds += time.perf_counter() - start
+        return value
+
+    def flush(self):
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            touched, self._touched = self._touched, {}
+            self._flushed_at = time.monotonic()
+        if not pending and not touched:
+            return
+
+        now = time.time()
+        db = self._connect()
+        try:
+            with db:
+                db.executemany(
+                    "INSERT OR REPLACE INTO results (key, kind, payload, last_used) VALUES (?, ?, ?, ?)",
+                    [(key, kind, payload, now) for key, (kind, payload) in pending.items()],
+                )
+                db.executemany(
+                    "UPDATE results SET last_used = ? WHERE key = ?",
+                    [(used, key) for key, used in touched.items()],
+                )
+                self._evict(db)
+        except sqlite3.Error:
+            # Keep the batch for the next flush; newer writes win.
+            with self._lock:
+                self._pending = {**pending, **self._pending}
+                self._touched = {**touched, **self._touched}
+            raise
+
+    def _evict(self, db):
+        count = db.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+        excess = count - self.max_entries
+        if excess > 0:
+            db.execute(
+                "DELETE FROM results WHERE key IN "
+                "(SELECT key FROM results ORDER BY last_used LIMIT ?)",
+                (excess,),
+            )
+
+    # ================= REPORTING =================
+    def stats(self):
+        lookups = self.hits + self.misses
+        warm = self.warm_seconds / self.hits if self.hits else 0.0
+        cold = self.cold_seconds / self.misses if self.misses else 0.0
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "warm_ms": warm * 1000,
+            "cold_ms": cold * 1000,
+            "speedup": cold / warm if warm else 0.0,
+        }
+
+
+def _flush_periodically(ref, interval):
+    while True:
+        time.sleep(interval)
+        store = ref()
+        if store is None:
+            return
+        try:
+            store.flush()
+        except sqlite3.Error:
+            pass  # busy or locked: flush() kept the batch for the next try
+        del store
+
+
+_OPEN_STORES = weakref.WeakSet()
+
+
+def _after_fork_in_child():
+    for store in list(_OPEN_STORES):
+        store._after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
+
+
+def open_default_store():
+    # Opt-in: point BIS_RESULT_DB at a file shared by the replicas on a host.
+    path = os.environ.get("BIS_RESULT_DB")
+    return ResultStore(path) if path else None
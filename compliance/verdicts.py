@@ -0,0 +1,126 @@
+from compliance.data import FAMILY_RULES
+from compliance.keywords import SAFETY_FAMILIES
+
+# ==================================================
+# SAFETY VERDICT TABLE (ONE ENTRY PER FAMILY COMBINATION)
+# ==================================================
+# A verdict depends only on which keyword families matched (and on the
+# BIS references in the current rules), so all 2**len(SAFETY_FAMILIES)
+# of them are built up front. Evaluation is then one keyword scan plus
+# table[family_mask(hits)].
+FAMILY_BITS = {family: 1 << i for i, family in enumerate(SAFETY_FAMILIES)}
+
+# Field order of every table entry - the leading SafetyResult fields.
+VERDICT_FIELDS = (
+    "category", "safety_status", "confidence", "recommendation", "style", "reasons", "bis_refs",
+)
+
+
+def family_mask(families):
+    mask = 0
+    for family in families:
+        mask |= FAMILY_BITS[family]
+    return mask
+
+
+def _family_ref(rules, bis_refs, family):
+    ref = rules.reference(FAMILY_RULES[family])
+    if ref:
+        bis_refs.append(ref)
+
+
+def decide(families, rules):
+    """The safety page's rule chain for one set of matched families."""
+    # ================= INITIAL STATE =================
+    category = "General Consumer Product"
+    safety_status = "🟡 Verification Required"
+    confidence = "Medium"
+    recommendation = "Verify product details before use"
+    style = "warn"
+
+    reasons = []
+    bis_refs = []
+
+    # ================= CATEGORY DETECTION =================
+    if "ELECTRICAL" in families:
+        category = "Electrical / Electronic Product"
+        reasons.append(
+            "Electrical products pose shock, fire, and overheating risks if uncertified."
+        )
+        _family_ref(rules, bis_refs, "ELECTRICAL")
+
+    if "CHILD" in families:
+        category = "Child / Toy Product"
+        reasons.append(
+            "Products used by children require strict mechanical and material safety."
+        )
+        _family_ref(rules, bis_refs, "CHILD")
+
+    if "WATER" in families:
+        reasons.append(
+            "Water exposure increases electrical and corrosion risks."
+        )
+        _family_ref(rules, bis_refs, "WATER")
+
+    if "MATERIAL_RISK" in families:
+        reasons.append(
+            "Material safety matters due to toxicity and long-term health exposure."
+        )
+
+    # ================= CLAIM ANALYSIS =================
+    if "MARKETING_TERMS" in families:
+        reasons.append(
+            "Marketing terms (eco-friendly, non-toxic) are not BIS certifications."
+        )
+
+    if "EXTREME_CLAIMS" in families:
+        safety_status = "🔴 High Risk"
+        confidence = "Low"
+        recommendation = "Avoid product until independently verified"
+        style = "bad"
+        reasons.append(
+            "Unrealistic or absolute safety claims are misleading and unsafe."
+        )
+
+    # ================= BIS CLAIM CHECK =================
+    if "BIS_TERMS" in families:
+        reasons.append(
+            "BIS reference detected. Certification must be verified using CM/L license number."
+        )
+    else:
+        reasons.append(
+            "No BIS mark or license reference detected in product description."
+        )
+
+    # ================= FINAL SAFETY DETERMINATION =================
+    if style != "bad":
+        safety_status = "🟡 Conditional Use"
+        confidence = "Medium"
+        recommendation = (
+            "Product may be used only after verifying BIS certification "
+            "and manufacturer details."
+        )
+        style = "warn"
+
+    return (category, safety_status, confidence, recommendation, style, tuple(reasons), tuple(bis_refs))
+
+
+def compile_table(rules):
+    return tuple(
+        decide([f for f, bit in FAMILY_BITS.items() if mask & bit], rules)
+        for mask in range(1 << len(FAMILY_BITS))
+    )
+
+
+_TABLE = (None, ())
+
+
+def verdict_table(rules):
+    """The table for this rule snapshot, rebuilt the first time a new
+    rules version is seen."""
+    global _TABLE
+    version, table = _TABLE
+    if version != rules.version:
+        table = compile_table(rules)
+        _TABLE = (rules.version, table)  # one reference swap - safe for readers
+    return table
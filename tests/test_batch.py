@@ -0,0 +1,21 @@
+import os
+
+from compliance.batch import CatalogRun
+
+
+def test_catalog_run_skips_empty_descriptions():
+    run = CatalogRun(page_size=2)
+    run.screen([(1, "kids toy charger"), (2, ""), (3, "   "), (4, "cotton t-shirt")])
+    run.screen([(5, "waterproof power bank")])
+    run.finish()
+
+    assert (run.rows, run.skipped) == (3, 2)
+    assert [row["id"] for page in (1, 2) for row in run.page(page)] == ["1", "4", "5"]
+    summary = run.summary()
+    assert all(list(counts) == list(CatalogRun.STATUSES) for counts in summary.values())
+    assert sum(n for counts in summary.values() for n in counts.values()) == 3
+    assert run.read().count(b"\n") == 4  # header + 3 verdicts
+
+    path = run.path
+    run.discard()
+    assert not os.path.exists(path)
@@ -0,0 +1,24 @@
+from compliance import engine
+from compliance.store import ResultStore
+
+
+def test_explained_results_go_through_the_shared_store(tmp_path, monkeypatch):
+    text = "IPX7 Waterproof Chargers for kids"
+    store = ResultStore(str(tmp_path / "results.db"))
+    monkeypatch.setattr(engine, "STORE", store)
+    engine.EXPLAIN_CACHE.clear()
+    expected = engine.explain_product(text)
+
+    assert engine.explain_product_cached(text) == expected
+    store.flush()
+    assert store.misses == 1
+
+    # Another process (or a restart): empty in-process cache, same file.
+    engine.EXPLAIN_CACHE.clear()
+    monkeypatch.setattr(engine, "STORE", ResultStore(store.path))
+    monkeypatch.setattr(engine, "explain_product", None)  # must not rescan
+    result, spans = engine.explain_product_cached(text)
+    assert (result, spans) == expected
+    assert [text[start:end] for start, end, _, _ in spans] == ["IPX7", "Waterproof", "Chargers", "kids"]
+    assert engine.STORE.hits == 1
+    engine.EXPLAIN_CACHE.clear()
@@ -0,0 +1,89 @@
+import io
+import json
+import re
+
+import pytest
+
+from compliance import engine, incremental
+from compliance.batch import evaluate_chunk, screen_catalog, verdict_record
+from compliance.bench import generate_listings
+from compliance.keywords import SAFETY_FAMILIES
+from compliance.matcher import KeywordMatcher
+from compliance.rules import DEFAULT_RULES_PATH, RuleRegistry
+
+
+def _catalog(n=1500, seed=2):
+    return [(f"P{i}", text) for i, text in enumerate(generate_listings(n, seed=seed))]
+
+
+def _verdicts(pairs):
+    # Records exactly as written to the output, term order included.
+    return [(json.dumps(verdict_record(listing_id, result)), result.to_dict()) for listing_id, result in pairs]
+
+
+def _full(listings):
+    return _verdicts(screen_catalog(listings, 1, 200, evaluate_chunk))
+
+
+def _incremental(listings, state_path):
+    """(verdicts, listings re-evaluated) for one --state run."""
+    report = io.StringIO()
+    verdicts = _verdicts(incremental.screen_incremental(listings, state_path, 1, 200, report))
+    evaluated = re.search(r"(?:re-)?evaluated (\d+)", report.getvalue())
+    return verdicts, int(evaluated.group(1))
+
+
+@pytest.fixture
+def library(monkeypatch):
+    """Swap in an edited keyword library for the matcher and the state."""
+
+    def change(edit):
+        families = {family: list(words) for family, words in SAFETY_FAMILIES.items()}
+        edit(families)
+        monkeypatch.setattr(incremental, "SAFETY_FAMILIES", families)
+        monkeypatch.setattr(engine, "SAFETY_MATCHER", KeywordMatcher(families))
+
+    return change
+
+
+def test_reruns_match_a_full_run_after_keyword_and_catalog_changes(tmp_path, library):
+    state = str(tmp_path / "catalog.state")
+    listings = _catalog()
+    assert _incremental(listings, state) == (_full(listings), len(listings))
+
+    # Nothing changed: every verdict is carried over.
+    assert _incremental(listings, state) == (_full(listings), 0)
+
+    # Add a one-word and a two-word keyword, and put one of them in the text.
+    listings[10] = ("P10", listings[10][1] + " shatterproof")
+    library(lambda f: f["EXTREME_CLAIMS"].extend(["shatterproof", "long lasting"]))
+    verdicts, evaluated = _incremental(listings, state)
+    assert verdicts == _full(listings)
+    assert 0 < evaluated < len(listings)
+
+    # Remove a keyword, edit, drop and add listings.
+    library(lambda f: f["MATERIAL_RISK"].remove("lead"))
+    listings = [(i, text + " fire proof kettle") for i, text in listings[:100]] + listings[150:]
+    listings += [(f"N{i}", "new baby toy with lead paint") for i in range(10)]
+    verdicts, evaluated = _incremental(listings, state)
+    assert verdicts == _full(listings)
+    assert 110 <= evaluated < len(listings)
+
+
+def test_rule_edits_alone_need_no_rescan(tmp_path, monkeypatch):
+    state = str(tmp_path / "catalog.state")
+    listings = _catalog(500)
+    _incremental(listings, state)
+
+    with open(DEFAULT_RULES_PATH, newline="", encoding="utf-8") as f:
+        rules = f.read().replace("toy,IS 9873,", "toy,IS 9873 (Part 1),", 1)
+    path = tmp_path / "bis_rules.csv"
+    path.write_text(rules, encoding="utf-8", newline="")
+    registry = RuleRegistry(str(path), check_interval=0)
+    monkeypatch.setattr(engine, "REGISTRY", registry)
+    monkeypatch.setattr(incremental, "REGISTRY", registry)
+
+    verdicts, evaluated = _incremental(listings, state)
+    assert evaluated == 0
+    assert verdicts == _full(listings)
+    assert any("IS 9873 (Part 1)" in record for record, _ in verdicts)
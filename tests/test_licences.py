@@ -0,0 +1,56 @@
+import os
+
+from compliance import engine, licences, paths
+from compliance.licences import LicenceIndex, build_index
+
+
+def _index(tmp_path, rows=None):
+    source = paths.LICENCE_SAMPLE
+    if rows is not None:
+        source = tmp_path / "dump.csv"
+        source.write_text("brand,model,cml,standard\n" + "".join(f"{r}\n" for r in rows), encoding="utf-8")
+    db = str(tmp_path / "licences.db")
+    build_index(str(source), db)
+    return LicenceIndex(db)
+
+
+def test_sample_dump_indexes_and_completes_models(tmp_path):
+    index = _index(tmp_path)
+    assert len(index) == 10
+    assert [l.cml for l in index.find("SAMSUNG", "ep ta800")] == ["DEMO-CML-0001"]
+    assert all(l.demo for l in index.find("SAMSUNG", "ep ta800"))
+    assert index.complete("samsung", "ep-") == ["EP-TA200", "EP-TA800"]
+    assert index.complete("Havells", "") == ["Andria 75W", "Stealth Air"]
+
+
+def test_fresh_install_has_no_licence_index(tmp_path, monkeypatch):
+    db = str(tmp_path / "licences.db")
+    monkeypatch.setattr(licences, "DEFAULT_LICENCE_DB", db)
+    assert licences.open_default_index() is None
+    assert not os.path.exists(db)
+
+    monkeypatch.setattr(engine, "LICENCES", None)
+    assert engine.complete_model("Samsung", "ep") == []
+    result = engine.check_brand("Samsung", "EP-TA200")
+    assert result.licences == ()
+    assert result.compliance_verdict == "⚠️ BRAND VERIFIED – MODEL NOT VERIFIED"
+
+
+def test_demo_rows_are_never_a_verified_model(tmp_path, monkeypatch):
+    monkeypatch.setattr(engine, "LICENCES", _index(tmp_path))
+    assert engine.complete_model("Samsung", "ep") == ["EP-TA200", "EP-TA800"]
+
+    for model in ("EP-TA200", "S24"):
+        result = engine.check_brand("Samsung", model)
+        assert result.licences == ()
+        assert result.compliance_verdict == "⚠️ BRAND VERIFIED – MODEL NOT VERIFIED"
+        assert "DEMO-CML" not in result.final_guidance
+        assert "demo sample" in result.model_note
+
+
+def test_imported_licence_verifies_the_model(tmp_path, monkeypatch):
+    monkeypatch.setattr(engine, "LICENCES", _index(tmp_path, ["Philips,GC-1905,CML-7600012345,IS 302"]))
+    result = engine.check_brand("Philips", "gc 1905")
+    assert [l.cml for l in result.licences] == ["CML-7600012345"]
+    assert result.compliance_verdict == "✅ MODEL LICENCE FOUND"
+    assert result.style == "ok"
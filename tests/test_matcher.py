@@ -0,0 +1,98 @@
+import random
+
+from compliance.bench import generate_listings
+from compliance.keywords import SAFETY_FAMILIES
+from compliance.matcher import SAFETY_MATCHER, char_spans, plural_forms, tokenize
+
+KEYWORDS = [(family, word) for family, words in SAFETY_FAMILIES.items() for word in words]
+
+
+def _same_word(keyword_token, token):
+    # A keyword word may run straight into a number ("IPX7").
+    return token == keyword_token or (token[-1:].isdigit() and token.rstrip(b"0123456789") == keyword_token)
+
+
+def reference_find(text):
+    """Every (start, end, keyword, family) by trying each keyword at each position."""
+    tokens = tokenize(text)
+    found = set()
+    for family, keyword in KEYWORDS:
+        words = tokenize(keyword)
+        if not words:
+            continue
+        for start in range(len(tokens) - len(words) + 1):
+            window = tokens[start:start + len(words)]
+            if all(_same_word(w, t) for w, t in zip(words[:-1], window)) and any(
+                _same_word(form, window[-1]) for form in plural_forms(words[-1])
+            ):
+                found.add((start, start + len(words), keyword, family))
+    return found
+
+
+def _noisy(text, rng):
+    # Case, punctuation, plurals and model numbers the matcher must see through.
+    words = []
+    for word in text.split():
+        roll = rng.random()
+        if roll < 0.1:
+            word = word.upper()
+        elif roll < 0.2:
+            word += rng.choice(["s", "es", "7", "-pro", ","])
+        elif roll < 0.25:
+            word = word.replace(" ", "-")
+        words.append(word)
+    return " ".join(words)
+
+
+def test_whole_words_only():
+    assert SAFETY_MATCHER.scan("premium pack of 2") == {"MARKETING_TERMS": ["premium"]}
+    assert "ELECTRICAL" not in SAFETY_MATCHER.scan("four aces edition playing cards")
+    assert "ELECTRICAL" not in SAFETY_MATCHER.scan("backpack")
+
+
+def test_plurals_and_model_numbers():
+    assert SAFETY_MATCHER.scan("2 chargers")["ELECTRICAL"] == ["charger"]
+    assert SAFETY_MATCHER.scan("split ACs")["ELECTRICAL"] == ["ac"]
+    assert SAFETY_MATCHER.scan("IPX7 rated")["WATER"] == ["ipx"]
+    assert plural_forms(b"ac") == [b"ac", b"acs"]
+    assert plural_forms(b"battery") == [b"battery", b"batteries"]
+
+
+def test_slashed_keywords_keep_their_slash():
+    # "cm/l" is a licence number prefix, not any "cm" followed by "l".
+    assert SAFETY_MATCHER.scan("5 cm L shaped") == {}
+    assert "BIS_TERMS" not in SAFETY_MATCHER.scan("sofa 30 cm L x 20 cm W")
+    assert SAFETY_MATCHER.scan("CM/L-4100012345")["BIS_TERMS"] == ["cm/l"]
+    assert SAFETY_MATCHER.scan("cm/l1234")["BIS_TERMS"] == ["cm/l"]
+    text = "Licence cm / l, CM/L-41"
+    assert [(text[start:end], keyword) for start, end, keyword, _ in char_spans(text, SAFETY_MATCHER.find(text))] == [
+        ("Licence", "licence"),
+        ("CM/L", "cm/l"),
+    ]
+
+
+def test_matches_brute_force_reference():
+    rng = random.Random(7)
+    for text in generate_listings(300, seed=3):
+        text = _noisy(text, rng)
+        expected = reference_find(text)
+        assert set(SAFETY_MATCHER.find(text)) == expected
+        families = {}
+        for _, _, keyword, family in expected:
+            families.setdefault(family, set()).add(keyword)
+        assert {f: set(w) for f, w in SAFETY_MATCHER.scan(text).items()} == families
+
+
+def test_scan_spans_point_at_the_matched_words():
+    text = "Ünïcode — IPX7 Waterproof   Chargers, shock-proof!  soft toy"
+    spans = []
+    SAFETY_MATCHER.scan(text, spans)
+    assert spans == SAFETY_MATCHER.find(text)
+    assert [(text[start:end], keyword) for start, end, keyword, _ in char_spans(text, spans)] == [
+        ("IPX7", "ipx"),
+        ("Waterproof", "waterproof"),
+        ("Chargers", "charger"),
+        ("shock-proof", "shock proof"),
+        ("soft toy", "soft toy"),
+        ("toy", "toy"),
+    ]
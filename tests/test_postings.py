@@ -0,0 +1,86 @@
+import random
+
+import numpy as np
+import pytest
+
+from compliance.bench import generate_listings
+from compliance.engine import evaluate_product
+from compliance.postings import IndexBuilder, ListingIndex, merge, result_terms
+
+
+def _screened(n=3000, seed=9):
+    return [result_terms(evaluate_product(text)) for text in generate_listings(n, seed=seed)]
+
+
+def _build(listings, start=0):
+    builder = IndexBuilder()
+    for i, terms in enumerate(listings):
+        builder.add(start + i, terms)
+    return builder.build()
+
+
+def _expression(terms, rng, depth=3):
+    """(query text, predicate over a listing's terms)."""
+    roll = rng.random()
+    if depth == 0 or roll < 0.3:
+        term = rng.choice(terms)
+        prefix, value = term.split(":", 1)
+        return f'{prefix}:"{value}"', lambda listing: term in listing
+    if roll < 0.45:
+        text, test = _expression(terms, rng, depth - 1)
+        return f"NOT {text}", lambda listing: not test(listing)
+    (a, test_a), (b, test_b) = _expression(terms, rng, depth - 1), _expression(terms, rng, depth - 1)
+    if roll < 0.75:
+        op = rng.choice(["AND ", ""])  # terms next to each other mean AND
+        return f"({a} {op}{b})", lambda listing: test_a(listing) and test_b(listing)
+    return f"({a} OR {b})", lambda listing: test_a(listing) or test_b(listing)
+
+
+def test_queries_match_brute_force_evaluation():
+    listings = _screened()
+    index = _build(listings)
+    terms = sorted(index.terms)
+    rng = random.Random(4)
+    for _ in range(300):
+        text, test = _expression(terms, rng)
+        expected = [i for i, listing in enumerate(listings) if test(listing)]
+        assert index.query(text).tolist() == expected, text
+
+
+def test_every_posting_list_round_trips(tmp_path):
+    listings = _screened(1000)
+    path = str(tmp_path / "verdicts.idx")
+    _build(listings).save(path)
+    index = ListingIndex.load(path)  # written to the exact path, no ".npz" added
+    for term in index.terms:
+        assert index.postings(term).tolist() == [i for i, listing in enumerate(listings) if term in listing]
+
+
+def test_merge_equals_one_build():
+    listings = _screened(1000)
+    whole = _build(listings)
+    # Two parts; the first listing of the second part is dropped.
+    first, second = _build(listings[:600]), _build(listings[600:], 600)
+    kept = listings[:600] + listings[601:]
+    merged = merge(
+        [(first, np.arange(600)), (second, np.array([-1, *range(600, 999)]))],
+        [str(i) for i in range(999)],
+    )
+    assert set(merged.terms) <= set(whole.terms)
+    for term in merged.terms:
+        assert merged.postings(term).tolist() == [i for i, listing in enumerate(kept) if term in listing]
+
+
+def test_bare_words_resolve_keywords_before_families():
+    index = _build([{"kw:child", "kw:charger", "family:CHILD", "std:IS 9873"}])
+    assert index.resolve("child") == "kw:child"
+    assert index.resolve("CHILD") == "family:CHILD"
+    assert index.resolve("chargers") == "kw:charger"
+    assert index.resolve("water") == "family:WATER"
+    assert index.resolve("family:child") == "family:CHILD"
+
+
+@pytest.mark.parametrize("query", ["AND", "charger OR", "NOT", "(charger", "charger )"])
+def test_malformed_queries_are_errors(query):
+    with pytest.raises(ValueError):
+        _build([{"kw:charger"}]).query(query)
@@ -0,0 +1,66 @@
+import asyncio
+import json
+
+from compliance.server import ENDPOINTS, Endpoint, EvaluationServer
+
+
+async def _exchange(raw_requests):
+    """(status, JSON body) per response from one connection; None once it closes."""
+    listener = await EvaluationServer().start("127.0.0.1", 0)
+    port = listener.sockets[0].getsockname()[1]
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    responses = []
+    try:
+        for raw in raw_requests:
+            writer.write(raw)
+            await writer.drain()
+            status_line = await reader.readline()
+            if not status_line:
+                responses.append(None)
+                break
+            headers = {}
+            while (line := await reader.readline()) not in (b"\r\n", b""):
+                name, _, value = line.decode().partition(":")
+                headers[name.lower()] = value.strip()
+            body = await reader.readexactly(int(headers["content-length"]))
+            responses.append((int(status_line.split()[1]), json.loads(body)))
+    finally:
+        writer.close()
+        listener.close()
+    return responses
+
+
+def _post(path, payload):
+    body = json.dumps(payload).encode()
+    return f"POST {path} HTTP/1.1\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body
+
+
+def test_brand_fields_must_be_strings_and_known_product_types():
+    (ok, bad_model, bad_type) = asyncio.run(_exchange([
+        _post("/v1/brand", {"brand": "Philips", "model": "<b>GC1905</b>", "product_type": "Kitchen appliance"}),
+        _post("/v1/brand", {"brand": "Philips", "model": {"a": 1}}),
+        _post("/v1/brand", {"brand": "Philips", "product_type": "Rocket"}),
+    ]))
+    assert ok[0] == 200
+    assert "&lt;b&gt;GC1905&lt;/b&gt;" in ok[1]["model_note"]
+    assert bad_model == (400, {"error": '"model" must be a string'})
+    assert bad_type[0] == 400 and "product_type" in bad_type[1]["error"]
+
+
+def test_evaluator_errors_are_500_and_keep_the_connection(monkeypatch):
+    def explode(key):
+        raise RuntimeError("boom")
+
+    monkeypatch.setitem(ENDPOINTS, "/v1/question", Endpoint(parse=lambda body: body["question"], evaluate=explode))
+    failed, healthy = asyncio.run(_exchange([
+        _post("/v1/question", {"question": "is this safe?"}),
+        b"GET /healthz HTTP/1.1\r\n\r\n",
+    ]))
+    assert failed == (500, {"error": "evaluation failed"})
+    assert healthy == (200, {"status": "ok"})
+
+
+def test_unreadable_content_length_is_400():
+    for length in (b"abc", b"-5"):
+        (response,) = asyncio.run(_exchange([b"POST /v1/safety HTTP/1.1\r\nContent-Length: " + length + b"\r\n\r\n"]))
+        assert response == (400, {"error": "invalid Content-Length"})
@@ -0,0 +1,71 @@
+import itertools
+import os
+import subprocess
+import sys
+import time
+
+from compliance import store as store_module
+from compliance.store import ResultStore
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _rows(path):
+    # What another process would see on disk.
+    return {key.decode(): kind for key, kind in ResultStore(path)._connect().execute("SELECT key, kind FROM results")}
+
+
+def test_buffered_entries_are_readable_before_the_flush(tmp_path):
+    path = str(tmp_path / "results.db")
+    store = ResultStore(path, batch_size=100, flush_interval=60)
+    store.put(b"k", "safety", {"verdict": "ok"})
+    assert store.get(b"k") == {"verdict": "ok"}
+    assert _rows(path) == {}
+
+    store.flush()
+    assert _rows(path) == {"k": "safety"}
+    assert store.get(b"k") == {"verdict": "ok"}
+    assert store.get(b"missing") is None
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path, monkeypatch):
+    clock = itertools.count(1)
+    monkeypatch.setattr(store_module.time, "time", lambda: next(clock))
+    path = str(tmp_path / "results.db")
+    store = ResultStore(path, max_entries=3, batch_size=1, flush_interval=60)
+    for key in (b"k0", b"k1", b"k2"):
+        store.put(key, "safety", key.decode())
+    store.get(b"k0")  # now more recent than k1 and k2
+    store.put(b"k3", "safety", "k3")
+    store.put(b"k4", "safety", "k4")
+    assert sorted(_rows(path)) == ["k0", "k3", "k4"]
+
+
+def test_a_quiet_store_is_flushed_by_the_timer(tmp_path):
+    path = str(tmp_path / "results.db")
+    store = ResultStore(path, batch_size=100, flush_interval=0.2)
+    store.put(b"k", "brand", 1)
+    deadline = time.monotonic() + 5
+    while not _rows(path) and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert _rows(path) == {"k": "brand"}
+
+
+def _in_another_process(code, path):
+    subprocess.run(
+        [sys.executable, "-c", f"from compliance.store import ResultStore\nstore = ResultStore({path!r})\n{code}"],
+        cwd=ROOT,
+        check=True,
+        timeout=60,
+    )
+
+
+def test_processes_share_entries_through_the_file(tmp_path):
+    path = str(tmp_path / "results.db")
+    # Written but never flushed explicitly: the exit handler commits it.
+    _in_another_process('store.put(b"theirs", "safety", {"from": "child"})', path)
+    store = ResultStore(path, batch_size=1)
+    assert store.get(b"theirs") == {"from": "child"}
+
+    store.put(b"ours", "safety", {"from": "parent"})
+    _in_another_process('assert store.get(b"ours") == {"from": "parent"}', path)
@@ -0,0 +1,33 @@
+import random
+
+import pandas as pd
+
+from compliance.bench import generate_listings
+from compliance.engine import evaluate_product
+from compliance.keywords import SAFETY_FAMILIES
+from compliance.vectorized import evaluate_series
+from test_matcher import _noisy
+
+
+def _listings():
+    rng = random.Random(11)
+    texts = [_noisy(text, rng) for text in generate_listings(500, seed=5)]
+    return texts + ["", "four aces edition", "Ünïcode IPX7 Chargers", "split ACs, 2 batteries", "sofa 30 cm L x 20 cm W", "CM/L-4100012345", None]
+
+
+def test_matches_evaluate_product_row_for_row():
+    texts = _listings()
+    result = evaluate_series(pd.Series(texts))
+    for text, (_, row) in zip(texts, result.iterrows()):
+        expected = evaluate_product(text or "")
+        assert {family for family in SAFETY_FAMILIES if row[family]} == set(expected.matched)
+        assert (row["category"], row["safety_status"], row["confidence"]) == (
+            expected.category,
+            expected.safety_status,
+            expected.confidence,
+        )
+
+
+def test_keeps_the_series_index():
+    series = pd.Series(["waterproof charger", "cotton t-shirt"], index=[10, 20])
+    assert list(evaluate_series(series).index) == [10, 20]
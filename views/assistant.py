@@ -0,0 +1,85 @@
+import streamlit as st
+
+from compliance.engine import classify_question
+from compliance.metrics import METRICS
+
+# ==================================================
+# ASK ASSISTANT
+# ==================================================
+st.header("🤖 BIS Consumer Safety AI Assistant")
+
+st.caption(
+    "Ask in your own words. This assistant understands normal human questions "
+    "and answers using BIS safety rules and consumer law awareness."
+)
+
+
+# Widgets below rerun only this fragment, not the CSS, hero and navigation.
+@st.fragment
+def ask_assistant():
+    lap = METRICS.laps("assistant_page")
+
+    # -------------------------------
+    # INPUT
+    # -------------------------------
+    question = st.text_input(
+        "Ask anything (example: Is this charger safe? | Can I trust this brand? | BIS mark missing)"
+    )
+
+    if st.button("Ask AI"):
+        if not question or len(question.strip()) < 4:
+            st.info(
+                "Please ask a clear question.\n\n"
+                "Example:\n"
+                "• Is this Samsung charger BIS certified?\n"
+                "• What happens if BIS mark is missing?"
+            )
+            return
+
+        # -------------------------------
+        # INTENT & SIGNAL EXTRACTION
+        # -------------------------------
+        lap("input")
+        result = classify_question(question)
+        lap("evaluate")
+
+        # -------------------------------
+        # THINKING ANIMATION (PRO FEEL)
+        # -------------------------------
+        with st.spinner("🧠 Analyzing BIS rules and safety logic..."):
+            pass
+
+        # -------------------------------
+        # DISPLAY ANSWER (ANIMATED CARD)
+        # -------------------------------
+        st.markdown(
+            f"""
+            <div class="{result.style}">
+            <h3>AI Safety Guidance</h3>
+            {result.answer}
+            </div>
+            """,
+            unsafe_allow_html=True
+        )
+
+        # -------------------------------
+        # RELATED ANSWERS (KNOWLEDGE BASE)
+        # -------------------------------
+        if result.related:
+            with st.expander("📚 Related answers"):
+                for hit in result.related:
+                    st.markdown(f"**{hit.document.title}** · relevance {hit.score:.1f}")
+                    st.markdown(hit.document.body)
+
+        # -------------------------------
+        # SMART FOLLOW-UP PROMPTS
+        # -------------------------------
+        with st.expander("💡 You can also ask"):
+            st.write("• Is this product safe for children?")
+            st.write("• How do I identify a fake BIS mark?")
+            st.write("• What happens if BIS mark is missing?")
+            st.write("• Can I report unsafe products?")
+        lap("render")
+
+
+ask_assistant()
@@ -0,0 +1,89 @@
+import streamlit as st
+
+from compliance.data import PRODUCT_TYPES
+from compliance.engine import check_brand_cached, complete_brand, complete_model
+from compliance.metrics import METRICS
+
+# ==================================================
+# BRAND & MODEL COMPLIANCE CHECK
+# ==================================================
+st.header("🏷️ Brand & Model Compliance Check")
+
+
+# ================= AUTOCOMPLETE (ONE CLICK FILLS THE BOX) =================
+def _fill(field, value):
+    st.session_state[field] = value
+
+
+def completion_buttons(field, options):
+    options = [o for o in options if o != st.session_state.get(field, "")]
+    if options:
+        cols = st.columns(len(options))
+        for col, option in zip(cols, options):
+            col.button(option, key=f"{field}_{option}", on_click=_fill, args=(field, option))
+
+
+# Widgets below rerun only this fragment, not the CSS, hero and navigation.
+@st.fragment
+def brand_check():
+    lap = METRICS.laps("brand_page")
+
+    brand = st.text_input("Enter Brand Name (example: Samsung, Havells, Philips)", key="brand_input")
+    if brand.strip():
+        completion_buttons("brand_input", complete_brand(brand, limit=6))
+
+    model = st.text_input("Enter Model Number (optional)", key="model_input")
+    if brand.strip() and model.strip():
+        completion_buttons("model_input", complete_model(brand, model, limit=6))
+
+    product_type = st.selectbox(
+        "Select Product Type (optional)",
+        PRODUCT_TYPES
+    )
+
+    if st.button("Check Compliance"):
+        if not brand.strip():
+            st.warning("Please enter a brand name.")
+        else:
+            lap("input")
+            result = check_brand_cached(brand, model, product_type)
+            lap("evaluate")
+
+            if result.suggestions:
+                st.info("Did you mean: " + ", ".join(f"**{s}**" for s in result.suggestions) + "?")
+
+            # ================= DISPLAY RESULT (FIXED HTML RENDERING) =================
+            st.markdown(
+                f"""
+                <div class="{result.style}">
+                <h3>Compliance Assessment</h3>
+
+                <b>Compliance Verdict:</b> {result.compliance_verdict}<br><br>
+
+                <b>Brand Recognition:</b> {result.brand_status}<br><br>
+
+                <b>Brand Insight:</b><br>
+                {result.brand_note}<br><br>
+
+                <b>Detected Product Type:</b> {result.product_type}<br>
+                <b>Applicable BIS Safety Rule:</b> {result.bis_rule}<br>
+                <b>Consumer Risk:</b> {result.risk_note}<br><br>
+
+                <b>Model-Level Assessment:</b><br>
+                {result.model_note}<br><br>
+
+                <b>Final Consumer Guidance:</b><br>
+                {result.final_guidance}
+                </div>
+                """,
+                unsafe_allow_html=True  # ✅ THIS FIXES THE ISSUE
+            )
+
+            st.info(
+                "This assessment provides consumer awareness guidance only. "
+                "Final confirmation must be done using the official BIS license database."
+            )
+            lap("render")
+
+
+brand_check()
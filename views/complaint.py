@@ -0,0 +1,69 @@
+import streamlit as st
+
+# ==================================================
+# COMPLAINT CENTRE
+# ==================================================
+st.header("📢 BIS Consumer Complaint Centre")
+
+st.markdown(
+    """
+    <div class="card">
+
+    <h3>📌 When should you file a complaint?</h3>
+    <ul>
+        <li>Product shows a <b>fake, unclear, or missing BIS mark</b></li>
+        <li>Electrical product <b>overheats, sparks, shocks, or smells</b></li>
+        <li>Product makes <b>misleading claims</b> like “100% safe” or “explosion proof”</li>
+        <li>No <b>manufacturer name, address, or BIS license number</b></li>
+        <li>Product quality appears unsafe, cheap, or suspicious</li>
+    </ul>
+
+    <h3>⚖️ Why is filing a complaint important?</h3>
+    <p>
+    Filing a complaint helps the <b>Bureau of Indian Standards (BIS)</b> to:
+    </p>
+    <ul>
+        <li>Identify unsafe or illegal products</li>
+        <li>Take enforcement and legal action</li>
+        <li>Protect other consumers across India</li>
+        <li>Improve national product safety standards</li>
+    </ul>
+
+    <h3>🔗 Official BIS Consumer Complaint Portal</h3>
+    <p>
+    Click the button below to submit your complaint directly on the
+    <b>official BIS website</b>.
+    </p>
+
+    <div style="margin-top:18px;">
+        <a href="https://www.bis.gov.in/consumer-overview/consumer-overviews/online-complaint-registration/?lang=en"
+           target="_blank"
+           style="text-decoration:none;">
+            <button style="
+                background: linear-gradient(135deg, #1e40af, #2563eb);
+                color: white;
+                padding: 14px 26px;
+                border: none;
+                border-radius: 14px;
+                font-size: 16px;
+                font-weight: 600;
+                cursor: pointer;
+            ">
+                🚨 Go to Official BIS Complaint Portal
+            </button>
+        </a>
+    </div>
+
+    <p style="margin-top:16px; opacity:0.85;">
+    This portal is managed by the <b>Bureau of Indian Standards (Government of India)</b>.
+    </p>
+
+    </div>
+    """,
+    unsafe_allow_html=True
+)
+
+st.info(
+    "ℹ️ This platform does NOT collect complaints or personal data. "
+    "All complaints must be submitted only through the official BIS portal."
+)
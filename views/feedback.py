@@ -0,0 +1,89 @@
+import streamlit as st
+
+# ==================================================
+# FEEDBACK
+# ==================================================
+st.header("📝 Consumer Experience & Feedback")
+
+st.markdown(
+    """
+    <div class="card">
+    <h3>Your voice helps improve consumer safety 🇮🇳</h3>
+    <p>
+    This platform is built to spread <b>BIS safety awareness</b>.
+    Your feedback helps us understand:
+    </p>
+    <ul>
+        <li>✔ Was the information easy to understand?</li>
+        <li>✔ Did it help you make a safer decision?</li>
+        <li>✔ What can be improved for real consumers?</li>
+    </ul>
+    </div>
+    """,
+    unsafe_allow_html=True
+)
+
+
+# Widgets below rerun only this fragment, not the CSS, hero and navigation.
+@st.fragment
+def feedback_form():
+    col1, col2 = st.columns(2)
+
+    with col1:
+        name = st.text_input("Your Name (optional)")
+        user_type = st.selectbox(
+            "You are a:",
+            ["Consumer", "Student", "Teacher", "Engineer", "Retailer", "Other"]
+        )
+
+    with col2:
+        usefulness = st.radio(
+            "How useful was this platform?",
+            ["Very Useful ⭐⭐⭐⭐⭐", "Useful ⭐⭐⭐⭐", "Average ⭐⭐⭐", "Needs Improvement ⭐⭐"]
+        )
+        clarity = st.radio(
+            "Was the information easy to understand?",
+            ["Yes, very clear", "Mostly clear", "Somewhat confusing"]
+        )
+
+    feedback = st.text_area(
+        "Share your suggestion or experience (optional)",
+        placeholder="Example: The product safety explanation helped me understand BIS rules clearly..."
+    )
+
+    improve_area = st.multiselect(
+        "Which areas should be improved?",
+        [
+            "Product Safety Check",
+            "Brand & Model Verification",
+            "AI Assistant Answers",
+            "Complaint Guidance",
+            "Design & Animations",
+            "Language Simplicity"
+        ]
+    )
+
+    if st.button("Submit Feedback"):
+        st.success("🙏 Thank you for helping improve consumer safety awareness!")
+
+        st.markdown(
+            """
+            <div class="card">
+            <h4>What happens to your feedback?</h4>
+            <ul>
+                <li>✔ Used only for improving this project</li>
+                <li>✔ No personal data is stored or shared</li>
+                <li>✔ Helps make safety information simpler for everyone</li>
+            </ul>
+            </div>
+            """,
+            unsafe_allow_html=True
+        )
+
+        st.caption(
+            "This is an educational project focused on consumer awareness. "
+            "Feedback is used only for academic improvement."
+        )
+
+
+feedback_form()
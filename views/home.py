@@ -0,0 +1,14 @@
+import streamlit as st
+
+# ==================================================
+# HOME
+# ==================================================
+st.markdown("""
+<div class="card">
+✔ Understand product safety claims<br>
+✔ Avoid fake BIS certification<br>
+✔ Check popular Indian brands<br>
+✔ Get AI guidance<br>
+✔ Reach official complaint channels
+</div>
+""", unsafe_allow_html=True)
@@ -0,0 +1,26 @@
+import streamlit as st
+
+from compliance.metrics import METRICS
+
+# ==================================================
+# METRICS (HIDDEN ADMIN PAGE)
+# ==================================================
+st.header("📈 Runtime Metrics")
+st.caption("Stage timings and cache counters for this app process.")
+
+METRICS.enabled = st.toggle("Record stage timings", value=METRICS.enabled)
+if st.button("Reset timings"):
+    METRICS.reset()
+
+snapshot = METRICS.snapshot()
+for pipeline, stages in snapshot["stages"].items():
+    st.subheader(pipeline)
+    st.dataframe(
+        [{"stage": stage, **m} for stage, m in stages.items()],
+        hide_index=True
+    )
+st.json(snapshot["counters"])
+
+d1, d2 = st.columns(2)
+d1.download_button("⬇️ JSON", METRICS.to_json(), "metrics.json", "application/json")
+d2.download_button("⬇️ Prometheus", METRICS.to_prometheus(), "metrics.prom", "text/plain")